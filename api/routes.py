@@ -18,12 +18,15 @@ from schematic.manifest.generator import ManifestGenerator
 from schematic.models.metadata import MetadataModel
 from schematic.schemas.generator import SchemaGenerator
 from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.snapshot import load_schema_snapshot
+from schematic.schemas.diff import diff_schemas
 from schematic.store.synapse import SynapseStorage
 from flask_cors import CORS, cross_origin
 from schematic.schemas.explorer import SchemaExplorer
 import pandas as pd
 import json
 from schematic.utils.df_utils import load_df
+from schematic.utils.cache_utils import fetch_url, get_http_timeout
 import pickle
 from flask import send_from_directory
 
@@ -188,8 +191,13 @@ def initalize_metadata_model(schema_url):
     return metadata_model
 
 def get_temp_jsonld(schema_url):
-    # retrieve a JSON-LD via URL and store it in a temporary location
-    with urllib.request.urlopen(schema_url) as response:
+    # retrieve a JSON-LD via URL from the HTTP cache, which only downloads it again if it changed
+    cached_path = fetch_url(schema_url)
+    if cached_path is not None:
+        return cached_path
+
+    # caching is disabled: store it in a temporary location
+    with urllib.request.urlopen(schema_url, timeout=get_http_timeout()) as response:
         with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonld") as tmp_file:
             shutil.copyfileobj(response, tmp_file)
 
@@ -321,7 +329,7 @@ def get_manifest_route(schema_url: str, use_annotations: bool, dataset_ids=None,
     return all_results
 
 
-def validate_manifest_route(schema_url, data_type, json_str=None):
+def validate_manifest_route(schema_url, data_type, json_str=None, workers=1):
     # call config_handler()
     config_handler()
 
@@ -341,7 +349,7 @@ def validate_manifest_route(schema_url, data_type, json_str=None):
     )
 
     errors, warnings = metadata_model.validateModelManifest(
-        manifestPath=temp_path, rootNode=data_type
+        manifestPath=temp_path, rootNode=data_type, workers=workers
     )
     
     res_dict = {"errors": errors, "warnings": warnings}
@@ -567,10 +575,9 @@ def get_schema_pickle(schema_url):
 
 
 def get_subgraph_by_edge_type(schema_url, relationship):
-    # use schema generator and schema explorer
-    sg = SchemaGenerator(path_to_json_ld=schema_url)
-    se = SchemaExplorer()
-    se.load_schema(schema_url)
+    # use schema generator and schema explorer on the (shared) snapshot of the schema
+    se = load_schema_snapshot(schema_url).explorer()
+    sg = SchemaGenerator(schema_explorer=se)
 
     # get the schema graph 
     schema_graph = se.get_nx_schema()
@@ -587,12 +594,17 @@ def get_subgraph_by_edge_type(schema_url, relationship):
     return Arr
 
 
-def find_class_specific_properties(schema_url, schema_class):
-    # use schema explorer
-    se = SchemaExplorer()
+def get_schema_diff(old_schema_url, new_schema_url):
+    # compare the (shared) snapshots of both versions of the data model
+    old_se = load_schema_snapshot(old_schema_url).explorer()
+    new_se = load_schema_snapshot(new_schema_url).explorer()
 
-    # load schema
-    se.load_schema(schema_url)
+    return diff_schemas(old_se, new_se)
+
+
+def find_class_specific_properties(schema_url, schema_class):
+    # use schema explorer on the (shared) snapshot of the schema
+    se = load_schema_snapshot(schema_url).explorer()
 
     # return properties
     properties = se.find_class_specific_properties(schema_class)
@@ -623,7 +635,7 @@ def get_node_dependencies(
     Returns:
         list[str]: List of nodes that are dependent on the source node.
     """
-    gen = SchemaGenerator(path_to_json_ld=schema_url)
+    gen = load_schema_snapshot(schema_url).generator()
     dependencies = gen.get_node_dependencies(
         source_node, return_display_names, return_schema_ordered
     )
@@ -646,8 +658,7 @@ def get_property_label_from_display_name(
     Returns:
         str: The property label of the display name
     """
-    explorer = SchemaExplorer()
-    explorer.load_schema(schema_url)
+    explorer = load_schema_snapshot(schema_url).explorer()
     label = explorer.get_property_label_from_display_name(display_name, strict_camel_case)
     return label
 
@@ -668,7 +679,7 @@ def get_node_range(
     Returns:
         list[str]: A list of nodes
     """
-    gen = SchemaGenerator(path_to_json_ld=schema_url)
+    gen = load_schema_snapshot(schema_url).generator()
     node_range = gen.get_node_range(node_label, return_display_names)
     return node_range
 
@@ -683,7 +694,7 @@ def get_if_node_required(schema_url: str, node_display_name: str) -> bool:
         True: If the given node is a "required" node.
         False: If the given node is not a "required" (i.e., an "optional") node.
     """
-    gen = SchemaGenerator(path_to_json_ld=schema_url)
+    gen = load_schema_snapshot(schema_url).generator()
     is_required = gen.is_node_required(node_display_name)
 
     return is_required
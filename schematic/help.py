@@ -137,6 +137,10 @@ model_commands = {
             "project_scope": (
                 "Specify a comma-separated list of projects to search through for cross manifest validation."
             ),
+            "workers": (
+                "Number of processes validating the columns of the manifest in parallel. Defaults to 1. "
+                "Small manifests are always validated in a single process."
+            ),
         },
     }
 }
@@ -155,7 +159,15 @@ schema_commands = {
             "output_jsonld": (
                 "Path to where the generated JSON-LD file needs to be outputted."
             ),
-        }
+        },
+        "diff": {
+            "short_help": (
+                "Compare two versions of a JSON-LD data model and output the changes as JSON."
+            ),
+            "output_json": (
+                "Path to where the JSON change set needs to be outputted. It is printed by default."
+            ),
+        },
     }
 }
 
@@ -1,13 +1,16 @@
 
 from statistics import mode
 from tabnanny import check
+import itertools
 import logging
 import os
 import re
+import threading
 import numpy as np
 
+from collections import OrderedDict
 # allows specifying explicit variable types
-from typing import Any, Dict, Optional, Text, List
+from typing import Any, Dict, Hashable, Optional, Text, List, Tuple
 from urllib.parse import urlparse
 from urllib.request import urlopen, OpenerDirector, HTTPDefaultErrorHandler
 from urllib.request import Request
@@ -18,16 +21,203 @@ from ruamel import yaml
 
 import great_expectations as ge
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.data_context import BaseDataContext
-from great_expectations.data_context.types.base import DataContextConfig, DatasourceConfig, FilesystemStoreBackendDefaults
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.data_context import BaseDataContext, EphemeralDataContext
+from great_expectations.data_context.types.base import (
+    DataContextConfig,
+    FilesystemStoreBackendDefaults,
+    InMemoryStoreBackendDefaults,
+)
 from great_expectations.data_context.types.resource_identifiers import ExpectationSuiteIdentifier
 
 from schematic.models.validate_attribute import GenerateError
+from schematic.models.validation_plan import get_attribute_plan
 from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.cli_utils import query_dict
 from schematic.utils.validate_utils import rule_in_rule_list
+from schematic import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# names of the datasource and checkpoint registered once with each validation context
+DATASOURCE_NAME = "example_datasource"
+CHECKPOINT_NAME = "manifest_checkpoint"
+
+# maximum number of expectation suites kept by a validation context, by (data model hash, manifest columns)
+max_cached_suites = 64
+
+# process-wide validation contexts, by data docs root directory (None for the in-memory context)
+_validation_contexts = {}
+_validation_contexts_lock = threading.Lock()
+
+
+def _use_data_docs() -> bool:
+    """Whether validation renders Great Expectations data docs, as set by (validation > data_docs) in the configuration."""
+    try:
+        return bool(query_dict(CONFIG.DATA, ("validation", "data_docs")))
+    except AttributeError:
+        # no configuration loaded
+        return False
+
+
+class ValidationContext(object):
+    """
+        Great Expectations context of manifest validation, with its datasource and checkpoint registered once
+        and the expectation suites of recently validated data models and manifest columns.
+    """
+    def __init__(self, data_docs_dir: Optional[str] = None):
+        """
+            Purpose:
+                Build a dataContext, in memory or, to render data docs, stored under data_docs_dir
+            Args:
+                data_docs_dir:
+                    root directory of the Great Expectations project to render data docs to, if any
+        """
+        #build context and add data source
+        if data_docs_dir is None:
+            self.context = EphemeralDataContext(
+                project_config=DataContextConfig(
+                    store_backend_defaults=InMemoryStoreBackendDefaults(init_temp_docs_sites=False),
+                ),
+            )
+        else:
+            self.context = BaseDataContext(
+                project_config=DataContextConfig(
+                    store_backend_defaults=FilesystemStoreBackendDefaults(root_directory=data_docs_dir),
+                ),
+            )
+        self.context.add_datasource(
+            name=DATASOURCE_NAME,
+            class_name="Datasource",
+            module_name="great_expectations.datasource",
+            execution_engine={
+                "module_name": "great_expectations.execution_engine",
+                "class_name": "PandasExecutionEngine",
+            },
+            data_connectors={
+                "default_runtime_data_connector_name": {
+                    "class_name": "RuntimeDataConnector",
+                    "batch_identifiers": ["default_identifier_name"],
+                },
+            },
+        )
+
+        #create manifest checkpoint, the expectation suite is given when it is run
+        checkpoint_config = {
+            "name": CHECKPOINT_NAME,
+            "config_version": 1,
+            "validations": [
+                {
+                    "batch_request": {
+                        "datasource_name": DATASOURCE_NAME,
+                        "data_connector_name": "default_runtime_data_connector_name",
+                        "data_asset_name": "Manifest",
+                    },
+                }
+            ],
+        }
+        if data_docs_dir is None:
+            #validation results are not stored, a checkpoint needs at least one action
+            checkpoint_config.update(
+                class_name="Checkpoint",
+                run_name_template="manifest_validation",
+                action_list=[
+                    {
+                        "name": "store_evaluation_params",
+                        "action": {"class_name": "StoreEvaluationParametersAction"},
+                    },
+                ],
+            )
+        else:
+            #store validation results and update data docs
+            checkpoint_config.update(class_name="SimpleCheckpoint")
+        self.context.add_checkpoint(**checkpoint_config)
+
+        # GE contexts are not thread safe
+        self.lock = threading.RLock()
+        self._suites = OrderedDict()
+        self._suite_names = itertools.count(1)
+
+    def get_suite(self, suite_key: Optional[Hashable]) -> Optional[ExpectationSuite]:
+        """Cached expectation suite of suite_key, if any (see GreatExpectationsHelpers.get_suite_key)."""
+        if suite_key is None:
+            return None
+
+        with self.lock:
+            suite = self._suites.get(suite_key)
+            if suite is not None:
+                self._suites.move_to_end(suite_key)
+
+        return suite
+
+    def get_suite_name(self) -> str:
+        """Unique name of a new expectation suite."""
+        with self.lock:
+            return "Manifest_test_suite_{}".format(next(self._suite_names))
+
+    def add_suite(self, suite_key: Optional[Hashable], suite: ExpectationSuite):
+        """Save an expectation suite to the context and cache it, dropping the least recently used suites.
+
+        Suites that are not cached (suite_key is None) are deleted once validated, see run_checkpoint.
+        """
+        with self.lock:
+            self.context.save_expectation_suite(expectation_suite=suite)
+            if suite_key is None:
+                return
+
+            # a suite built concurrently for the same key is replaced
+            previous = self._suites.pop(suite_key, None)
+            if previous is not None:
+                self.context.delete_expectation_suite(expectation_suite_name=previous.expectation_suite_name)
+
+            self._suites[suite_key] = suite
+            while len(self._suites) > max_cached_suites:
+                _, evicted = self._suites.popitem(last=False)
+                self.context.delete_expectation_suite(expectation_suite_name=evicted.expectation_suite_name)
+
+    def run_checkpoint(self, suite_key: Optional[Hashable], suite: ExpectationSuite, **kwargs):
+        """Run the checkpoint with an expectation suite added by add_suite.
+
+        Suites dropped from the cache since they were added are saved again for the run, and suites that are
+        not cached are deleted after it.
+        """
+        with self.lock:
+            dropped = suite_key is not None and self._suites.get(suite_key) is not suite
+            if dropped:
+                self.context.save_expectation_suite(expectation_suite=suite)
+
+            try:
+                return self.context.run_checkpoint(
+                    checkpoint_name=CHECKPOINT_NAME,
+                    expectation_suite_name=suite.expectation_suite_name,
+                    **kwargs,
+                )
+            finally:
+                if dropped or suite_key is None:
+                    self.context.delete_expectation_suite(expectation_suite_name=suite.expectation_suite_name)
+
+
+def get_validation_context(data_docs: bool = False) -> ValidationContext:
+    """Process-wide validation context.
+
+    The context is built once, kept in memory, and only stored under cwd/great_expectations when rendering data docs.
+
+    Args:
+        data_docs: whether to render data docs, see (validation > data_docs) in the configuration.
+
+    Returns:
+        Validation context.
+    """
+    data_docs_dir = os.path.join(os.getcwd(), 'great_expectations') if data_docs else None
+
+    with _validation_contexts_lock:
+        validation_context = _validation_contexts.get(data_docs_dir)
+        if validation_context is None:
+            validation_context = _validation_contexts[data_docs_dir] = ValidationContext(data_docs_dir)
+
+    return validation_context
+
+
 class GreatExpectationsHelpers(object):
     """
         Great Expectations helper class
@@ -63,54 +253,14 @@ class GreatExpectationsHelpers(object):
     def  build_context(self):
         """
             Purpose:
-                Create a dataContext and datasource and add to object 
+                Get the process-wide validation context, see get_validation_context
             Returns:
-                saves dataContext and datasource to self
+                saves dataContext to self
         """
-        self.context=ge.get_context()
-
-        #create datasource configuration
-        datasource_config = {
-            "name": "example_datasource",
-            "class_name": "Datasource",
-            "module_name": "great_expectations.datasource",
-            "execution_engine": {
-                "module_name": "great_expectations.execution_engine",
-                "class_name": "PandasExecutionEngine",
-            },
-            "data_connectors": {
-                "default_runtime_data_connector_name": {
-                    "class_name": "RuntimeDataConnector",
-                    "batch_identifiers": ["default_identifier_name"],
-                },
-            },
-        }
-
-        #create data context configuration
-        data_context_config = DataContextConfig(
-            datasources={
-                "pandas": DatasourceConfig(
-                    class_name="Datasource",
-                    execution_engine={
-                        "class_name": "PandasExecutionEngine"
-                    },
-                    data_connectors={
-                        "default_runtime_data_connector_name": {
-                            "class_name": "RuntimeDataConnector",
-                            "batch_identifiers": ["default_identifier_name"],
-                        }
-                    },
-                )
-            },
-            store_backend_defaults=FilesystemStoreBackendDefaults(root_directory=os.path.join(os.getcwd(),'great_expectations')),
-        )
-
-        #build context and add data source
-        self.context=BaseDataContext(project_config=data_context_config)
-        #self.context.test_yaml_config(yaml.dump(datasource_config))
-        self.context.add_datasource(**datasource_config)
+        self.data_docs = _use_data_docs()
+        self.validation_context = get_validation_context(self.data_docs)
+        self.context = self.validation_context.context
 
-        
     def build_expectation_suite(self,):
         """
             Purpose:
@@ -140,27 +290,33 @@ class GreatExpectationsHelpers(object):
             #"matchExactlyOne": "expect_foreign_keys_in_column_a_to_exist_in_column_b",
         }
         
+        #reuse the suite built for the same data model and columns
+        self.suite_key = self.get_suite_key()
+        self.suite = self.validation_context.get_suite(self.suite_key)
+        if self.suite is not None:
+            return
+
         #create blank expectation suite
-        expectation_suite_name = "Manifest_test_suite"       
-        self.suite = self.context.create_expectation_suite(
+        expectation_suite_name = self.validation_context.get_suite_name()
+        self.suite = ExpectationSuite(
             expectation_suite_name=expectation_suite_name,
-            overwrite_existing=True
-        )    
+            data_context=self.context,
+        )
 
         #build expectation configurations for each expecation
         for col in self.manifest.columns:
             args={}
             meta={}
             
-            # remove trailing/leading whitespaces from manifest
-            self.manifest.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-            validation_rules = self.sg.get_node_validation_rules(col)
+            # validation rules of the column, parsed once per data model
+            attribute_plan = get_attribute_plan(self.sg, col)
 
             #check if attribute has any rules associated with it
-            if validation_rules:
+            if attribute_plan.rules:
                 #iterate through all validation rules for an attribute
-                for rule in validation_rules:
-                    base_rule = rule.split(" ")[0]
+                for rule_plan in attribute_plan.rules:
+                    rule = rule_plan.rule
+                    base_rule = rule_plan.kind
             
                     #check if rule has an implemented expectation
                     if rule_in_rule_list(rule,self.unimplemented_expectations):
@@ -256,8 +412,8 @@ class GreatExpectationsHelpers(object):
                     
                     elif base_rule==("inRange"):
                         args["mostly"]=1.0
-                        args["min_value"]=float(rule.split(" ")[1])
-                        args["max_value"]=float(rule.split(" ")[2])
+                        args["min_value"]=float(rule_plan.args[0])
+                        args["max_value"]=float(rule_plan.args[1])
                         meta={
                             "notes": {
                                 "format": "markdown",
@@ -275,10 +431,11 @@ class GreatExpectationsHelpers(object):
                     )
         
             
-        self.context.save_expectation_suite(expectation_suite=self.suite, expectation_suite_name=expectation_suite_name)
+        self.validation_context.add_suite(self.suite_key, self.suite)
 
-        suite_identifier = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
-        self.context.build_data_docs(resource_identifiers=[suite_identifier])
+        if self.data_docs:
+            suite_identifier = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
+            self.context.build_data_docs(resource_identifiers=[suite_identifier])
         ##Webpage DataDocs opened here:
         #self.context.open_data_docs(resource_identifier=suite_identifier) 
 
@@ -317,35 +474,40 @@ class GreatExpectationsHelpers(object):
         # Add the Expectation to the suite
         self.suite.add_expectation(expectation_configuration=expectation_configuration)
 
-    def build_checkpoint(self):
+    def get_suite_key(self) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        """
+            Purpose:
+                Key of the expectation suite of the manifest in the suite cache
+            Returns:
+                (data model hash, manifest columns), or None if the data model has no content hash
+                (e.g. it was edited), in which case the suite is not cached
+        """
+        schema_hash = self.sg.se.get_schema_hash()
+        if schema_hash is None:
+            return None
+
+        return schema_hash, tuple(self.manifest.columns)
+
+    def run_checkpoint(self):
         """
             Purpose:
-                Build checkpoint to validate manifest
+                Validate manifest against its expectation suite with the checkpoint of the context
             Input:
             Returns:
-                adds checkpoint to self 
+                checkpoint result
         """
-        #create manifest checkpoint
-        checkpoint_name = "manifest_checkpoint"  
-        checkpoint_config={
-            "name": checkpoint_name,
-            "config_version": 1,
-            "class_name": "SimpleCheckpoint",
-            "validations": [
-                {
-                    "batch_request": {
-                        "datasource_name": "example_datasource",
-                        "data_connector_name": "default_runtime_data_connector_name",
-                        "data_asset_name": "Manifest",
-                    },
-                    "expectation_suite_name": "Manifest_test_suite",
-                }
-            ],
-        }
+        return self.validation_context.run_checkpoint(
+            self.suite_key,
+            self.suite,
+            batch_request={
+                "runtime_parameters": {"batch_data": self.manifest},
+                "batch_identifiers": {
+                    "default_identifier_name": "manifestID"
+                },
+            },
+            result_format={'result_format': 'COMPLETE'},
+        )
 
-        #self.context.test_yaml_config(yaml.dump(checkpoint_config),return_mode="report_object")        
-        self.context.add_checkpoint(**checkpoint_config)
-    
     def generate_errors(
         self,
         validation_results: Dict,
@@ -0,0 +1,364 @@
+import json
+import logging
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from jsonschema import Draft7Validator, exceptions, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+# keywords of the JSON schemas generated by SchemaGenerator.get_json_schema_requirements
+ROOT_KEYWORDS = {"$schema", "$id", "title", "description", "type", "properties", "required", "allOf"}
+CONDITIONAL_KEYWORDS = {"properties", "required"}
+PROPERTY_KEYWORDS = {"enum", "type", "items", "maxItems", "not", "minLength"}
+
+
+def is_columnar_schema(json_schema: Dict) -> bool:
+    """Whether a JSON schema only uses the constructs that ColumnarSchemaValidator evaluates.
+
+    These are the constructs of the schemas generated from data models: required properties, enums, arrays of
+    enums (valid values of list attributes), non blank properties and allOf if/then conditionals.
+    """
+    if not isinstance(json_schema, dict) or not set(json_schema) <= ROOT_KEYWORDS:
+        return False
+    if json_schema.get("type", "object") != "object":
+        return False
+    if not _is_columnar_object(json_schema):
+        return False
+
+    return all(
+        isinstance(conditional, dict)
+        and set(conditional) == {"if", "then"}
+        and set(conditional["if"]) <= CONDITIONAL_KEYWORDS
+        and set(conditional["then"]) <= CONDITIONAL_KEYWORDS
+        and _is_columnar_object(conditional["if"])
+        and _is_columnar_object(conditional["then"])
+        for conditional in json_schema.get("allOf", [])
+    )
+
+
+def _is_columnar_object(schema: Dict) -> bool:
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+
+    return (
+        isinstance(properties, dict)
+        and isinstance(required, list)
+        and all(isinstance(prop, str) for prop in required)
+        and all(_is_columnar_property(subschema) for subschema in properties.values())
+    )
+
+
+def _is_columnar_property(subschema: Dict) -> bool:
+    if not isinstance(subschema, dict) or not set(subschema) <= PROPERTY_KEYWORDS:
+        return False
+
+    items = subschema.get("items", {})
+    return (
+        _is_string_enum(subschema.get("enum", []))
+        and subschema.get("type", "array") == "array"
+        and isinstance(items, dict)
+        and set(items) <= {"enum"}
+        and _is_string_enum(items.get("enum", []))
+        and _is_length(subschema.get("maxItems", 0))
+        and subschema.get("not", {"type": "null"}) == {"type": "null"}
+        and _is_length(subschema.get("minLength", 0))
+    )
+
+
+def _is_string_enum(enum: Any) -> bool:
+    return isinstance(enum, list) and all(isinstance(value, str) for value in enum)
+
+
+def _is_length(length: Any) -> bool:
+    return isinstance(length, int) and not isinstance(length, bool) and length >= 0
+
+
+def _get_trigger(if_schema: Dict) -> Optional[Tuple[str, Tuple[str], bool]]:
+    """Trigger of a conditional, (column, values, required), if its if schema only checks that a column is in values.
+
+    e.g. {"properties": {"Diagnosis": {"enum": ["Cancer"]}}, "required": ["Diagnosis"]}
+    """
+    properties = if_schema.get("properties", {})
+    required = if_schema.get("required", [])
+
+    if len(properties) != 1:
+        return None
+
+    [(col, subschema)] = properties.items()
+    if set(subschema) != {"enum"} or not set(required) <= {col}:
+        return None
+
+    return col, tuple(subschema["enum"]), bool(required)
+
+
+class _JsonColumn:
+    """Values of a manifest column as seen by a JSON schema validator, i.e. after a JSON round trip."""
+
+    def __init__(self, manifest_col: pd.core.series.Series) -> None:
+        # columns of strings are unchanged by the round trip, other columns are converted as by DataFrame.to_json
+        self.strings = (
+            pd.api.types.infer_dtype(manifest_col, skipna=False) == "string"
+            and not manifest_col.isna().any()
+        )
+        if self.strings:
+            self.values = manifest_col.reset_index(drop=True)
+        else:
+            values = json.loads(manifest_col.to_json(orient="values"))
+            self.values = pd.Series(np.empty(len(values), dtype=object))
+            self.values[:] = values
+
+        self._is_list = None
+        # codes of the values of columns of strings, see isin_mask
+        self._codes = None
+        self._uniques = None
+        # masks of the invalid values of subschemas, by id of the subschema
+        self._invalid_masks = {}
+
+    def isin_mask(self, enum: List[str]) -> np.ndarray:
+        """Mask of the values in enum.
+
+        Columns of strings are factorized once, so that each enum (e.g. the trigger values of conditionals)
+        only costs a lookup of the codes of its values.
+        """
+        if not self.strings:
+            return self.values.isin(enum).to_numpy(dtype=bool)
+
+        if self._codes is None:
+            self._codes, self._uniques = pd.factorize(self.values)
+
+        enum_codes = self._uniques.get_indexer(enum)
+        return np.isin(self._codes, enum_codes[enum_codes >= 0])
+
+    @property
+    def is_list(self) -> np.ndarray:
+        """Mask of the values that are JSON arrays."""
+        if self._is_list is None:
+            if self.strings:
+                self._is_list = np.zeros(len(self.values), dtype=bool)
+            else:
+                self._is_list = self.values.map(lambda value: isinstance(value, list)).to_numpy(dtype=bool)
+
+        return self._is_list
+
+    def invalid_mask(self, subschema: Dict) -> np.ndarray:
+        """Mask of the values that do not satisfy a property subschema (see _is_columnar_property)."""
+        invalid = self._invalid_masks.get(id(subschema))
+
+        if invalid is None:
+            invalid = self._invalid_masks[id(subschema)] = self._get_invalid_mask(subschema)
+
+        return invalid
+
+    def _get_invalid_mask(self, subschema: Dict) -> np.ndarray:
+        values = self.values
+        invalid = np.zeros(len(values), dtype=bool)
+
+        if "enum" in subschema:
+            invalid |= ~self.isin_mask(subschema["enum"])
+
+        if "type" in subschema:
+            invalid |= ~self.is_list
+
+        if "items" in subschema and "enum" in subschema["items"] and self.is_list.any():
+            items_enum = set(subschema["items"]["enum"])
+            invalid[self.is_list] |= values[self.is_list].map(
+                lambda items: any(not isinstance(item, str) or item not in items_enum for item in items)
+            ).to_numpy(dtype=bool)
+
+        if "maxItems" in subschema and self.is_list.any():
+            invalid[self.is_list] |= (values[self.is_list].map(len) > subschema["maxItems"]).to_numpy(dtype=bool)
+
+        if "not" in subschema and not self.strings:
+            invalid |= values.isna().to_numpy(dtype=bool)
+
+        if "minLength" in subschema:
+            if self.strings:
+                invalid |= (values.str.len() < subschema["minLength"]).to_numpy(dtype=bool)
+            else:
+                invalid |= values.map(
+                    lambda value: isinstance(value, str) and len(value) < subschema["minLength"]
+                ).to_numpy(dtype=bool)
+
+        return invalid
+
+
+class ColumnarSchemaValidator:
+    """Validate the rows of a manifest against a JSON schema column by column, see is_columnar_schema.
+
+    Rows that satisfy a property are found with vectorized masks over whole columns, and the values of the
+    rows that do not are validated by Draft7Validator, so that errors are the same as when validating each row
+    with Draft7Validator (see iter_row_errors), in the same order, without converting the manifest to JSON records.
+    The instance of errors for missing required properties is an empty object rather than the row.
+    """
+
+    def __init__(self, json_schema: Dict) -> None:
+        """
+        Args:
+            json_schema: JSON schema of the manifest rows, see is_columnar_schema.
+        """
+        self.json_schema = json_schema
+        # validators of the property subschemas, by id of the subschema
+        self._validators = {}
+
+        # conditionals by their trigger, (trigger column, trigger values), or by their if schema if it is not a
+        # trigger; conditionals generated from data models are triggered by attributes set to valid values
+        self._conditionals = OrderedDict()
+        for index, conditional in enumerate(json_schema.get("allOf", [])):
+            trigger = _get_trigger(conditional["if"])
+            key = trigger if trigger is not None else id(conditional["if"])
+            self._conditionals.setdefault(key, []).append((index, conditional))
+
+    def iter_errors(self, manifest: pd.core.frame.DataFrame) -> Iterator[Tuple[int, ValidationError]]:
+        """Errors of the rows of a manifest, as (row position, error), see iter_row_errors."""
+        columns = {}
+        row_errors = []
+        keywords = list(self.json_schema)
+        all_rows = np.ones(len(manifest), dtype=bool)
+
+        for rank, keyword in enumerate(keywords):
+            if keyword in ("properties", "required"):
+                row_errors.extend(
+                    self._object_errors(manifest, columns, self.json_schema, keyword, all_rows, (rank,))
+                )
+            elif keyword == "allOf":
+                for key, conditionals in self._conditionals.items():
+                    # rows are selected once for all the conditionals with the same trigger
+                    if isinstance(key, tuple):
+                        rows = self._trigger_mask(manifest, columns, *key)
+                    else:
+                        rows = self._valid_mask(manifest, columns, conditionals[0][1]["if"])
+                    if not rows.any():
+                        continue
+                    for index, conditional in conditionals:
+                        for then_rank, then_keyword in enumerate(conditional["then"]):
+                            row_errors.extend(
+                                self._object_errors(
+                                    manifest, columns, conditional["then"], then_keyword, rows, (rank, index, then_rank)
+                                )
+                            )
+
+        # errors of each row are sorted as by validate_manifest_values, and keep the order of the schema otherwise
+        row_errors.sort(key=lambda row_error: (row_error[0], exceptions.relevance(row_error[2]), row_error[1]))
+
+        for row, _, error in row_errors:
+            yield int(row), error
+
+    def _column(self, manifest: pd.core.frame.DataFrame, columns: Dict[str, _JsonColumn], col: str) -> _JsonColumn:
+        if col not in columns:
+            columns[col] = _JsonColumn(manifest[col])
+
+        return columns[col]
+
+    def _trigger_mask(
+        self, manifest: pd.core.frame.DataFrame, columns: Dict[str, _JsonColumn], col: str, values: Tuple[str], required: bool,
+    ) -> np.ndarray:
+        """Mask of the rows that trigger a conditional, see _get_trigger."""
+        if col not in manifest.columns:
+            # the if schema only holds for rows without the trigger column if it does not require it
+            return np.full(len(manifest), not required)
+
+        return self._column(manifest, columns, col).isin_mask(list(values))
+
+    def _valid_mask(self, manifest: pd.core.frame.DataFrame, columns: Dict[str, _JsonColumn], schema: Dict) -> np.ndarray:
+        """Mask of the rows that satisfy an object schema (properties and required)."""
+        valid = np.ones(len(manifest), dtype=bool)
+
+        if any(prop not in manifest.columns for prop in schema.get("required", [])):
+            return ~valid
+
+        for prop, subschema in schema.get("properties", {}).items():
+            if prop in manifest.columns:
+                valid &= ~self._column(manifest, columns, prop).invalid_mask(subschema)
+
+        return valid
+
+    def _object_errors(
+        self,
+        manifest: pd.core.frame.DataFrame,
+        columns: Dict[str, _JsonColumn],
+        schema: Dict,
+        keyword: str,
+        rows: np.ndarray,
+        rank: Tuple,
+    ) -> List[Tuple[int, Tuple, ValidationError]]:
+        """Errors of the rows in the rows mask for the properties or required keyword of an object schema."""
+        errors = []
+
+        if keyword == "properties":
+            for prop_rank, (prop, subschema) in enumerate(schema["properties"].items()):
+                if prop not in manifest.columns:
+                    continue
+                column = self._column(manifest, columns, prop)
+                # errors of invalid values repeated over many rows (e.g. blanks) are generated once
+                value_errors = {}
+                for row in np.flatnonzero(rows & column.invalid_mask(subschema)):
+                    value = column.values[row]
+                    cached = isinstance(value, str)
+                    prop_errors = value_errors.get(value) if cached else None
+                    if prop_errors is None:
+                        prop_errors = self._property_errors(prop, subschema, value)
+                        if cached:
+                            value_errors[value] = prop_errors
+                    errors.extend(
+                        (row, rank + (prop_rank, error_rank), error) for error_rank, error in enumerate(prop_errors)
+                    )
+
+        elif keyword == "required":
+            missing = [prop for prop in schema["required"] if prop not in manifest.columns]
+            if missing:
+                # errors for missing properties are the same for each row
+                missing_errors = list(Draft7Validator({"required": missing}).iter_errors({}))
+                for row in np.flatnonzero(rows):
+                    errors.extend(
+                        (row, rank + (error_rank,), error) for error_rank, error in enumerate(missing_errors)
+                    )
+
+        return errors
+
+    def _property_errors(self, prop: str, subschema: Dict, value: Any) -> List[ValidationError]:
+        """Errors of the value of a property, with paths from the row."""
+        errors = list(self._get_validator(subschema).iter_errors(value))
+        for error in errors:
+            error.path.appendleft(prop)
+
+        return errors
+
+    def _get_validator(self, subschema: Dict) -> Draft7Validator:
+        validator = self._validators.get(id(subschema))
+
+        if validator is None:
+            validator = self._validators[id(subschema)] = Draft7Validator(subschema)
+
+        return validator
+
+
+def iter_row_errors(manifest: pd.core.frame.DataFrame, json_schema: Dict) -> Iterator[Tuple[int, ValidationError]]:
+    """Errors of the rows of a manifest, as (row position, error), validating each row with Draft7Validator.
+
+    Errors of a row are sorted by relevance (see jsonschema.exceptions.relevance).
+    """
+    validator = Draft7Validator(json_schema)
+    annotations = json.loads(manifest.to_json(orient="records"))
+
+    for i, annotation in enumerate(annotations):
+        for error in sorted(validator.iter_errors(annotation), key=exceptions.relevance):
+            yield i, error
+
+
+def iter_schema_errors(manifest: pd.core.frame.DataFrame, json_schema: Dict) -> Iterator[Tuple[int, ValidationError]]:
+    """Errors of the rows of a manifest, as (row position, error), see iter_row_errors.
+
+    Schemas generated from data models are evaluated column by column (see ColumnarSchemaValidator), other
+    schemas row by row.
+    """
+    if is_columnar_schema(json_schema):
+        return ColumnarSchemaValidator(json_schema).iter_errors(manifest)
+
+    logger.debug("JSON schema has constructs that are not evaluated by column, validating rows one by one.")
+    return iter_row_errors(manifest, json_schema)
@@ -190,8 +190,15 @@ def submit_manifest(
     callback=parse_synIDs,
     help=query_dict(model_commands, ("model", "validate", "project_scope")),
 )
+@click.option(
+    "-w",
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help=query_dict(model_commands, ("model", "validate", "workers")),
+)
 @click.pass_obj
-def validate_manifest(ctx, manifest_path, data_type, json_schema, restrict_rules,project_scope):
+def validate_manifest(ctx, manifest_path, data_type, json_schema, restrict_rules,project_scope, workers):
     """
     Running CLI for manifest validation.
     """
@@ -222,7 +229,7 @@ def validate_manifest(ctx, manifest_path, data_type, json_schema, restrict_rules
     )
 
     errors, warnings = metadata_model.validateModelManifest(
-        manifestPath=manifest_path, rootNode=data_type, jsonSchema=json_schema, restrict_rules=restrict_rules, project_scope=project_scope,
+        manifestPath=manifest_path, rootNode=data_type, jsonSchema=json_schema, restrict_rules=restrict_rules, project_scope=project_scope, workers=workers,
     )
 
     if not errors:
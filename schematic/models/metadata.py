@@ -10,7 +10,7 @@ from jsonschema import Draft7Validator, exceptions, validate, ValidationError, F
 from os.path import exists
 
 # allows specifying explicit variable types
-from typing import Any, Dict, Optional, Text, List
+from typing import Any, Dict, Iterator, Optional, Text, List, Tuple
 
 # handle schema logic; to be refactored as SchemaExplorer matures into a package
 # as collaboration with Biothings progresses
@@ -23,10 +23,10 @@ from schematic.schemas.generator import SchemaGenerator
 # we shouldn't need to expose Synapse functionality explicitly
 from schematic.store.synapse import SynapseStorage
 
-from schematic.utils.df_utils import load_df
+from schematic.utils.df_utils import iter_load_df, load_df
 
 from schematic.models.validate_attribute import ValidateAttribute
-from schematic.models.validate_manifest import validate_all
+from schematic.models.validate_manifest import ValidateManifest, validate_all
 
 
 logger = logging.getLogger(__name__)
@@ -186,7 +186,7 @@ class MetadataModel(object):
 
     # TODO: abstract validation in its own module
     def validateModelManifest(
-        self, manifestPath: str, rootNode: str, restrict_rules: bool = False, jsonSchema: str = None, project_scope: List = None,
+        self, manifestPath: str, rootNode: str, restrict_rules: bool = False, jsonSchema: str = None, project_scope: List = None, workers: int = 1,
     ) -> List[str]:
         """Check if provided annotations manifest dataframe satisfies all model requirements.
 
@@ -194,6 +194,7 @@ class MetadataModel(object):
             rootNode: a schema node label (i.e. term).
             manifestPath: a path to the manifest csv file containing annotations.
             restrict_rules: bypass great expectations and restrict rule options to those implemented in house
+            workers: number of processes validating the columns of large manifests in parallel
 
         Returns:
             A validation status message; if there is an error the message.
@@ -205,7 +206,7 @@ class MetadataModel(object):
         # get validation schema for a given node in the data model, if the user has not provided input validation schema
         
         if not jsonSchema:
-            jsonSchema = self.sg.get_json_schema_requirements(
+            jsonSchema = self.sg.get_cached_json_schema_requirements(
                 rootNode, rootNode + "_validation"
             )
 
@@ -221,38 +222,48 @@ class MetadataModel(object):
         )  # read manifest csv file as is from manifest path
 
         # handler for mismatched components/data types
-        # throw TypeError if the value(s) in the "Component" column differ from the selected template type
-        if ("Component" in manifest.columns) and (
-            (len(manifest["Component"].unique()) > 1)
-            or (manifest["Component"].unique()[0] != rootNode)
-        ):
-            logging.error(
-                f"The 'Component' column value(s) {manifest['Component'].unique()} do not match the "
-                f"selected template type '{rootNode}'."
-            )
+        vm = ValidateManifest(errors, manifest, manifestPath, self.sg, jsonSchema)
+        component_errors = vm.get_component_errors(manifest, rootNode)
+        if component_errors:
+            return component_errors, warnings
 
-            # row indexes for all rows where 'Component' is rootNode
-            row_idxs = manifest.index[manifest["Component"] != rootNode].tolist()
-            # column index value for the 'Component' column
-            col_idx = manifest.columns.get_loc("Component")
-            # Series with index and 'Component' values from manifest
-            mismatched_ser = manifest.iloc[row_idxs, col_idx]
-            for index, component in mismatched_ser.items():
-                errors.append(
-                    [
-                        index + 2,
-                        "Component",
-                        f"Component value provided is: '{component}', whereas the Template Type is: '{rootNode}'",
-                        # tuple of the component in the manifest and selected template type
-                        # check: R/Reticulate cannnot handle dicts? So returning tuple
-                        (component, rootNode),
-                    ]
-                )
+        errors, warnings, manifest = validate_all(self, errors, warnings, manifest, manifestPath, self.sg, jsonSchema, restrict_rules, project_scope, workers)
+        return errors, warnings
 
-            return errors, warnings
+    def iterValidateModelManifest(
+        self, manifestPath: str, rootNode: str, jsonSchema: str = None, project_scope: List = None, chunksize: int = 10000,
+    ) -> Iterator[Tuple[List, List]]:
+        """Check a manifest against the model requirements in chunks of rows, see ValidateManifest.iter_validate_manifest.
 
-        errors, warnings, manifest = validate_all(self, errors, warnings, manifest, manifestPath, self.sg, jsonSchema, restrict_rules, project_scope)
-        return errors, warnings
+        Only one chunk of the manifest is held in memory at a time, so that large manifests can be validated with
+        bounded memory. Rules are validated as with restrict_rules.
+
+        Args:
+            manifestPath: a path to the manifest csv file containing annotations.
+            rootNode: a schema node label (i.e. term).
+            chunksize: number of manifest rows validated at a time
+
+        Returns:
+            Generator of (errors, warnings) of each chunk of rows, followed by (errors, warnings) of the rules
+            validated over whole columns.
+
+        Raises:
+            ValueError: rootNode not found in metadata model.
+        """
+        if not jsonSchema:
+            jsonSchema = self.sg.get_cached_json_schema_requirements(
+                rootNode, rootNode + "_validation"
+            )
+
+        load_args={
+            "dtype":"string",
+            }
+        manifest_chunks = iter_load_df(
+            manifestPath, chunksize, preserve_raw_input=False, **load_args,
+        )
+
+        vm = ValidateManifest([], None, manifestPath, self.sg, jsonSchema)
+        yield from vm.iter_validate_manifest(manifest_chunks, self.sg, jsonSchema, project_scope, root_node=rootNode)
 
     def populateModelManifest(self, title, manifestPath: str, rootNode: str, return_excel = False) -> str:
         """Populate an existing annotations manifest based on a dataframe.
@@ -0,0 +1,182 @@
+import logging
+import numbers
+import numpy as np
+import pandas as pd
+
+# allows specifying explicit variable types
+from typing import Any, Dict, List, Optional, Tuple
+
+from schematic.models.GE_Helpers import GreatExpectationsHelpers
+from schematic.models.validation_plan import RulePlan, get_attribute_plan
+from schematic.utils.validate_utils import rule_in_rule_list
+
+logger = logging.getLogger(__name__)
+
+# type lists of the type expectations, as set by GreatExpectationsHelpers.build_expectation_suite
+EXPECTED_TYPES = {
+    "int": ["int", "int64"],
+    "float": ["float", "float64"],
+    "num": ["int", "int64", "float", "float64"],
+    "str": ["str"],
+}
+
+# python types of the values of object columns matching a type name, as by Great Expectations
+_NATIVE_TYPES = {
+    "int": (int,),
+    "float": (float,),
+    "str": (str,),
+}
+
+# mostly of the recommended expectation, which fails only if no value of the column is filled
+RECOMMENDED_MOSTLY = 0.0000000001
+
+
+def _get_comp_types(type_list: List[str]) -> List[Any]:
+    """numpy and python types matching the type names of a type expectation."""
+    comp_types = []
+    for type_ in type_list:
+        comp_types.append(np.dtype(type_).type)
+        comp_types.extend(_NATIVE_TYPES.get(type_, ()))
+
+    return comp_types
+
+
+def _type_mask(values: pd.Series, types: Tuple[type, ...]) -> np.ndarray:
+    """Whether each value is an instance of types, checked once per distinct type of the values."""
+    value_types = values.map(type)
+    matching_types = [value_type for value_type in value_types.unique() if issubclass(value_type, types)]
+
+    return value_types.isin(matching_types).to_numpy()
+
+
+def _mostly_success(nonnull_count: int, unexpected_count: int, mostly: float) -> bool:
+    """Whether a column map expectation succeeds, i.e. at least mostly of its non-null values are expected."""
+    if nonnull_count == 0:
+        return True
+
+    return (nonnull_count - unexpected_count) / nonnull_count >= mostly
+
+
+class NativeExpectationsHelpers(GreatExpectationsHelpers):
+    """
+        Native expectations helper class
+
+        Validates the rules that have Great Expectations expectations (int, float, num, str, recommended,
+        protectAges, unique and inRange) with vectorized pandas operations, without a Great Expectations context.
+        Results are in the format of Great Expectations validation results, so that generate_errors reports them,
+        and censors ages, as for Great Expectations. Values that cannot be compared to a range (e.g. strings in a
+        protectAges or inRange column), which make generate_errors fail with Great Expectations, are out of range.
+    """
+
+    def validate_expectations(self) -> List[Dict]:
+        """
+            Purpose:
+                Validate the columns of the manifest against the expectations of their rules,
+                in the order of the expectation suite (see build_expectation_suite)
+            Input:
+            Returns:
+                validation results, as listed by the checkpoint result of Great Expectations
+        """
+        results = []
+
+        for col in self.manifest.columns:
+            # validation rules of the column, parsed once per data model
+            attribute_plan = get_attribute_plan(self.sg, col)
+
+            for rule_plan in attribute_plan.rules:
+                #check if rule has an implemented expectation
+                if rule_in_rule_list(rule_plan.rule, self.unimplemented_expectations):
+                    continue
+
+                results.append(self.validate_expectation(col, rule_plan))
+
+        return [{"results": results}]
+
+    def validate_expectation(self, col: str, rule_plan: RulePlan) -> Dict:
+        """
+            Purpose:
+                Validate a column against the expectation of a rule
+            Input:
+                col:
+                    name of the column
+                rule_plan:
+                    rule of the column with an expectation
+            Returns:
+                result of the expectation
+        """
+        manifest_col = self.manifest[col]
+        nonnull = manifest_col.notna().to_numpy()
+        values = manifest_col[nonnull]
+        mostly = 1.0
+
+        if rule_plan.kind in EXPECTED_TYPES:
+            # type expectations check the dtype of columns that are not of object dtype
+            if manifest_col.dtype != object:
+                return self._aggregate_type_result(col, rule_plan, manifest_col.dtype)
+
+            comp_types = _get_comp_types(EXPECTED_TYPES[rule_plan.kind])
+            unexpected = ~_type_mask(values, tuple(comp_types))
+
+        elif rule_plan.kind == "recommended":
+            mostly = RECOMMENDED_MOSTLY
+            unexpected = values.astype(str).str.contains("^$").to_numpy(dtype=bool)
+
+        elif rule_plan.kind in ("protectAges", "inRange"):
+            if rule_plan.kind == "protectAges":
+                min_value, max_value = self.get_age_limits()
+            else:
+                min_value, max_value = float(rule_plan.args[0]), float(rule_plan.args[1])
+
+            # values that are not numbers, which Great Expectations fails to compare, are out of range
+            real = _type_mask(values, (numbers.Real,))
+            real_values = values[real].astype(float).to_numpy()
+            unexpected = np.ones(len(values), dtype=bool)
+            unexpected[real] = ~((min_value <= real_values) & (real_values <= max_value))
+
+        elif rule_plan.kind == "unique":
+            unexpected = values.duplicated(keep=False).to_numpy()
+
+        else:
+            raise ValueError(f"Validation rule {rule_plan.rule} has no native expectation.")
+
+        return self._map_result(
+            col,
+            rule_plan,
+            success=_mostly_success(len(values), int(unexpected.sum()), mostly),
+            unexpected_values=values[unexpected],
+        )
+
+    def _aggregate_type_result(self, col: str, rule_plan: RulePlan, dtype: np.dtype) -> Dict:
+        """Result of a type expectation for a column that is not of object dtype, checked by its dtype."""
+        comp_types = _get_comp_types(EXPECTED_TYPES[rule_plan.kind])
+
+        # str is checked by expect_column_values_to_be_of_type, which compares the type of the column values
+        if rule_plan.kind == "str":
+            success = dtype.type in comp_types
+        else:
+            success = dtype in comp_types + [np.dtype(type_) for type_ in EXPECTED_TYPES[rule_plan.kind]]
+
+        return self._result(col, rule_plan, success, {"observed_value": dtype.type.__name__})
+
+    def _map_result(self, col: str, rule_plan: RulePlan, success: bool, unexpected_values: pd.Series) -> Dict:
+        """Result of a column map expectation, listing its unexpected values and their rows."""
+        return self._result(
+            col,
+            rule_plan,
+            success,
+            {
+                "unexpected_index_list": unexpected_values.index.tolist(),
+                "unexpected_list": unexpected_values.tolist(),
+            },
+        )
+
+    @staticmethod
+    def _result(col: str, rule_plan: RulePlan, success: bool, result: Dict) -> Dict:
+        return {
+            "success": success,
+            "expectation_config": {
+                "kwargs": {"column": col},
+                "meta": {"validation_rule": rule_plan.rule},
+            },
+            "result": result,
+        }
@@ -3,9 +3,10 @@ import logging
 import re
 import sys
 import time
+import warnings as warnings_module
 from os import getenv
 # allows specifying explicit variable types
-from typing import Any, Dict, List, Optional, Text
+from typing import Any, Dict, List, Optional, Pattern, Text, Union
 from urllib import error
 from urllib.parse import urlparse
 from urllib.request import (HTTPDefaultErrorHandler, OpenerDirector, Request,
@@ -15,6 +16,7 @@ import numpy as np
 import pandas as pd
 from jsonschema import ValidationError
 
+from schematic.models.validation_plan import get_attribute_plan
 from schematic.schemas.generator import SchemaGenerator
 from schematic.store.base import BaseStorage
 from schematic.store.synapse import SynapseStorage
@@ -24,6 +26,96 @@ from schematic.utils.validate_utils import (comma_separated_list_regex,
 
 logger = logging.getLogger(__name__)
 
+
+# re functions that have an equivalent pandas string method, used to validate whole columns at once
+REGEX_STR_METHODS = {"search": "contains", "match": "match", "fullmatch": "fullmatch"}
+
+
+def regex_mismatch_mask(values: pd.Series, module_to_call: str, reg_expression: Union[str, Pattern]) -> np.ndarray:
+    """Find the values of a column of strings that do not match a regular expression.
+
+    Equivalent to evaluating `value and not re.<module_to_call>(reg_expression, value)` for each value, with
+    the pattern compiled once and a vectorized pandas string method for the search, match and fullmatch modules.
+    Each distinct value is matched once.
+
+    Args:
+        values: series of strings.
+        module_to_call: name of the re function to match values with, e.g. search.
+        reg_expression: regular expression, or compiled pattern.
+
+    Returns:
+        Boolean mask of the values that are not empty and do not match.
+    """
+    if values.empty:
+        return np.zeros(0, dtype=bool)
+
+    codes, uniques = pd.factorize(values)
+    values = pd.Series(uniques, dtype=object)
+
+    if module_to_call in REGEX_STR_METHODS:
+        pattern = re.compile(reg_expression)
+        with warnings_module.catch_warnings():
+            # pandas warns about match groups in patterns used with str.contains
+            warnings_module.simplefilter("ignore", UserWarning)
+            matches = getattr(values.str, REGEX_STR_METHODS[module_to_call])(pattern)
+        matches = matches.to_numpy(dtype=bool)
+    else:
+        re_function = getattr(re, module_to_call)
+        matches = np.fromiter(
+            (bool(re_function(reg_expression, value)) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+
+    mismatches = ~matches & (values != "").to_numpy(dtype=bool)
+
+    return mismatches.take(codes)
+
+
+def type_mismatch_mask(manifest_col: pd.Series, allowed_types: tuple) -> np.ndarray:
+    """Find the values of a column that are truthy and not instances of allowed_types.
+
+    Equivalent to evaluating `bool(value) and not isinstance(value, allowed_types)` for each value of the
+    column. Columns of int, float and bool dtypes, whose values are all of the same Python type, are checked
+    with a single comparison instead; for other columns, types are checked once per distinct type of value,
+    and only the values of the wrong type are tested for truthiness.
+
+    Args:
+        manifest_col: column of a manifest.
+        allowed_types: types the values may have.
+
+    Returns:
+        Boolean mask of the values of the wrong type.
+    """
+    values = manifest_col.values
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iufb":
+        # iterating over the column yields Python scalars of a single type
+        scalar_type = {"i": int, "u": int, "f": float, "b": bool}[values.dtype.kind]
+        if issubclass(scalar_type, allowed_types):
+            return np.zeros(len(values), dtype=bool)
+        # truthy values (NaN is truthy)
+        return values != 0
+
+    if isinstance(values, np.ndarray):
+        value_types = manifest_col.map(type)
+        wrong_types = [
+            value_type
+            for value_type in pd.unique(value_types)
+            if not issubclass(value_type, allowed_types)
+        ]
+        mismatches = value_types.isin(wrong_types).to_numpy()
+        for i in np.flatnonzero(mismatches):
+            mismatches[i] = bool(values[i])
+
+        return mismatches
+
+    return np.fromiter(
+        (bool(value) and not isinstance(value, allowed_types) for value in manifest_col),
+        dtype=bool,
+        count=len(manifest_col),
+    )
+
+
 class GenerateError:
     def generate_schema_error(row_num: str, attribute_name: str, error_msg: str, invalid_entry: str, sg: SchemaGenerator,)-> List[str]:
         '''
@@ -500,31 +592,8 @@ class GenerateError:
         # TODO: recommended and other rules
         """
 
-        level = None
-        rule_parts = val_rule.split(" ")
-        rule_info = validation_rule_info()
-
-        if not sg.is_node_required(node_display_name=attribute_name):
-            # raise warning if recommended but not required
-            if 'recommended' in val_rule:
-                level = 'warning'
-            # If not required or recommended raise warnings to notify
-            else:
-                level = 'warning' 
-                return level
-        elif sg.is_node_required(node_display_name=attribute_name) and 'recommended' in val_rule:
-            level = None
-        
-        
-        # Parse rule for level, set to default if not specified
-        if rule_parts[-1].lower() == 'error' or rule_parts[0] == 'schema':
-            level = 'error'
-        elif rule_parts[-1].lower() == 'warning':
-            level = 'warning'
-        else:
-            level = rule_info[rule_parts[0]]['default_message_level']
-            
-        return level
+        # levels are determined once per data model, attribute and rule, see schematic.models.validation_plan
+        return get_attribute_plan(sg, attribute_name).rule_plan(val_rule).message_level
 
 class ValidateAttribute(object):
     """
@@ -599,22 +668,25 @@ class ValidateAttribute(object):
 
         if list_robustness == 'strict':
         # This will capture any if an entry is not formatted properly. Only for strict lists
-            for i, list_string in enumerate(manifest_col):
-                if not re.fullmatch(csv_re,list_string):
-                    list_error = "not_comma_delimited"
-                    vr_errors, vr_warnings = GenerateError.generate_list_error(
-                            list_string,
-                            row_num=str(i + 2),
-                            attribute_name=manifest_col.name,
-                            list_error=list_error,
-                            invalid_entry=manifest_col[i],
-                            sg = sg,
-                            val_rule = val_rule, 
-                        )
-                    if vr_errors:
-                        errors.append(vr_errors)
-                    if vr_warnings:
-                        warnings.append(vr_warnings)
+            # check each distinct entry once
+            codes, uniques = pd.factorize(manifest_col)
+            not_comma_delimited = ~pd.Series(uniques, dtype=object).str.fullmatch(csv_re).to_numpy(dtype=bool)
+            not_comma_delimited = not_comma_delimited.take(codes)
+            for i in np.flatnonzero(not_comma_delimited):
+                list_error = "not_comma_delimited"
+                vr_errors, vr_warnings = GenerateError.generate_list_error(
+                        manifest_col.iat[i],
+                        row_num=str(i + 2 + self.row_offset),
+                        attribute_name=manifest_col.name,
+                        list_error=list_error,
+                        invalid_entry=manifest_col[i],
+                        sg = sg,
+                        val_rule = val_rule, 
+                    )
+                if vr_errors:
+                    errors.append(vr_errors)
+                if vr_warnings:
+                    warnings.append(vr_warnings)
                 
 
         # Convert string to list.
@@ -669,46 +741,38 @@ class ValidateAttribute(object):
                 # Convert string to list.
                 manifest_col = parse_str_series_to_list(manifest_col)
 
-            for i, row_values in enumerate(manifest_col):
-                for j, re_to_check in enumerate(row_values):
-                    re_to_check = str(re_to_check)
-                    if not bool(module_to_call(reg_expression, re_to_check)) and bool(
-                        re_to_check
-                    ):
-                        vr_errors, vr_warnings = GenerateError.generate_regex_error(
-                                val_rule = val_rule,
-                                reg_expression = reg_expression,
-                                row_num=str(i + 2),
-                                module_to_call=reg_exp_rules[1],
-                                attribute_name=manifest_col.name,
-                                invalid_entry=manifest_col[i],
-                                sg = sg,
-                            )
-                        if vr_errors:
-                            errors.append(vr_errors)
-                        if vr_warnings:
-                            warnings.append(vr_warnings)
-
+            # validate the values of all lists at once, keeping the row of each value
+            row_values = [
+                (i, str(re_to_check))
+                for i, values in enumerate(manifest_col)
+                for re_to_check in values
+            ]
+            rows = [i for (i, _) in row_values]
+            values = pd.Series([value for (_, value) in row_values], dtype=object)
         # Validating single re's
         else:
             manifest_col = manifest_col.astype(str)
-            for i, re_to_check in enumerate(manifest_col):
-                if not bool(module_to_call(reg_expression, re_to_check)) and bool(
-                    re_to_check
-                ):
-                    vr_errors, vr_warnings = GenerateError.generate_regex_error(
-                            val_rule = val_rule,
-                            reg_expression = reg_expression,
-                            row_num=str(i + 2),
-                            module_to_call=reg_exp_rules[1],
-                            attribute_name=manifest_col.name,
-                            invalid_entry=manifest_col[i],
-                            sg = sg,
-                        )
-                    if vr_errors:
-                        errors.append(vr_errors)
-                    if vr_warnings:
-                        warnings.append(vr_warnings)
+            rows = range(len(manifest_col))
+            values = manifest_col
+
+        # pattern compiled with the validation plan of the attribute, if the expression is valid
+        pattern = get_attribute_plan(sg, manifest_col.name).rule_plan(val_rule).pattern
+        mismatches = regex_mismatch_mask(values, reg_exp_rules[1], pattern or reg_expression)
+        for k in np.flatnonzero(mismatches):
+            i = rows[k]
+            vr_errors, vr_warnings = GenerateError.generate_regex_error(
+                    val_rule = val_rule,
+                    reg_expression = reg_expression,
+                    row_num=str(i + 2 + self.row_offset),
+                    module_to_call=reg_exp_rules[1],
+                    attribute_name=manifest_col.name,
+                    invalid_entry=manifest_col[i],
+                    sg = sg,
+                )
+            if vr_errors:
+                errors.append(vr_errors)
+            if vr_warnings:
+                warnings.append(vr_warnings)
 
         return errors, warnings
 
@@ -742,34 +806,20 @@ class ValidateAttribute(object):
         errors = []
         warnings = []
         # num indicates either a float or int.
-        if val_rule == "num":
-            for i, value in enumerate(manifest_col):
-                if bool(value) and not isinstance(value, specified_type[val_rule]):
-                    vr_errors, vr_warnings = GenerateError.generate_type_error(
-                            val_rule = val_rule ,
-                            row_num=str(i + 2),
-                            attribute_name=manifest_col.name,
-                            invalid_entry=str(manifest_col[i]),
-                            sg = sg,
-                        )
-                    if vr_errors:
-                        errors.append(vr_errors)
-                    if vr_warnings:
-                        warnings.append(vr_warnings)
-        elif val_rule in ["int", "float", "str"]:
-            for i, value in enumerate(manifest_col):
-                if bool(value) and not isinstance(value, specified_type[val_rule]):
-                    vr_errors, vr_warnings = GenerateError.generate_type_error(
-                            val_rule = val_rule,
-                            row_num=str(i + 2),
-                            attribute_name=manifest_col.name,
-                            invalid_entry=str(manifest_col[i]),
-                            sg = sg,
-                        )
-                    if vr_errors:
-                        errors.append(vr_errors)
-                    if vr_warnings:
-                        warnings.append(vr_warnings)
+        if val_rule in ["num", "int", "float", "str"]:
+            mismatches = type_mismatch_mask(manifest_col, specified_type[val_rule])
+            for i in np.flatnonzero(mismatches):
+                vr_errors, vr_warnings = GenerateError.generate_type_error(
+                        val_rule = val_rule,
+                        row_num=str(i + 2 + self.row_offset),
+                        attribute_name=manifest_col.name,
+                        invalid_entry=str(manifest_col[i]),
+                        sg = sg,
+                    )
+                if vr_errors:
+                    errors.append(vr_errors)
+                if vr_warnings:
+                    warnings.append(vr_warnings)
         return errors, warnings
 
     def url_validation(self, val_rule: str, manifest_col: str, sg: SchemaGenerator,) -> (List[List[str]], List[List[str]]):
@@ -790,16 +840,19 @@ class ValidateAttribute(object):
         url_args = val_rule.split(" ")[1:]
         errors = []
         warnings = []
+        # whether each distinct URL points to a working webpage, so that it is only requested once
+        checked_urls = {}
 
         for i, url in enumerate(manifest_col):
             # Check if a random phrase, string or number was added and
             # log the appropriate error.
-            if not isinstance(url,str) or not (
-                urlparse(url).scheme
-                + urlparse(url).netloc
-                + urlparse(url).params
-                + urlparse(url).query
-                + urlparse(url).fragment
+            parsed_url = urlparse(url) if isinstance(url,str) else None
+            if parsed_url is None or not (
+                parsed_url.scheme
+                + parsed_url.netloc
+                + parsed_url.params
+                + parsed_url.query
+                + parsed_url.fragment
             ):
                 #
                 url_error = "random_entry"
@@ -807,7 +860,7 @@ class ValidateAttribute(object):
                 vr_errors, vr_warnings = GenerateError.generate_url_error(
                         url,
                         url_error=url_error,
-                        row_num=str(i + 2),
+                        row_num=str(i + 2 + self.row_offset),
                         attribute_name=manifest_col.name,
                         argument=url_args,
                         invalid_entry=manifest_col[i],
@@ -820,22 +873,24 @@ class ValidateAttribute(object):
                     warnings.append(vr_warnings)
             else:
                 # add scheme to the URL if not currently added.
-                if not urlparse(url).scheme:
+                if not parsed_url.scheme:
                     url = "http://" + url
-                try:
-                    # Check that the URL points to a working webpage
-                    # if not log the appropriate error.
-                    request = Request(url)
-                    response = urlopen(request)
-                    valid_url = True
-                    response_code = response.getcode()
-                except:
-                    valid_url = False
+                if url not in checked_urls:
+                    try:
+                        # Check that the URL points to a working webpage
+                        # if not log the appropriate error.
+                        request = Request(url)
+                        response = urlopen(request)
+                        checked_urls[url] = True
+                    except:
+                        checked_urls[url] = False
+                valid_url = checked_urls[url]
+                if not valid_url:
                     url_error = "invalid_url"
                     vr_errors, vr_warnings = GenerateError.generate_url_error(
                             url,
                             url_error=url_error,
-                            row_num=str(i + 2),
+                            row_num=str(i + 2 + self.row_offset),
                             attribute_name=manifest_col.name,
                             argument=url_args,
                             invalid_entry=manifest_col[i],
@@ -855,7 +910,7 @@ class ValidateAttribute(object):
                             vr_errors, vr_warnings = GenerateError.generate_url_error(
                                     url,
                                     url_error=url_error,
-                                    row_num=str(i + 2),
+                                    row_num=str(i + 2 + self.row_offset),
                                     attribute_name=manifest_col.name,
                                     argument=arg,
                                     invalid_entry=manifest_col[i],
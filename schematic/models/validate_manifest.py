@@ -10,8 +10,10 @@ import pandas as pd
 import re
 import sys
 
+from concurrent.futures import ProcessPoolExecutor
+
 # allows specifying explicit variable types
-from typing import Any, Dict, Optional, Text, List
+from typing import Any, Dict, Iterable, Iterator, Optional, Text, List, Tuple
 from urllib.parse import urlparse
 from urllib.request import urlopen, OpenerDirector, HTTPDefaultErrorHandler
 from urllib.request import Request
@@ -21,11 +23,42 @@ from schematic.models.validate_attribute import ValidateAttribute, GenerateError
 from schematic.schemas.generator import SchemaGenerator
 from schematic.store.synapse import SynapseStorage
 from schematic.models.GE_Helpers import GreatExpectationsHelpers
+from schematic.models.native_expectations import NativeExpectationsHelpers
+from schematic.models.columnar_schema import iter_schema_errors
+from schematic.models.validation_plan import AttributePlan, RulePlan, UNIMPLEMENTED_EXPECTATIONS, get_attribute_plan, get_validation_plan
+from schematic.utils.cli_utils import query_dict
 from schematic.utils.validate_rules_utils import validation_rule_info
-from schematic.utils.validate_utils import rule_in_rule_list
+from schematic import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# minimum number of cells (rows times columns with rules validated in house) for which validate_manifest_rules
+# uses worker processes; smaller manifests are validated faster than the workers start
+min_parallel_cells = 200000
+
+# engines validating the rules with Great Expectations expectations, see (validation > engine) in the configuration
+EXPECTATION_ENGINES = ["great_expectations", "native"]
+
+
+def _use_native_expectations() -> bool:
+    """Whether rules with expectations are validated natively rather than by Great Expectations, as set by
+    (validation > engine) in the configuration (see NativeExpectationsHelpers)."""
+    try:
+        engine = query_dict(CONFIG.DATA, ("validation", "engine"))
+    except AttributeError:
+        # no configuration loaded
+        return False
+
+    if engine is None:
+        return False
+    if engine not in EXPECTATION_ENGINES:
+        raise ValueError(
+            f"Unknown validation engine '{engine}' in the configuration, expected one of {EXPECTATION_ENGINES}."
+        )
+
+    return engine == "native"
+
+
 class ValidateManifest(object):
     def __init__(self, errors, manifest, manifestPath, sg, jsonSchema):
         self.errors = errors
@@ -33,6 +66,8 @@ class ValidateManifest(object):
         self.manifestPath = manifestPath
         self.sg = sg
         self.jsonSchema = jsonSchema       
+        # position of the first row of the manifest in the manifest file, when validating it in chunks
+        self.row_offset = 0
 
     def get_multiple_types_error(
         self, validation_rules: list, attribute_name: str, error_type: str
@@ -60,8 +95,50 @@ class ValidateManifest(object):
             error_val = f"Multiple Rules: list not first"
         return ["NA", error_col, error_message, error_val]
 
+    def get_component_errors(
+        self, manifest: pd.core.frame.DataFrame, root_node: str,
+    ) -> List[List[str]]:
+        """
+        Purpose:
+            Check that the values of the 'Component' column of a manifest match
+            the selected template type.
+        Input:
+            manifest: pd.core.frame.DataFrame, rows of the manifest, indexed by
+                their position in the manifest
+            root_node: selected template type
+        Returns:
+            errors: List[List[str]], one error for each mismatched row
+        """
+        errors = []
+
+        # throw TypeError if the value(s) in the "Component" column differ from the selected template type
+        if ("Component" in manifest.columns) and (
+            (len(manifest["Component"].unique()) > 1)
+            or (manifest["Component"].unique()[0] != root_node)
+        ):
+            logging.error(
+                f"The 'Component' column value(s) {manifest['Component'].unique()} do not match the "
+                f"selected template type '{root_node}'."
+            )
+
+            # Series with index and 'Component' values of the rows where 'Component' is not root_node
+            mismatched_ser = manifest.loc[manifest["Component"] != root_node, "Component"]
+            for index, component in mismatched_ser.items():
+                errors.append(
+                    [
+                        index + 2,
+                        "Component",
+                        f"Component value provided is: '{component}', whereas the Template Type is: '{root_node}'",
+                        # tuple of the component in the manifest and selected template type
+                        # check: R/Reticulate cannnot handle dicts? So returning tuple
+                        (component, root_node),
+                    ]
+                )
+
+        return errors
+
     def validate_manifest_rules(
-        self, manifest: pd.core.frame.DataFrame, sg: SchemaGenerator, restrict_rules: bool, project_scope: List,
+        self, manifest: pd.core.frame.DataFrame, sg: SchemaGenerator, restrict_rules: bool, project_scope: List, workers: int = 1,
     ) -> (pd.core.frame.DataFrame, List[List[str]]):
         """
         Purpose:
@@ -73,6 +150,9 @@ class ValidateManifest(object):
                 contains metadata input from user for each attribute.
             sg: SchemaGenerator
                 initialized within models/metadata.py
+            workers: int
+                number of processes validating columns in parallel; manifests with
+                fewer than min_parallel_cells cells to validate are validated serially
         Returns:
             manifest: pd.core.frame.DataFrame
                 If a 'list' validatior is run, the manifest needs to be 
@@ -94,65 +174,36 @@ class ValidateManifest(object):
 
         validation_types = validation_rule_info()
 
-        type_dict={
-            "float64": float,
-            "int64": int,
-            "str": str,
-        }
-
-        unimplemented_expectations=[
-            "url",
-            "list",
-            "regex.*",
-            "matchAtLeastOne.*",
-            "matchExactlyOne.*",
-            ]
-
-        in_house_rules = [
-            "int",
-            "float",
-            "num",
-            "str",
-            "regex.*",
-            "url",
-            "list",
-            "matchAtLeastOne.*",
-            "matchExactlyOne.*",
-        ]
-
         # initialize error and warning handling lists.
         errors = []   
         warnings = [] 
 
         if not restrict_rules:
-            #operations necessary to set up and run ge suite validation
-            ge_helpers=GreatExpectationsHelpers(
-                sg=sg,
-                unimplemented_expectations=unimplemented_expectations,
-                manifest = manifest,
-                manifestPath = self.manifestPath,
-                )
+            if _use_native_expectations():
+                #validate rules with expectations natively, without a GE context
+                ge_helpers=NativeExpectationsHelpers(
+                    sg=sg,
+                    unimplemented_expectations=UNIMPLEMENTED_EXPECTATIONS,
+                    manifest = manifest,
+                    manifestPath = self.manifestPath,
+                    )
+                validation_results = ge_helpers.validate_expectations()
+
+            else:
+                #operations necessary to set up and run ge suite validation
+                ge_helpers=GreatExpectationsHelpers(
+                    sg=sg,
+                    unimplemented_expectations=UNIMPLEMENTED_EXPECTATIONS,
+                    manifest = manifest,
+                    manifestPath = self.manifestPath,
+                    )
 
-            ge_helpers.build_context()
-            ge_helpers.build_expectation_suite()
-            ge_helpers.build_checkpoint()
-
-        #run GE validation
-            results = ge_helpers.context.run_checkpoint(
-                checkpoint_name="manifest_checkpoint",
-                batch_request={
-                    "runtime_parameters": {"batch_data": manifest},
-                    "batch_identifiers": {
-                        "default_identifier_name": "manifestID"
-                    },
-                },
-                result_format={'result_format': 'COMPLETE'},
-            )        
-        
-            #print(results)       
-            #results.list_validation_results()
-            validation_results = results.list_validation_results()
-            
+                ge_helpers.build_context()
+                ge_helpers.build_expectation_suite()
+
+                #run GE validation
+                results = ge_helpers.run_checkpoint()
+                validation_results = results.list_validation_results()
 
             #parse validation results dict and generate errors
             errors, warnings = ge_helpers.generate_errors(
@@ -166,11 +217,24 @@ class ValidateManifest(object):
             logging.info("Great Expetations suite will not be utilized.")  
 
 
-        regex_re=re.compile('regex.*')
-        for col in manifest.columns:
-            # remove trailing/leading whitespaces from manifest
-            manifest.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-            validation_rules = sg.get_node_validation_rules(col)
+        # validation rules of each column, parsed once per data model
+        validation_plan = get_validation_plan(sg, manifest.columns)
+
+        # columns with rules validated in house
+        in_house_columns = [
+            col
+            for col, attribute_plan in zip(manifest.columns, validation_plan)
+            if any(rule_plan.engine(restrict_rules) == "in_house" for rule_plan in attribute_plan.rules)
+        ]
+        if workers > 1 and len(in_house_columns) > 1 and len(manifest) * len(in_house_columns) >= min_parallel_cells:
+            column_results = self._validate_columns_parallel(
+                manifest, sg, in_house_columns, restrict_rules, project_scope, workers
+            )
+        else:
+            column_results = {}
+
+        for col, attribute_plan in zip(manifest.columns, validation_plan):
+            validation_rules = attribute_plan.validation_rules
 
             # Check that attribute rules conform to limits:
             # no more than two rules for an attribute. 
@@ -182,39 +246,197 @@ class ValidateManifest(object):
                     )
                 )
 
-            # Given a validation rule, run validation. Skip validations already performed by GE
-            for rule in validation_rules:
-                validation_type = rule.split(" ")[0]
-                if rule_in_rule_list(rule,unimplemented_expectations) or (rule_in_rule_list(rule,in_house_rules) and restrict_rules):
-                    if not rule_in_rule_list(rule,in_house_rules):
-                        logging.warning(f"Validation rule {rule.split(' ')[0]} has not been implemented in house and cannnot be validated without Great Expectations.")
-                        continue  
-
-                    #Validate for each individual validation rule.
-                    validation_method = getattr(
-                            ValidateAttribute, validation_types[validation_type]['type']
-                        )
+            if col in column_results:
+                vr_errors, vr_warnings, manifest_col = column_results[col]
+            else:
+                vr_errors, vr_warnings, manifest_col = self.validate_column_rules(
+                    manifest[col], attribute_plan, sg, restrict_rules, project_scope,
+                )
+            # the column is returned if a rule reformatted it (e.g. to lists)
+            if manifest_col is not None:
+                manifest[col] = manifest_col
+            errors.extend(vr_errors)
+            warnings.extend(vr_warnings)
 
-                    if validation_type == "list":
-                        vr_errors, vr_warnings, manifest_col = validation_method(
-                            self, rule, manifest[col], sg,
-                        )
-                        manifest[col] = manifest_col
-                    elif validation_type.lower().startswith("match"):
-                        vr_errors, vr_warnings = validation_method(
-                            self, rule, manifest[col], project_scope, sg,
-                        )
-                    else:
-                        vr_errors, vr_warnings = validation_method(
-                            self, rule, manifest[col], sg,
+        return manifest, errors, warnings
+
+    def validate_column_rules(
+        self, manifest_col: pd.core.series.Series, attribute_plan: AttributePlan, sg: SchemaGenerator, restrict_rules: bool, project_scope: List,
+        column_global_rules: bool = True,
+    ) -> (List[List[str]], List[List[str]], Optional[pd.core.series.Series]):
+        """
+        Purpose:
+            Run the validation rules of a column that are validated in house
+            (see validate_manifest_rules).
+        Input:
+            manifest_col: column of the manifest
+            attribute_plan: validation rules of the column, see get_attribute_plan
+            sg: SchemaGenerator
+            column_global_rules: whether to run the rules validated over whole
+                columns (e.g. cross manifest rules), see RulePlan.column_global
+        Returns:
+            errors, warnings, and the column reformatted by the rules (e.g. to lists),
+            or None if the rules did not reformat it
+        """
+        errors = []
+        warnings = []
+        reformatted_col = None
+
+        # Given a validation rule, run validation. Skip validations already performed by GE
+        for rule_plan in attribute_plan.rules:
+            rule = rule_plan.rule
+            validation_type = rule_plan.kind
+            if rule_plan.engine(restrict_rules) != "in_house":
+                if not rule_plan.has_expectation:
+                    logging.warning(f"Validation rule {validation_type} has not been implemented in house and cannnot be validated without Great Expectations.")
+                continue
+            if rule_plan.column_global and not column_global_rules:
+                continue
+
+            #Validate for each individual validation rule.
+            validation_method = getattr(ValidateAttribute, rule_plan.method)
+
+            if validation_type == "list":
+                vr_errors, vr_warnings, manifest_col = validation_method(
+                    self, rule, manifest_col, sg,
+                )
+                reformatted_col = manifest_col
+            elif validation_type.lower().startswith("match"):
+                vr_errors, vr_warnings = validation_method(
+                    self, rule, manifest_col, project_scope, sg,
+                )
+            else:
+                vr_errors, vr_warnings = validation_method(
+                    self, rule, manifest_col, sg,
+                )
+            # Check for validation rule errors and add them to other errors.
+            if vr_errors:
+                errors.extend(vr_errors)
+            if vr_warnings:
+                warnings.extend(vr_warnings)
+
+        return errors, warnings, reformatted_col
+
+    def _validate_columns_parallel(
+        self, manifest: pd.core.frame.DataFrame, sg: SchemaGenerator, columns: List[str], restrict_rules: bool, project_scope: List, workers: int,
+    ) -> Dict[str, tuple]:
+        """Validate columns in a pool of worker processes, see validate_column_rules; returns the results by column."""
+        logger.info(f"Validating {len(columns)} columns with {workers} worker processes.")
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(columns)),
+            initializer=_init_validation_worker,
+            initargs=(sg,),
+        ) as executor:
+            # results are collected in the order of the columns, so errors are reported in a deterministic order
+            results = executor.map(
+                _validate_column,
+                columns,
+                [manifest[col] for col in columns],
+                [restrict_rules] * len(columns),
+                [project_scope] * len(columns),
+            )
+
+            return dict(zip(columns, results))
+
+    def iter_validate_manifest(
+        self, manifest_chunks: Iterable[pd.core.frame.DataFrame], sg: SchemaGenerator, jsonSchema: Dict, project_scope: List, root_node: str = None,
+    ) -> Iterator[Tuple[List[List[str]], List[List[str]]]]:
+        """
+        Purpose:
+            Validate a manifest read in chunks of rows (see iter_load_df), so that
+            only one chunk is held in memory at a time. Rules are validated as
+            with restrict_rules: rules validated over whole columns (unique,
+            recommended and cross manifest rules) keep a running state of the
+            chunks and are reported after the last chunk, other rules that are
+            only implemented with Great Expectations are not validated.
+        Input:
+            manifest_chunks: consecutive chunks of rows of the manifest
+            sg: SchemaGenerator
+            jsonSchema: JSON schema of the manifest rows
+            project_scope: projects to validate cross manifest rules against
+            root_node: selected template type, to check the 'Component' column
+                against; once a chunk has mismatched components, only component
+                errors are reported, as by MetadataModel.validateModelManifest
+        Returns:
+            Generator of (errors, warnings), one for each chunk, then one for
+            the rules validated over whole columns
+        """
+        # running states of the rules validated over whole columns, by column
+        column_states = {}
+        components_mismatched = False
+
+        for chunk in manifest_chunks:
+            if root_node is not None:
+                component_errors = self.get_component_errors(chunk, root_node)
+                if component_errors or components_mismatched:
+                    components_mismatched = True
+                    yield component_errors, []
+                    continue
+
+            # rules report rows by their position, offset by the rows of the previous chunks
+            chunk = chunk.reset_index(drop=True)
+            errors = []
+            warnings = []
+
+            for col, attribute_plan in zip(chunk.columns, get_validation_plan(sg, chunk.columns)):
+                if col not in column_states:
+                    column_states[col] = self._init_column_states(col, attribute_plan)
+                    if len(attribute_plan.validation_rules) > 2:
+                        errors.append(
+                            self.get_multiple_types_error(
+                                attribute_plan.validation_rules, col, error_type="too_many_rules"
+                            )
                         )
-                    # Check for validation rule errors and add them to other errors.
-                    if vr_errors:
-                        errors.extend(vr_errors)
-                    if vr_warnings:
-                        warnings.extend(vr_warnings)
 
-        return manifest, errors, warnings
+                # column global rules see the column before it is reformatted by the rules (e.g. to lists)
+                raw_col = chunk[col]
+                vr_errors, vr_warnings, manifest_col = self.validate_column_rules(
+                    raw_col, attribute_plan, sg, True, project_scope, column_global_rules=False,
+                )
+                if manifest_col is not None:
+                    chunk[col] = manifest_col
+                errors.extend(vr_errors)
+                warnings.extend(vr_warnings)
+
+                for column_state in column_states[col]:
+                    column_state.update(raw_col, self.row_offset)
+
+            vmv_errors, vmv_warnings = self.validate_manifest_values(chunk, jsonSchema, sg)
+            errors.extend(vmv_errors)
+            warnings.extend(vmv_warnings)
+
+            self.row_offset += len(chunk)
+            yield errors, warnings
+
+        if components_mismatched:
+            return
+
+        errors = []
+        warnings = []
+        for col, states in column_states.items():
+            for column_state in states:
+                vr_errors, vr_warnings = column_state.finish(self, sg, project_scope)
+                errors.extend(vr_errors)
+                warnings.extend(vr_warnings)
+
+        yield errors, warnings
+
+    def _init_column_states(self, col: str, attribute_plan: AttributePlan) -> List["_ColumnState"]:
+        """Running states of the rules of a column that are validated over whole columns, see iter_validate_manifest."""
+        column_states = []
+
+        for rule_plan in attribute_plan.rules:
+            if rule_plan.column_global:
+                column_state_class = _COLUMN_STATES.get(rule_plan.kind, _CrossManifestState)
+                column_states.append(column_state_class(rule_plan, col))
+            elif rule_plan.has_expectation and rule_plan.engine(True) != "in_house":
+                logging.warning(
+                    f"Validation rule {rule_plan.kind} of {col} has not been implemented in house and "
+                    f"cannnot be validated when validating a manifest in chunks."
+                )
+
+        return column_states
 
     def validate_manifest_values(self, manifest, jsonSchema, sg
     ) -> (List[List[str]], List[List[str]]):
@@ -226,31 +448,190 @@ class ValidateManifest(object):
         # numerical values need to be type string for the jsonValidator
         for col in manifest.select_dtypes(include=[int, np.int64, float, np.float64]).columns:
             manifest[col]=manifest[col].astype('string')
-        manifest = manifest.applymap(lambda x: str(x) if isinstance(x, (int, np.int64, float, np.float64)) else x, na_action='ignore')
+        manifest = manifest.apply(
+            lambda col: col if pd.api.types.infer_dtype(col, skipna=True) == "string" else col.map(
+                lambda x: str(x) if isinstance(x, (int, np.int64, float, np.float64)) else x, na_action='ignore'
+            )
+        )
 
-        annotations = json.loads(manifest.to_json(orient="records"))
-        for i, annotation in enumerate(annotations):
-            v = Draft7Validator(jsonSchema)
-            for error in sorted(v.iter_errors(annotation), key=exceptions.relevance):
-                errorRow = i + 2
-                errorCol = error.path[-1] if len(error.path) > 0 else "Wrong schema"
-                errorColName = error.path[0] if len(error.path) > 0 else "Wrong schema"
-                errorMsg = error.message[0:500]
-                errorVal = error.instance if len(error.path) > 0 else "Wrong schema"
+        # schemas generated from the data model are evaluated by column, others row by row with Draft7Validator
+        for i, error in iter_schema_errors(manifest, jsonSchema):
+            errorRow = i + 2 + self.row_offset
+            errorCol = error.path[-1] if len(error.path) > 0 else "Wrong schema"
+            errorColName = error.path[0] if len(error.path) > 0 else "Wrong schema"
+            errorMsg = error.message[0:500]
+            errorVal = error.instance if len(error.path) > 0 else "Wrong schema"
 
-                val_errors, val_warnings =  GenerateError.generate_schema_error(row_num = errorRow, attribute_name = errorColName, error_msg = errorMsg, invalid_entry = errorVal, sg = sg)
+            val_errors, val_warnings =  GenerateError.generate_schema_error(row_num = errorRow, attribute_name = errorColName, error_msg = errorMsg, invalid_entry = errorVal, sg = sg)
 
-                if val_errors:
-                    errors.append(val_errors)
-                if val_warnings:
-                    warnings.append(val_warnings)
+            if val_errors:
+                errors.append(val_errors)
+            if val_warnings:
+                warnings.append(val_warnings)
 
         return errors, warnings
 
 
-def validate_all(self, errors, warnings, manifest, manifestPath, sg, jsonSchema, restrict_rules, project_scope: List):
+class _ColumnState:
+    """Running state of a rule validated over a whole column, fed one chunk at a time (see iter_validate_manifest)."""
+
+    def __init__(self, rule_plan: RulePlan, col: str) -> None:
+        self.rule_plan = rule_plan
+        self.col = col
+
+    def update(self, manifest_col: pd.core.series.Series, row_offset: int) -> None:
+        """Add a chunk of the column, whose first row is at position row_offset of the manifest."""
+        raise NotImplementedError
+
+    def finish(self, vm: ValidateManifest, sg: SchemaGenerator, project_scope: List) -> (List[List[str]], List[List[str]]):
+        """Errors and warnings of the rule for the whole column."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _content_messages(error: List, warning: List) -> (List[List[str]], List[List[str]]):
+        """Lists of the error and warning of GenerateError.generate_content_error, as collected by generate_errors."""
+        return ([error] if error else []), ([warning] if warning else [])
+
+
+class _UniqueState(_ColumnState):
+    """Duplicated values of a column, as reported by expect_column_values_to_be_unique."""
+
+    def __init__(self, rule_plan: RulePlan, col: str) -> None:
+        super().__init__(rule_plan, col)
+        # position of the first row of each value, and whether the value is duplicated
+        self.first_rows = {}
+        self.duplicated = set()
+        # positions and values of the rows of duplicated values, one array per chunk
+        self.duplicate_rows = []
+        self.duplicate_values = []
+
+    def update(self, manifest_col: pd.core.series.Series, row_offset: int) -> None:
+        values = manifest_col[manifest_col.notna()]
+        rows = row_offset + np.flatnonzero(manifest_col.notna().to_numpy())
+
+        seen = values.map(self.first_rows.__contains__).to_numpy(dtype=bool)
+        duplicates = seen | values.duplicated(keep=False).to_numpy()
+
+        # the first rows of values seen in previous chunks are reported once they are duplicated
+        first_duplicates = [value for value in pd.unique(values[seen]) if value not in self.duplicated]
+        if first_duplicates:
+            self.duplicated.update(first_duplicates)
+            self._add_duplicates([self.first_rows[value] for value in first_duplicates], first_duplicates)
+
+        new_values = values[~seen]
+        first_new = ~new_values.duplicated().to_numpy()
+        self.first_rows.update(zip(new_values[first_new], rows[~seen][first_new]))
+        self.duplicated.update(values[duplicates])
+
+        self._add_duplicates(rows[duplicates], values[duplicates])
+
+    def _add_duplicates(self, rows, values) -> None:
+        self.duplicate_rows.append(np.asarray(rows, dtype=np.int64))
+        values_array = np.empty(len(values), dtype=object)
+        values_array[:] = list(values)
+        self.duplicate_values.append(values_array)
+
+    def finish(self, vm: ValidateManifest, sg: SchemaGenerator, project_scope: List):
+        duplicate_rows = np.concatenate(self.duplicate_rows) if self.duplicate_rows else []
+        if not len(duplicate_rows):
+            return [], []
+
+        # rows are reported in the order of the manifest, as by Great Expectations
+        order = np.argsort(duplicate_rows, kind="stable")
+        return self._content_messages(*GenerateError.generate_content_error(
+            val_rule=self.rule_plan.rule,
+            attribute_name=self.col,
+            row_num=list(duplicate_rows[order] + 2),
+            error_val=list(np.concatenate(self.duplicate_values)[order]),
+            sg=sg,
+        ))
+
+
+class _RecommendedState(_ColumnState):
+    """Whether a recommended column has a value, as checked by expect_column_values_to_not_match_regex_list."""
+
+    def __init__(self, rule_plan: RulePlan, col: str) -> None:
+        super().__init__(rule_plan, col)
+        self.filled = False
+
+    def update(self, manifest_col: pd.core.series.Series, row_offset: int) -> None:
+        if not self.filled:
+            self.filled = bool((manifest_col.notna() & (manifest_col != "")).any())
+
+    def finish(self, vm: ValidateManifest, sg: SchemaGenerator, project_scope: List):
+        if self.filled:
+            return [], []
+
+        return self._content_messages(*GenerateError.generate_content_error(
+            val_rule=self.rule_plan.rule, attribute_name=self.col, sg=sg,
+        ))
+
+
+class _CrossManifestState(_ColumnState):
+    """Values of a column with a cross manifest rule, kept as codes of its distinct values."""
+
+    def __init__(self, rule_plan: RulePlan, col: str) -> None:
+        super().__init__(rule_plan, col)
+        self.codes_by_value = {}
+        self.uniques = []
+        self.codes = []
+
+    def update(self, manifest_col: pd.core.series.Series, row_offset: int) -> None:
+        chunk_codes, chunk_uniques = pd.factorize(manifest_col)
+        chunk_uniques = list(chunk_uniques)
+        # missing values get code -1, kept as an additional distinct value
+        if (chunk_codes == -1).any():
+            chunk_codes = np.where(chunk_codes == -1, len(chunk_uniques), chunk_codes)
+            chunk_uniques.append(None)
+
+        codes = []
+        for value in chunk_uniques:
+            if value not in self.codes_by_value:
+                self.codes_by_value[value] = len(self.uniques)
+                self.uniques.append(value)
+            codes.append(self.codes_by_value[value])
+
+        self.codes.append(np.array(codes, dtype=np.int64).take(chunk_codes))
+
+    def finish(self, vm: ValidateManifest, sg: SchemaGenerator, project_scope: List):
+        uniques = np.empty(len(self.uniques), dtype=object)
+        for i, value in enumerate(self.uniques):
+            uniques[i] = value
+        codes = np.concatenate(self.codes) if self.codes else np.array([], dtype=np.int64)
+        manifest_col = pd.Series(uniques.take(codes), name=self.col, dtype=object)
+
+        return ValidateAttribute.cross_validation(
+            vm, self.rule_plan.rule, manifest_col, project_scope, sg,
+        )
+
+
+# running states of the column global rules, by rule; other column global rules are cross manifest rules
+_COLUMN_STATES = {
+    "unique": _UniqueState,
+    "recommended": _RecommendedState,
+}
+
+
+# validator of the worker processes of validate_manifest_rules, see _init_validation_worker
+_worker_validator = None
+
+
+def _init_validation_worker(sg: SchemaGenerator) -> None:
+    global _worker_validator
+    _worker_validator = ValidateManifest([], None, None, sg, None)
+
+
+def _validate_column(col: str, manifest_col: pd.core.series.Series, restrict_rules: bool, project_scope: List):
+    attribute_plan = get_attribute_plan(_worker_validator.sg, col)
+
+    return _worker_validator.validate_column_rules(
+        manifest_col, attribute_plan, _worker_validator.sg, restrict_rules, project_scope
+    )
+
+
+def validate_all(self, errors, warnings, manifest, manifestPath, sg, jsonSchema, restrict_rules, project_scope: List, workers: int = 1):
     vm = ValidateManifest(errors, manifest, manifestPath, sg, jsonSchema)
-    manifest, vmr_errors, vmr_warnings = vm.validate_manifest_rules(manifest, sg, restrict_rules, project_scope)
+    manifest, vmr_errors, vmr_warnings = vm.validate_manifest_rules(manifest, sg, restrict_rules, project_scope, workers)
     if vmr_errors:
         errors.extend(vmr_errors)
     if vmr_warnings:
@@ -0,0 +1,212 @@
+import logging
+import re
+import threading
+import weakref
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.validate_rules_utils import validation_rule_info
+from schematic.utils.validate_utils import rule_in_rule_list
+
+logger = logging.getLogger(__name__)
+
+
+# rules validated by ValidateAttribute, without Great Expectations
+IN_HOUSE_RULES = [
+    "int",
+    "float",
+    "num",
+    "str",
+    "regex.*",
+    "url",
+    "list",
+    "matchAtLeastOne.*",
+    "matchExactlyOne.*",
+]
+
+# rules without a Great Expectations expectation, see GreatExpectationsHelpers.build_expectation_suite
+UNIMPLEMENTED_EXPECTATIONS = [
+    "url",
+    "list",
+    "regex.*",
+    "matchAtLeastOne.*",
+    "matchExactlyOne.*",
+]
+
+# rules validated over whole columns, besides cross manifest rules
+COLUMN_GLOBAL_RULES = ["unique", "recommended"]
+
+RULE_INFO = validation_rule_info()
+
+# message level of a RulePlan that was not determined yet
+_UNSET = object()
+
+
+def get_rule_message_level(val_rule: str, required: bool) -> Optional[str]:
+    """Level of the messages raised for a validation rule, see GenerateError.get_message_level.
+
+    Args:
+        val_rule: validation rule, or 'schema' for JSON schema validation.
+        required: whether the attribute the rule is set for is required.
+
+    Returns:
+        'error', 'warning' or None.
+    """
+    rule_parts = val_rule.split(" ")
+
+    # raise warnings for attributes that are not required, unless the rule is recommended
+    if not required and "recommended" not in val_rule:
+        return "warning"
+
+    # Parse rule for level, set to default if not specified
+    if rule_parts[-1].lower() == "error" or rule_parts[0] == "schema":
+        return "error"
+    elif rule_parts[-1].lower() == "warning":
+        return "warning"
+
+    return RULE_INFO[rule_parts[0]]["default_message_level"]
+
+
+class RulePlan:
+    """A validation rule of an attribute, parsed once (see AttributePlan)."""
+
+    def __init__(self, rule: str, required: Optional[bool]) -> None:
+        """
+        Args:
+            rule: validation rule, e.g. 'regex search [a-f]'.
+            required: whether the attribute is required, None if it is not in the data model.
+        """
+        self.rule = rule
+        self.required = required
+
+        rule_parts = rule.split(" ")
+        self.kind = rule_parts[0]
+        self.args = rule_parts[1:]
+
+        # name of the ValidateAttribute method that validates the rule, if the rule is known
+        self.method = RULE_INFO[self.kind]["type"] if self.kind in RULE_INFO else None
+        self.in_house = bool(rule_in_rule_list(rule, IN_HOUSE_RULES))
+        self.has_expectation = not rule_in_rule_list(rule, UNIMPLEMENTED_EXPECTATIONS)
+        # whether the result of the rule for a row depends on the other rows of the column
+        self.column_global = self.kind in COLUMN_GLOBAL_RULES or self.method == "cross_validation"
+
+        # compiled regular expression of regex rules, if valid
+        self.pattern = None
+        if self.kind == "regex" and len(self.args) > 1:
+            try:
+                self.pattern = re.compile(self.args[1])
+            except re.error:
+                pass
+
+        self._message_level = _UNSET
+
+    @property
+    def message_level(self) -> Optional[str]:
+        """Level of the messages raised for the rule, see get_rule_message_level."""
+        if self._message_level is _UNSET:
+            self._message_level = get_rule_message_level(self.rule, self.required)
+
+        return self._message_level
+
+    def engine(self, restrict_rules: bool) -> Optional[str]:
+        """Which engine validates the rule: 'ge' (Great Expectations), 'in_house' (ValidateAttribute) or None.
+
+        Rules with expectations are validated by Great Expectations, unless restrict_rules is set, in which
+        case only the rules that are implemented in house are validated.
+        """
+        if not self.has_expectation or (self.in_house and restrict_rules):
+            return "in_house" if self.in_house else None
+
+        return None if restrict_rules else "ge"
+
+
+class AttributePlan:
+    """The validation rules of an attribute of a data model, compiled once per data model.
+
+    Use get_attribute_plan to get the plan of an attribute.
+    """
+
+    def __init__(self, sg: SchemaGenerator, attribute: str) -> None:
+        """
+        Args:
+            sg: SchemaGenerator of the data model.
+            attribute: display name of the attribute, i.e. manifest column.
+        """
+        self.attribute = attribute
+        self.validation_rules = sg.get_node_validation_rules(attribute)
+        self.required = (
+            sg.is_node_required(attribute) if sg.get_node_label(attribute) else None
+        )
+        self.rules = [RulePlan(rule, self.required) for rule in self.validation_rules]
+
+        # plans of rules, including rules that are not set for the attribute (e.g. 'schema')
+        self._rule_plans = {rule_plan.rule: rule_plan for rule_plan in self.rules}
+
+    def rule_plan(self, rule: str) -> RulePlan:
+        """Plan of a validation rule for the attribute."""
+        rule_plan = self._rule_plans.get(rule)
+
+        if rule_plan is None:
+            rule_plan = self._rule_plans.setdefault(rule, RulePlan(rule, self.required))
+
+        return rule_plan
+
+
+# maximum number of data models whose plans are kept, by content hash
+max_cached_models = 32
+
+# attribute plans of unchanged data models (by SHA-256 of their JSON-LD), shared by all SchemaGenerator objects
+_plans_by_schema = OrderedDict()
+# (schema version, attribute plans) of data models without a content hash, e.g. edited ones
+_plans_by_explorer = weakref.WeakKeyDictionary()
+_plans_lock = threading.Lock()
+
+
+def _get_attribute_plans(sg: SchemaGenerator) -> Dict[str, AttributePlan]:
+    schema_hash = sg.se.get_schema_hash()
+
+    with _plans_lock:
+        if schema_hash is not None:
+            plans = _plans_by_schema.get(schema_hash)
+            if plans is None:
+                plans = _plans_by_schema[schema_hash] = {}
+            _plans_by_schema.move_to_end(schema_hash)
+            if len(_plans_by_schema) > max_cached_models:
+                _plans_by_schema.popitem(last=False)
+            return plans
+
+        schema_version = sg.se.get_schema_version()
+        entry = _plans_by_explorer.get(sg.se)
+        if entry is None or entry[0] != schema_version:
+            entry = _plans_by_explorer[sg.se] = (schema_version, {})
+
+        return entry[1]
+
+
+def get_attribute_plan(sg: SchemaGenerator, attribute: str) -> AttributePlan:
+    """Compiled validation rules of an attribute.
+
+    Plans are compiled once per data model and attribute: they are shared by all SchemaGenerator objects of an
+    unchanged data model (see SchemaExplorer.get_schema_hash), and recompiled after a data model is edited.
+
+    Args:
+        sg: SchemaGenerator of the data model.
+        attribute: display name of the attribute, i.e. manifest column.
+
+    Returns:
+        Plan of the attribute.
+    """
+    plans = _get_attribute_plans(sg)
+    plan = plans.get(attribute)
+
+    if plan is None:
+        plan = plans.setdefault(attribute, AttributePlan(sg, attribute))
+
+    return plan
+
+
+def get_validation_plan(sg: SchemaGenerator, attributes: List[str]) -> List[AttributePlan]:
+    """Plans of the attributes of a manifest, in order, see get_attribute_plan."""
+    return [get_attribute_plan(sg, attribute) for attribute in attributes]
@@ -1,3 +1,4 @@
 from schematic.schemas.explorer import SchemaExplorer
 from schematic.schemas.generator import SchemaGenerator
+from schematic.schemas.snapshot import SchemaSnapshot
 from schematic.schemas.validator import SchemaValidator
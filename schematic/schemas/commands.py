@@ -2,11 +2,13 @@
 
 import click
 import click_log
+import json
 import logging
 import sys
 import re
 
 from schematic.schemas.df_parser import _convert_csv_to_data_model
+from schematic.schemas.diff import diff_schema_files
 from schematic.utils.cli_utils import query_dict
 from schematic.help import schema_commands
 
@@ -73,3 +75,31 @@ def convert(schema_csv, base_schema, output_jsonld):
     except:
         click.echo(f"The Data Model could not be created by using '{output_jsonld}' location. Please check your file path again")
 
+
+@schema.command(
+    "diff",
+    options_metavar="<options>",
+    short_help=query_dict(schema_commands, ("schema", "diff", "short_help")),
+)
+@click_log.simple_verbosity_option(logger)
+@click.argument("old_jsonld", metavar="<OLD_JSON-LD_SCHEMA>", nargs=1)
+@click.argument("new_jsonld", metavar="<NEW_JSON-LD_SCHEMA>", nargs=1)
+@click.option(
+    "--output_json",
+    "-o",
+    metavar="<OUTPUT_PATH>",
+    help=query_dict(schema_commands, ("schema", "diff", "output_json")),
+)
+def diff(old_jsonld, new_jsonld, output_json):
+    """
+    Running CLI to compare two versions of a data model (paths or URLs of JSON-LD files)
+    and output the changed components, attributes, valid values and validation rules.
+    """
+    change_set = diff_schema_files(old_jsonld, new_jsonld)
+
+    if output_json is None:
+        click.echo(json.dumps(change_set, indent=2))
+    else:
+        with open(output_json, "w", encoding="utf8") as f:
+            json.dump(change_set, f, indent=2)
+        click.echo(f"The changes between the data models were saved to '{output_json}'.")
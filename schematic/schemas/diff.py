@@ -0,0 +1,196 @@
+import hashlib
+import json
+import logging
+
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Set
+
+import networkx as nx
+
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.utils.schema_utils import RELATIONSHIP_KEYS
+
+logger = logging.getLogger(__name__)
+
+
+# relationships along which the JSON schema (and so the manifest template and validation) of a component
+# depends on other nodes, see SchemaGenerator.get_json_schema_requirements
+DEPENDENCY_RELATIONSHIPS = ["requiresDependency", "rangeValue"]
+
+
+def node_content_hashes(schema_graph: nx.MultiDiGraph) -> Dict[Hashable, str]:
+    """Hash of the attributes of each node of a schema graph, independent of attribute order.
+
+    Args:
+        schema_graph: schema graph, see SchemaExplorer.get_nx_schema.
+
+    Returns:
+        Node to hex digest of its attributes.
+    """
+    return {
+        node: hashlib.sha1(
+            json.dumps(attrs, sort_keys=True, default=str).encode("utf8")
+        ).hexdigest()
+        for node, attrs in schema_graph.nodes(data=True)
+    }
+
+
+def _sorted(nodes: Iterable[Hashable]) -> List[Hashable]:
+    return sorted(nodes, key=str)
+
+
+def _reverse_reachable(
+    sources: Set[Hashable], digraphs: List[nx.DiGraph]
+) -> Set[Hashable]:
+    """Nodes from which any of the sources can be reached along the edges of any of the digraphs."""
+    reached = set(sources)
+    queue = deque(sources)
+
+    while queue:
+        node = queue.popleft()
+        for digraph in digraphs:
+            if node in digraph:
+                for predecessor in digraph.pred[node]:
+                    if predecessor not in reached:
+                        reached.add(predecessor)
+                        queue.append(predecessor)
+
+    return reached
+
+
+def diff_schemas(old_se: SchemaExplorer, new_se: SchemaExplorer) -> Dict[str, Any]:
+    """Compare two versions of a data model.
+
+    Nodes are compared by content hash (see node_content_hashes) and only the nodes whose hashes differ are
+    compared attribute by attribute; edges are compared as sets, per relationship. The time taken is linear in
+    the size of the data models.
+
+    Args:
+        old_se: SchemaExplorer with the old version of the data model loaded.
+        new_se: SchemaExplorer with the new version of the data model loaded.
+
+    Returns:
+        Change set, with JSON serializable values:
+            "nodes": "added" and "removed" nodes, and "changed" nodes with the names of their changed attributes;
+            "edges": for each relationship with changes, "added" and "removed" [source, target] edges;
+            "valid_values": for each attribute with changed valid values (rangeValue edges), the "added" and
+                "removed" valid values;
+            "validation_rules": for each node with changed validation rules, its "old" and "new" rules;
+            "components": "added" and "removed" components (nodes with a requiresComponent relationship), and
+                "affected" components of either version whose JSON schema, manifest template or validation
+                results may have changed, i.e. which depend (through requiresDependency and rangeValue
+                relationships) on a changed node or edge, or whose required components changed.
+    """
+    old_graph = old_se.get_nx_schema()
+    new_graph = new_se.get_nx_schema()
+
+    old_hashes = node_content_hashes(old_graph)
+    new_hashes = node_content_hashes(new_graph)
+
+    added_nodes = [node for node in new_hashes if node not in old_hashes]
+    removed_nodes = [node for node in old_hashes if node not in new_hashes]
+
+    changed_nodes = {}
+    validation_rules = {}
+    for node, new_hash in new_hashes.items():
+        if node not in old_hashes or old_hashes[node] == new_hash:
+            continue
+
+        old_attrs = old_graph.nodes[node]
+        new_attrs = new_graph.nodes[node]
+        changed_nodes[node] = sorted(
+            name
+            for name in set(old_attrs) | set(new_attrs)
+            if old_attrs.get(name) != new_attrs.get(name)
+        )
+
+        if "validationRules" in changed_nodes[node]:
+            validation_rules[node] = {
+                "old": old_attrs.get("validationRules", []),
+                "new": new_attrs.get("validationRules", []),
+            }
+
+    edges = {}
+    valid_values = {}
+    # nodes whose outgoing edges changed, for each relationship
+    changed_sources = {}
+    for relationship in RELATIONSHIP_KEYS:
+        old_edges = set(old_se.get_digraph_by_edge_type(relationship).edges)
+        new_edges = set(new_se.get_digraph_by_edge_type(relationship).edges)
+
+        added_edges = new_edges - old_edges
+        removed_edges = old_edges - new_edges
+        if not (added_edges or removed_edges):
+            continue
+
+        edges[relationship] = {
+            "added": [list(edge) for edge in _sorted(added_edges)],
+            "removed": [list(edge) for edge in _sorted(removed_edges)],
+        }
+        changed_sources[relationship] = {u for (u, v) in added_edges | removed_edges}
+
+        if relationship == "rangeValue":
+            for (change, changed_edges) in (("added", added_edges), ("removed", removed_edges)):
+                for (attribute, value) in changed_edges:
+                    valid_values.setdefault(
+                        attribute, {"added": [], "removed": []}
+                    )[change].append(value)
+
+    for attribute_values in valid_values.values():
+        for change in ("added", "removed"):
+            attribute_values[change] = _sorted(attribute_values[change])
+
+    old_components = set(old_se.get_digraph_by_edge_type("requiresComponent"))
+    new_components = set(new_se.get_digraph_by_edge_type("requiresComponent"))
+
+    # nodes whose content changed, or whose dependencies changed
+    changed = set(added_nodes) | set(removed_nodes) | set(changed_nodes)
+    for relationship in DEPENDENCY_RELATIONSHIPS:
+        changed |= changed_sources.get(relationship, set())
+
+    dependents = _reverse_reachable(
+        changed,
+        [
+            se.get_digraph_by_edge_type(relationship)
+            for se in (old_se, new_se)
+            for relationship in DEPENDENCY_RELATIONSHIPS
+        ],
+    )
+    affected_components = (
+        dependents | changed_sources.get("requiresComponent", set())
+    ) & (old_components | new_components)
+
+    change_set = {
+        "nodes": {
+            "added": _sorted(added_nodes),
+            "removed": _sorted(removed_nodes),
+            "changed": {node: changed_nodes[node] for node in _sorted(changed_nodes)},
+        },
+        "edges": edges,
+        "valid_values": {node: valid_values[node] for node in _sorted(valid_values)},
+        "validation_rules": {
+            node: validation_rules[node] for node in _sorted(validation_rules)
+        },
+        "components": {
+            "added": _sorted(new_components - old_components),
+            "removed": _sorted(old_components - new_components),
+            "affected": _sorted(affected_components),
+        },
+    }
+
+    logger.debug(
+        f"{len(changed)} nodes changed, {len(affected_components)} components affected."
+    )
+
+    return change_set
+
+
+def diff_schema_files(old_schema: str, new_schema: str) -> Dict[str, Any]:
+    """Compare two versions of a data model given by path or URL of their JSON-LD, see diff_schemas."""
+    old_se = SchemaExplorer()
+    old_se.load_schema(old_schema)
+
+    new_se = SchemaExplorer()
+    new_se.load_schema(new_schema)
+
+    return diff_schemas(old_se, new_se)
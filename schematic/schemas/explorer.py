@@ -1,9 +1,12 @@
 import os
+import copy
 import string
 import json
 import logging
+import threading
 
-from typing import Any, Dict, Optional, Text, List
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Text, List, Tuple
 
 import inflection
 import networkx as nx
@@ -18,12 +21,35 @@ from schematic.utils.curie_utils import (
     extract_name_from_uri_or_curie,
 )
 from schematic.utils.general import find_duplicates
-from schematic.utils.io_utils import load_default, load_json, load_schemaorg
+from schematic.utils.cli_utils import query_dict
+from schematic.utils.compact_graph import CompactDiGraph
+from schematic.utils.cache_utils import (
+    get_schematic_version,
+    hash_bytes,
+    load_cached_object,
+    store_cached_object,
+)
+from schematic.utils.io_utils import (
+    get_default_path,
+    load_bytes,
+    load_default,
+    load_json,
+    load_schemaorg,
+)
 from schematic.utils.schema_utils import (
-    load_schema_into_networkx,
+    build_schema_graph,
     node_attrs_cleanup,
     class_to_node,
     relationship_edges,
+    build_relationship_index,
+    build_closure_index,
+    ClosureIndex,
+    empty_relationship_index,
+    build_schema_record_index,
+    compile_schema,
+    COMPILED_SCHEMA_VERSION,
+    index_schema_record,
+    unindex_schema_record,
 )
 from schematic.utils.general import dict2list, unlist
 from schematic.utils.viz_utils import visualize
@@ -33,6 +59,7 @@ from schematic.utils.validate_utils import (
     validate_schema,
 )
 from schematic.schemas.curie import uri2curie, curie2uri
+from schematic import CONFIG
 
 namespaces = dict(rdf=Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#"))
 
@@ -40,29 +67,305 @@ namespaces = dict(rdf=Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#"))
 logger = logging.getLogger(__name__)
 
 
+def _copy_info(info: dict) -> Dict[str, Any]:
+    """Copy of a cached explore_class / explore_property result, with its own lists, for the caller to modify."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in info.items()}
+
+
+def _use_compact_graph() -> bool:
+    """Whether schema graphs are compact by default, as set by (model > graph > compact) in the configuration."""
+    try:
+        return bool(query_dict(CONFIG.DATA, ("model", "graph", "compact")))
+    except AttributeError:
+        # no configuration loaded
+        return False
+
+
+def _load_compiled_schema(
+    schema_bytes: bytes, schema_hash: Optional[str] = None, compact: bool = False
+) -> Dict[str, Any]:
+    """Compile a JSON-LD schema document into its graph and indexes (see compile_schema).
+
+    The compiled schema is cached on disk (see schematic.utils.cache_utils), addressed by the SHA-256 of the
+    document (schema_hash, computed if not given) and the schematic version, so an unchanged data model is only
+    parsed once.
+    """
+    if schema_hash is None:
+        schema_hash = hash_bytes(schema_bytes)
+
+    key = f"{schema_hash}-{COMPILED_SCHEMA_VERSION}-schematic{get_schematic_version()}-nx{nx.__version__}"
+    if compact:
+        key += "-compact"
+
+    compiled = load_cached_object("compiled_models", key)
+
+    if compiled is None:
+        compiled = compile_schema(json.loads(schema_bytes.decode("utf8")), compact)
+        store_cached_object("compiled_models", key, compiled)
+
+    return compiled
+
+
+# default (biothings) schema, compiled once per process (per graph representation) and shared by all
+# SchemaExplorer objects
+_default_compiled_schemas = {}
+_default_compiled_schema_lock = threading.Lock()
+
+# closure indexes are added to relationship indexes, which can be shared, on first use (see get_closure_index)
+_closure_index_lock = threading.Lock()
+
+
+def _get_default_compiled_schema(compact: bool = False) -> Dict[str, Any]:
+    with _default_compiled_schema_lock:
+        if compact not in _default_compiled_schemas:
+            _default_compiled_schemas[compact] = _load_compiled_schema(
+                load_bytes(get_default_path()), compact=compact
+            )
+
+    return _default_compiled_schemas[compact]
+
+
 class SchemaExplorer:
-    """Class for exploring schema"""
+    """Class for exploring schema
+
+    The default (biothings) schema is only loaded when the schema is first accessed, unless another schema
+    was loaded with load_schema before.
+
+    With compact_graph, the schema graph is a read-only networkx graph backed by a CompactSchemaGraph
+    (see schematic.utils.compact_graph), which uses less memory for large data models. Editing the graph in
+    place (edit_schema_object_nx, add_schema_object_nx) turns it into a regular networkx graph.
+    """
+
+    # maximum number of explore_class / explore_property results kept in memory
+    explore_cache_size = 4096
+
+    # maximum number of paths returned by find_parent_classes; classes inheriting from several classes can have
+    # exponentially many paths to their root classes
+    max_parent_paths = 1000
 
-    def __init__(self):
-        self.load_default_schema()
+    # attributes that are set when a schema is loaded
+    _schema_attributes = ("schema", "schema_nx", "_relationship_index", "_record_index")
+
+    def __init__(self, compact_graph: Optional[bool] = None):
+        """
+        Args:
+            compact_graph: if True, use a compact schema graph; defaults to (model > graph > compact) in the
+                configuration, or False.
+        """
+        self.compact_graph = _use_compact_graph() if compact_graph is None else compact_graph
+        self._schema_version = 0
+        self._explore_cache = OrderedDict()
+        self._shared_schema = False
+        # ((schema version, max paths), {class: (paths, truncated)}), see _get_parent_paths
+        self._parent_paths = None
+        # (schema version, SHA-256 of the loaded JSON-LD document), see get_schema_hash
+        self._schema_hash = None
+
+    def __getattr__(self, name):
+        # only called when the attribute is missing, i.e. before any schema was loaded
+        if name in SchemaExplorer._schema_attributes:
+            self.load_default_schema()
+            return getattr(self, name)
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def load_schema(self, schema):
         """Load schema and convert it to networkx graph"""
-        self.schema = load_json(schema)
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.load_schema_bytes(load_bytes(schema))
+
+    def load_schema_bytes(self, schema_bytes: bytes, schema_hash: Optional[str] = None) -> None:
+        """Load a schema from the content of a JSON-LD document (and its hash, computed if not given), see load_schema."""
+        if schema_hash is None:
+            schema_hash = hash_bytes(schema_bytes)
+
+        self._set_compiled_schema(
+            _load_compiled_schema(schema_bytes, schema_hash, self.compact_graph)
+        )
+        self._schema_hash = (self._schema_version, schema_hash)
+
+    def _set_compiled_schema(self, compiled: Dict[str, Any], shared: bool = False) -> None:
+        """Set the schema, its graph and indexes from a compiled schema.
+
+        Args:
+            compiled: compiled schema, see compile_schema.
+            shared: if True, the compiled schema is shared with other SchemaExplorer objects and is copied
+                before the schema is edited (see _unshare_schema).
+        """
+        self.schema = compiled["schema"]
+        self.schema_nx = compiled["schema_nx"]
+        self._relationship_index = compiled["relationship_index"]
+        self._record_index = compiled["record_index"]
+        self._shared_schema = shared
+        self._schema_changed()
+
+    def share_compiled_schema(self) -> Dict[str, Any]:
+        """Get the compiled schema (see compile_schema) to share it with other SchemaExplorer objects.
+
+        The shared schema graph is a frozen copy of the schema graph, unless it is read-only already, and this
+        SchemaExplorer copies the schema and record index before it is next edited, so the returned structures
+        are not modified afterwards (see load_shared_schema and SchemaSnapshot). Closure indexes, which are
+        added to the relationship index on first use, are built under a lock (see get_closure_index).
+        """
+        if self._relationship_index is None:
+            self._relationship_index = build_relationship_index(self.schema_nx)
+
+        schema_nx = self.schema_nx
+        if not nx.is_frozen(schema_nx):
+            # the graph may be the default schema graph, which other SchemaExplorer objects share
+            schema_nx = nx.freeze(schema_nx.copy())
+
+        self._shared_schema = True
+
+        return {
+            "schema": self.schema,
+            "schema_nx": schema_nx,
+            "relationship_index": self._relationship_index,
+            "record_index": self._record_index,
+        }
+
+    def load_shared_schema(self, compiled: Dict[str, Any], schema_hash: Optional[str] = None) -> None:
+        """Load a compiled schema shared with other SchemaExplorer objects; it is copied before it is edited.
+
+        Args:
+            compiled: compiled schema, see share_compiled_schema.
+            schema_hash: SHA-256 of the JSON-LD document the schema was loaded from, if unedited (see get_schema_hash).
+        """
+        self._set_compiled_schema(compiled, shared=True)
+
+        if schema_hash is not None:
+            self._schema_hash = (self._schema_version, schema_hash)
+
+    def _unshare_schema(self) -> None:
+        """Copy a shared schema (e.g. the default schema) before it is edited, so that other SchemaExplorer objects are unaffected."""
+        if self._shared_schema:
+            self.schema = copy.deepcopy(self.schema)
+            if not nx.is_frozen(self.schema_nx):
+                self.schema_nx = copy.deepcopy(self.schema_nx)
+            self._record_index = copy.deepcopy(self._record_index)
+            # the relationship index and read-only (compact) graphs are replaced by edits, not modified
+            self._shared_schema = False
+
+    def _get_mutable_nx_schema(self) -> nx.MultiDiGraph:
+        """Get the schema graph for editing in place, converting a read-only (compact) graph to a networkx graph."""
+        self._unshare_schema()
+
+        if nx.is_frozen(self.schema_nx):
+            self.schema_nx = nx.MultiDiGraph(self.schema_nx)
+
+        return self.schema_nx
 
     def export_schema(self, file_path):
         with open(file_path, "w",encoding="utf8") as f:
             json.dump(self.schema, f, sort_keys=True, indent=4, ensure_ascii=False)
 
     def load_default_schema(self):
-        """Load default schema, either schema.org or biothings"""
-        self.schema = load_default()
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        """Load default schema, either schema.org or biothings
+
+        The default schema is parsed once per process and shared (read-only) by all SchemaExplorer objects until
+        they edit it.
+        """
+        self._set_compiled_schema(
+            _get_default_compiled_schema(self.compact_graph), shared=True
+        )
 
     def get_nx_schema(self):
         return self.schema_nx
 
+    def get_schema_version(self) -> int:
+        """Get the version of the loaded schema, incremented every time the schema is loaded or edited."""
+        return self._schema_version
+
+    def get_schema_hash(self) -> Optional[str]:
+        """Get the SHA-256 of the JSON-LD document the schema was loaded from.
+
+        Returns:
+            The hash, or None if the schema was not loaded with load_schema or was edited since.
+        """
+        if self._schema_hash is None or self._schema_hash[0] != self._schema_version:
+            return None
+
+        return self._schema_hash[1]
+
+    def _schema_changed(self) -> None:
+        """Record a change to the schema; cached explore_class / explore_property results of older versions are dropped."""
+        self._schema_version += 1
+
+    def _get_cached(self, kind: str, label: str, explore) -> Dict[str, Any]:
+        """Get a copy of an explore_class / explore_property result from the bounded per-node cache.
+
+        Entries computed for an older schema version are recomputed; least recently used entries are evicted
+        when the cache is full. Callers get their own copy (see _copy_info), so the cache is never modified.
+        """
+        key = (kind, label)
+        entry = self._explore_cache.get(key)
+
+        if entry is not None and entry[0] == self._schema_version:
+            self._explore_cache.move_to_end(key)
+            return _copy_info(entry[1])
+
+        info = explore(label)
+        self._explore_cache[key] = (self._schema_version, info)
+        self._explore_cache.move_to_end(key)
+
+        if len(self._explore_cache) > self.explore_cache_size:
+            self._explore_cache.popitem(last=False)
+
+        return _copy_info(info)
+
+    def get_relationship_index(self, relationship: str) -> Dict[str, Any]:
+        """Get the index of the schema graph edges of a given relationship type.
+
+        The index is built once per loaded schema and rebuilt lazily after the schema graph is edited in place
+        (see edit_schema_object_nx and add_schema_object_nx).
+
+        Args:
+            relationship: edge / link relationship type (e.g. parentOf, requiresDependency).
+
+        Returns:
+            Dictionary with the (read-only) "digraph" on edges of the given relationship type,
+            and the "successors" and "predecessors" adjacency dicts of that digraph; see also get_closure_index.
+        """
+        if self._relationship_index is None:
+            self._relationship_index = build_relationship_index(self.schema_nx)
+
+        if relationship not in self._relationship_index:
+            return empty_relationship_index()
+
+        return self._relationship_index[relationship]
+
+    def get_closure_index(self, relationship: str) -> Optional[ClosureIndex]:
+        """Get the transitive closure of the digraph of a given relationship type, built once per schema version.
+
+        Args:
+            relationship: edge / link relationship type (e.g. parentOf, requiresComponent).
+
+        Returns:
+            Closure index answering descendant / ancestor queries in topological order, or None if the
+            relationship digraph has a cycle.
+        """
+        rel_index = self.get_relationship_index(relationship)
+
+        if "closure" not in rel_index:
+            # the relationship index may be shared with SchemaExplorer objects of other threads
+            with _closure_index_lock:
+                if "closure" not in rel_index:
+                    rel_index["closure"] = build_closure_index(rel_index["digraph"])
+
+        return rel_index["closure"]
+
+    def _get_closure_index_of_digraph(self, graph: nx.DiGraph) -> Optional[ClosureIndex]:
+        """Get the closure index of graph if it is the (cached) digraph of a relationship, else None."""
+        if self._relationship_index is None:
+            return None
+
+        for relationship, rel_index in self._relationship_index.items():
+            if rel_index["digraph"] is graph:
+                return self.get_closure_index(relationship)
+
+        return None
+
     def get_edges_by_relationship(
         self, class_label: str, relationship: str
     ) -> List[str]:
@@ -78,13 +381,9 @@ class SchemaExplorer:
         Returns:
             List of edges that are connected to the node.
         """
-        edges = []
+        successors = self.get_relationship_index(relationship)["successors"]
 
-        mm_graph = self.get_nx_schema()
-
-        for (u, v, key, c) in mm_graph.out_edges(node, data=True, keys=True):
-            if key == relationship:
-                edges.append((u, v))
+        edges = [(class_label, v) for v in successors.get(class_label, [])]
 
         return edges
 
@@ -109,15 +408,46 @@ class SchemaExplorer:
         Returns:
             List of nodes that are descendants from a particular node (sorted / unsorted)
         """
+        if source_node not in self.schema_nx:
+            raise nx.NetworkXError(f"The node {source_node} is not in the digraph.")
+
+        if connected:
+            if not self.get_relationship_index(relationship)["successors"].get(source_node):
+                # return empty list if there are no nodes that are reachable from the source node based on this relationship type
+                return []
+
+            closure = self.get_closure_index(relationship)
+
+            if closure is not None:
+                # precomputed descendants are (topologically) ordered
+                return [source_node] + closure.descendants(source_node)
+
+            # the relationship digraph has a cycle
+            # nodes reachable from the source node through edges of the given relationship type are, in particular,
+            # reachable in the schema graph, so the traversal can be done on the (cached) relationship digraph directly
+            relationship_subgraph = self.get_digraph_by_edge_type(relationship)
+
+            if isinstance(relationship_subgraph, CompactDiGraph) and relationship_subgraph.compact is not None:
+                # traverse the CSR arrays of the compact graph directly
+                descendants = relationship_subgraph.compact.descendants(source_node, relationship)
+            else:
+                descendants = nx.descendants(relationship_subgraph, source_node)
+            descendants.add(source_node)
+
+            if ordered:
+                # normally, the descendants from a node are unordered (peculiarity of nx descendants call)
+                # form the subgraph on descendants and order it topologically
+                # this assumes an acyclic subgraph
+                descendants = nx.topological_sort(
+                    relationship_subgraph.subgraph(descendants)
+                )
+
+            return list(descendants)
+
         mm_graph = self.get_nx_schema()
 
-        # if mm_graph.has_node(source_node):
         # get all nodes that are reachable from a specified root /source node in the data model
-
         root_descendants = nx.descendants(mm_graph, source_node)
-        # else:
-        # print("The specified source node could not be found im the Networkx graph.")
-        # return []
 
         subgraph_nodes = list(root_descendants)
         subgraph_nodes.append(source_node)
@@ -138,23 +468,7 @@ class SchemaExplorer:
             # return empty list if there are no nodes that are reachable from the source node based on this relationship type
             return []
 
-        if connected and ordered:
-            # get the set of reachable nodes from the source node
-            descendants = nx.descendants(relationship_subgraph, source_node)
-            descendants.add(source_node)
-
-            # normally, the descendants from a node are unordered (peculiarity of nx descendants call)
-            # form the subgraph on descendants and order it topologically
-            # this assumes an acyclic subgraph
-            descendants = nx.topological_sort(
-                relationship_subgraph.subgraph(descendants)
-            )
-        elif connected:
-            # get the nodes that are reachable from a given source node
-            # after the pruning process above some nodes in the root_descendants subgraph might have become disconnected and will be omitted
-            descendants = nx.descendants(relationship_subgraph, source_node)
-            descendants.add(source_node)
-        elif ordered:
+        if ordered:
             # sort the nodes topologically
             # this requires the graph to be an acyclic graph
             descendants = nx.topological_sort(relationship_subgraph)
@@ -173,15 +487,59 @@ class SchemaExplorer:
         Returns:
             List of nodes that are adjacent to the given node.
         """
-        nodes = set()
+        if self._relationship_index is None:
+            # the schema graph was edited in place; looking up the out-edges of a single node
+            # is cheaper than rebuilding the relationship index
+            nodes = []
+            for (u, v, key) in self.schema_nx.out_edges(node, keys=True):
+                if key == relationship and v not in nodes:
+                    nodes.append(v)
 
-        mm_graph = self.get_nx_schema()
+            return nodes
 
-        for (u, v, key, c) in mm_graph.out_edges(node, data=True, keys=True):
-            if key == relationship:
-                nodes.add(v)
+        successors = self.get_relationship_index(relationship)["successors"]
+
+        return list(successors.get(node, []))
+
+    def get_schema_records(self, index_name: str, key: str) -> List[dict]:
+        """Get the records of the JSON-LD schema @graph indexed under a given key, in @graph order.
+
+        Args:
+            index_name: one of "ids" (record @id), "labels" (record rdfs:label),
+                "domain" (class URI in the schema:domainIncludes of an rdf:Property record) or
+                "range" (class URI in the schema:rangeIncludes of an rdf:Property record).
+            key: @id, label or class URI to look up.
+
+        Returns:
+            List of matching records (empty if there are none).
+        """
+        graph = self.schema["@graph"]
+        return [graph[i] for i in self._record_index[index_name].get(key, [])]
+
+    def _get_property_record(self, schema_property: str) -> Optional[dict]:
+        """Get the first rdf:Property record of the JSON-LD schema @graph with a given label."""
+        for record in self.get_schema_records("labels", schema_property):
+            if record["@type"] == "rdf:Property":
+                return record
+
+        return None
+
+    def _get_record_position(self, label: str) -> Optional[int]:
+        """Get the position of the first record of the JSON-LD schema @graph with a given label."""
+        positions = self._record_index["labels"].get(label)
 
-        return list(nodes)
+        return positions[0] if positions else None
+
+    def _replace_schema_record(self, position: int, record: dict) -> None:
+        """Replace the record at a given position of the JSON-LD schema @graph, keeping the record index in sync."""
+        unindex_schema_record(self._record_index, position)
+        self.schema["@graph"][position] = record
+        index_schema_record(self._record_index, position, record)
+
+    def _append_schema_record(self, record: dict) -> None:
+        """Append a record to the JSON-LD schema @graph, keeping the record index in sync."""
+        self.schema["@graph"].append(record)
+        index_schema_record(self._record_index, len(self.schema["@graph"]) - 1, record)
 
     def is_class_in_schema(self, class_label):
         if self.schema_nx.nodes[class_label]:
@@ -214,42 +572,94 @@ class SchemaExplorer:
                     edges.append((_path[i], _path[i + 1]))
             return visualize(edges, size=size)
 
-    def find_parent_classes(self, schema_class):
-        """Find all parents of the class"""
+    def find_parent_classes(self, schema_class, max_paths: Optional[int] = None):
+        """Find all parents of the class
 
-        digraph = self.get_digraph_by_edge_type("parentOf")
+        Args:
+            schema_class: class label.
+            max_paths: maximum number of paths to return, defaults to max_parent_paths.
 
-        root_node = list(nx.topological_sort(digraph))[0]
-        # root_node = list(nx.topological_sort(self.schema_nx))[0]
+        Returns:
+            List of paths of parentOf edges from a root class (a class without parents) to the class; each path
+            lists the classes from the root down to the parent of the class. Paths are grouped by parent,
+            in parent order.
+        """
+        if schema_class not in self.schema_nx:
+            raise nx.NodeNotFound(f"target node {schema_class} not in graph")
 
-        paths = nx.all_simple_paths(
-            self.schema_nx, source=root_node, target=schema_class
+        paths, truncated = self._get_parent_paths(
+            schema_class, max_paths or self.max_parent_paths
         )
-        # print(root_node)
-        return [_path[:-1] for _path in paths]
+
+        if truncated:
+            logger.warning(
+                f"{schema_class} has more than {len(paths)} paths to its root classes; only the first {len(paths)} are returned."
+            )
+
+        return [list(_path[:-1]) for _path in paths]
+
+    def _get_parent_paths(self, schema_class: str, max_paths: int) -> Tuple[List[tuple], bool]:
+        """Get the (memoized) paths from root classes to a class, see find_parent_classes.
+
+        The paths of a class are the paths of its parents extended by the class, so paths are computed once per
+        class, in topological order over the parentOf digraph, and only up to max_paths per class.
+
+        Returns:
+            Tuple of the paths (tuples of classes, ending with the class) and whether paths were left out.
+        """
+        if self._parent_paths is None or self._parent_paths[0] != (self._schema_version, max_paths):
+            self._parent_paths = ((self._schema_version, max_paths), {})
+
+        paths = self._parent_paths[1]
+
+        if schema_class in paths:
+            return paths[schema_class]
+
+        closure = self.get_closure_index("parentOf")
+
+        if closure is None:
+            raise nx.NetworkXUnfeasible("The parentOf graph contains a cycle.")
+
+        if schema_class not in closure:
+            # the class is not part of the class hierarchy
+            return [], False
+
+        digraph = self.get_digraph_by_edge_type("parentOf")
+
+        # ancestors are topologically ordered, so the paths of parents are computed before those of their children
+        for node in closure.ancestors(schema_class) + [schema_class]:
+            if node in paths:
+                continue
+
+            if not digraph.pred[node]:
+                # root class
+                paths[node] = ([(node,)], False)
+                continue
+
+            node_paths = []
+            truncated = False
+
+            for parent in digraph.pred[node]:
+                parent_paths, parent_truncated = paths[parent]
+                truncated = truncated or parent_truncated
+                node_paths.extend(_path + (node,) for _path in parent_paths)
+
+                if len(node_paths) > max_paths:
+                    del node_paths[max_paths:]
+                    truncated = True
+                    break
+
+            paths[node] = (node_paths, truncated)
+
+        return paths[schema_class]
 
     def find_class_specific_properties(self, schema_class):
         """Find properties specifically associated with a given class"""
         schema_uri = self.schema_nx.nodes[schema_class]["uri"]
-        properties = []
-        for record in self.schema["@graph"]:
-            if record["@type"] == "rdf:Property":
-                if (
-                    type(record["schema:domainIncludes"]) == dict
-                    and record["schema:domainIncludes"]["@id"] == schema_uri
-                ):
-                    properties.append(record["rdfs:label"])
-                elif (
-                    type(record["schema:domainIncludes"]) == list
-                    and [
-                        item
-                        for item in record["schema:domainIncludes"]
-                        if item["@id"] == schema_uri
-                    ]
-                    != []
-                ):
-                    properties.append(record["rdfs:label"])
-        return properties
+        return [
+            record["rdfs:label"]
+            for record in self.get_schema_records("domain", schema_uri)
+        ]
 
     def find_all_class_properties(self, schema_class, display_as_table=False):
         """Find all properties associated with a given class
@@ -301,21 +711,15 @@ class SchemaExplorer:
         """Find where a given class is used as a value of a property"""
         usages = []
         schema_uri = self.schema_nx.nodes[schema_class]["uri"]
-        for record in self.schema["@graph"]:
+        for record in self.get_schema_records("range", schema_uri):
             usage = {}
-            if record["@type"] == "rdf:Property":
-                if "schema:rangeIncludes" in record:
-                    p_range = dict2list(record["schema:rangeIncludes"])
-                    for _doc in p_range:
-                        if _doc["@id"] == schema_uri:
-                            usage["property"] = record["rdfs:label"]
-                            p_domain = dict2list(record["schema:domainIncludes"])
-                            usage["property_used_on_class"] = unlist(
-                                [self.uri2label(record["@id"]) for record in p_domain]
-                            )
-                            usage["description"] = record["rdfs:comment"]
-            if usage:
-                usages.append(usage)
+            usage["property"] = record["rdfs:label"]
+            p_domain = dict2list(record["schema:domainIncludes"])
+            usage["property_used_on_class"] = unlist(
+                [self.uri2label(record["@id"]) for record in p_domain]
+            )
+            usage["description"] = record["rdfs:comment"]
+            usages.append(usage)
         return usages
 
     def find_child_classes(self, schema_class):
@@ -327,7 +731,13 @@ class SchemaExplorer:
         return self.get_adjacent_nodes_by_relationship(schema_class, "parentOf")
 
     def explore_class(self, schema_class):
-        """Find details about a specific schema class"""
+        """Find details about a specific schema class
+
+        Results are cached per class until the schema is edited; each call returns a new dictionary.
+        """
+        return self._get_cached("class", schema_class, self._explore_class)
+
+    def _explore_class(self, schema_class):
         parents = []
         if "subClassOf" in self.schema_nx.nodes[schema_class]:
             schema_node_val = self.schema_nx.nodes[schema_class]["subClassOf"]
@@ -474,16 +884,16 @@ class SchemaExplorer:
             property_display_name
         )
 
-        for record in self.schema["@graph"]:
-            if record["@type"] == "rdf:Property":
-                if record["rdfs:label"] == schema_property:
-                    p_domain = dict2list(record["schema:domainIncludes"])
-                    return unlist(
-                        [
-                            self.uri2label(schema_class["@id"])
-                            for schema_class in p_domain
-                        ]
-                    )
+        record = self._get_property_record(schema_property)
+
+        if record:
+            p_domain = dict2list(record["schema:domainIncludes"])
+            return unlist(
+                [
+                    self.uri2label(schema_class["@id"])
+                    for schema_class in p_domain
+                ]
+            )
 
         return None
 
@@ -492,52 +902,57 @@ class SchemaExplorer:
 
     def explore_property(self, schema_property):
         """Find details about a specific property
+
+        Results are cached per property until the schema is edited; each call returns a new dictionary.
+        """
+        return self._get_cached("property", schema_property, self._explore_property)
+
+    def _explore_property(self, schema_property):
+        """
         TODO: refactor so that explore class and explore property reuse logic - they are *very* similar
         """
         property_info = {}
-        for record in self.schema["@graph"]:
-            if record["@type"] == "rdf:Property":
-                if record["rdfs:label"] == schema_property:
-                    property_info["id"] = record["rdfs:label"]
-                    property_info["description"] = record["rdfs:comment"]
-                    property_info["uri"] = curie2uri(record["@id"], namespaces)
-
-                    p_domain = dict2list(record["schema:domainIncludes"])
-                    property_info["domain"] = unlist(
-                        [self.uri2label(record["@id"]) for record in p_domain]
-                    )
-                    if "schema:rangeIncludes" in record:
-                        p_range = dict2list(record["schema:rangeIncludes"])
-                        property_info["range"] = [
-                            self.uri2label(record["@id"]) for record in p_range
-                        ]
-                    else:
-                        property_info["range"] = []
-
-                    if "sms:required" in record:
-                        if "sms:true" == record["sms:required"]:
-                            property_info["required"] = True
-                        else:
-                            property_info["required"] = False
-
-                    validation_rules = []
-                    if "sms:validationRules" in record:
-                        property_info["validation_rules"] = record[
-                            "sms:validationRules"
-                        ]
-
-                    if "sms:requiresDependency" in record:
-                        p_dependencies = dict2list(record["sms:requiresDependency"])
-                        property_info["dependencies"] = [
-                            self.uri2label(record["@id"]) for record in p_dependencies
-                        ]
-                    else:
-                        property_info["dependencies"] = []
+        record = self._get_property_record(schema_property)
 
-                    if "sms:displayName" in record:
-                        property_info["displayName"] = record["sms:displayName"]
+        if record:
+            property_info["id"] = record["rdfs:label"]
+            property_info["description"] = record["rdfs:comment"]
+            property_info["uri"] = curie2uri(record["@id"], namespaces)
 
-                    break
+            p_domain = dict2list(record["schema:domainIncludes"])
+            property_info["domain"] = unlist(
+                [self.uri2label(record["@id"]) for record in p_domain]
+            )
+            if "schema:rangeIncludes" in record:
+                p_range = dict2list(record["schema:rangeIncludes"])
+                property_info["range"] = [
+                    self.uri2label(record["@id"]) for record in p_range
+                ]
+            else:
+                property_info["range"] = []
+
+            if "sms:required" in record:
+                if "sms:true" == record["sms:required"]:
+                    property_info["required"] = True
+                else:
+                    property_info["required"] = False
+
+            validation_rules = []
+            if "sms:validationRules" in record:
+                property_info["validation_rules"] = record[
+                    "sms:validationRules"
+                ]
+
+            if "sms:requiresDependency" in record:
+                p_dependencies = dict2list(record["sms:requiresDependency"])
+                property_info["dependencies"] = [
+                    self.uri2label(record["@id"]) for record in p_dependencies
+                ]
+            else:
+                property_info["dependencies"] = []
+
+            if "sms:displayName" in record:
+                property_info["displayName"] = record["sms:displayName"]
 
         # check if properties are added multiple times
 
@@ -574,48 +989,57 @@ class SchemaExplorer:
 
     def edit_class(self, class_info):
         """Edit an existing class into schema"""
-        for i, schema_class in enumerate(self.schema["@graph"]):
-            if schema_class["rdfs:label"] == class_info["rdfs:label"]:
-                validate_class_schema(class_info)  # why are we doing this in a loop?
+        self._unshare_schema()
+        i = self._get_record_position(class_info["rdfs:label"])
+        if i is not None:
+            validate_class_schema(class_info)
 
-                self.schema["@graph"][i] = class_info
-                break
+            self._replace_schema_record(i, class_info)
 
         # TODO: do we actually need to validate the entire schema if a class is just edited and the class passes validation?
         # validate_schema(self.schema)
 
         logger.info(f"Edited the class {class_info['rdfs:label']} successfully.")
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema_nx = build_schema_graph(self.schema, self.compact_graph)
+        self._relationship_index = build_relationship_index(self.schema_nx)
+        self._schema_changed()
 
     def update_class(self, class_info):
         """Add a new class into schema"""
+        self._unshare_schema()
         # print(class_info)
         validate_class_schema(class_info)
-        self.schema["@graph"].append(class_info)
+        self._append_schema_record(class_info)
         validate_schema(self.schema)
         logger.info(f"Updated the class {class_info['rdfs:label']} successfully.")
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema_nx = build_schema_graph(self.schema, self.compact_graph)
+        self._relationship_index = build_relationship_index(self.schema_nx)
+        self._schema_changed()
 
     def edit_property(self, property_info):
         """Edit an existing property into schema"""
-        for i, schema_property in enumerate(self.schema["@graph"]):
-            if schema_property["rdfs:label"] == property_info["rdfs:label"]:
-                validate_property_schema(property_info)
-                self.schema["@graph"][i] = property_info
+        self._unshare_schema()
+        i = self._get_record_position(property_info["rdfs:label"])
+        if i is not None:
+            validate_property_schema(property_info)
+            self._replace_schema_record(i, property_info)
 
-                # TODO: check if properties are added/edited multiple times (e.g. look at explore_property)
-                break
+            # TODO: check if properties are added/edited multiple times (e.g. look at explore_property)
 
         validate_schema(self.schema)
         logger.info(f"Edited the property {property_info['rdfs:label']} successfully.")
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema_nx = build_schema_graph(self.schema, self.compact_graph)
+        self._relationship_index = build_relationship_index(self.schema_nx)
+        self._schema_changed()
 
     def update_property(self, property_info):
         """Add a new property into schema"""
+        self._unshare_schema()
         validate_property_schema(property_info)
-        self.schema["@graph"].append(property_info)
+        self._append_schema_record(property_info)
         validate_schema(self.schema)
         logger.info(f"Updated the property {property_info['rdfs:label']} successfully.")
+        self._schema_changed()
 
     def get_nodes_descendants(self, graph, component):
         """
@@ -623,6 +1047,11 @@ class SchemaExplorer:
         graph: networkx graph object
         component: any given node
         """
+        closure = self._get_closure_index_of_digraph(graph)
+
+        if closure is not None and component in closure:
+            return closure.descendants(component)
+
         all_descendants = list(nx.descendants(graph, component))
 
         return all_descendants
@@ -633,29 +1062,30 @@ class SchemaExplorer:
         graph: networkx graph object
         component: any given node
         """
+        closure = self._get_closure_index_of_digraph(graph)
+
+        if closure is not None and component in closure:
+            return closure.ancestors(component)
+
         all_ancestors = list(nx.ancestors(graph, component))
 
         return all_ancestors
 
     def get_digraph_by_edge_type(self, edge_type):
+        """Get the (read-only) directed graph on all edges of a given type (aka relationship).
 
-        multi_digraph = self.schema_nx
-
-        digraph = nx.DiGraph()
-        for (u, v, key, c) in multi_digraph.edges(data=True, keys=True):
-            if key == edge_type:
-                digraph.add_edge(u, v)
-
-        # print(nx.find_cycle(digraph, orientation = "ignore"))
-
-        return digraph
+        The digraph is cached in the relationship index; copy it (e.g. nx.DiGraph(digraph)) before modifying it.
+        """
+        return self.get_relationship_index(edge_type)["digraph"]
 
     # version of edit_class() method that directly acts on the networkx graph
     def edit_schema_object_nx(self, schema_object: dict) -> None:
+        self._unshare_schema()
+
         node_to_replace = class_to_node(class_to_convert=schema_object)
 
         # get the networkx graph associated with the SchemaExplorer object in its current state
-        schema_graph_nx = self.get_nx_schema()
+        schema_graph_nx = self._get_mutable_nx_schema()
 
         # outer loop to loop over all the nodes in the graph constructed from master schema
         for node, data in schema_graph_nx.nodes(data=True):
@@ -986,18 +1416,23 @@ class SchemaExplorer:
         # set the networkx schema graph to the the modified networkx schema
         self.schema_nx = schema_graph_nx
 
+        # edges may have changed, the relationship index is rebuilt on next use
+        self._relationship_index = None
+        self._schema_changed()
+
         # print("Added node {} to the graph successfully.".format(schema_object["rdfs:label"]))
 
         # part of the code that replaces the modified class in the original JSON-LD schema (not in the data/ folder though)
-        for i, schema_class in enumerate(self.schema["@graph"]):
-            if schema_class["rdfs:label"] == schema_object["rdfs:label"]:
-                # validate_class_schema(schema_object)    # validate that the class to be modified follows the structure for any generic class (node)
+        i = self._get_record_position(schema_object["rdfs:label"])
+        if i is not None:
+            # validate_class_schema(schema_object)    # validate that the class to be modified follows the structure for any generic class (node)
 
-                self.schema["@graph"][i] = schema_object
-                break
+            self._replace_schema_record(i, schema_object)
 
     # version of update_class() method that directly acts on the networkx graph
     def add_schema_object_nx(self, schema_object: dict, **kwargs: dict) -> None:
+        self._unshare_schema()
+
         node = node_attrs_cleanup(schema_object)
 
         if "required" in node:
@@ -1015,7 +1450,7 @@ class SchemaExplorer:
         node["description"] = schema_object["rdfs:comment"]
 
         # get the networkx graph associated with the SchemaExplorer object in its current state
-        schema_graph_nx = self.get_nx_schema()
+        schema_graph_nx = self._get_mutable_nx_schema()
 
         # add node to graph
         schema_graph_nx.add_node(schema_object["rdfs:label"], **node)
@@ -1025,9 +1460,13 @@ class SchemaExplorer:
         # set the networkx schema graph to the the modified networkx schema
         self.schema_nx = schema_graph_nx
 
+        # edges may have changed, the relationship index is rebuilt on next use
+        self._relationship_index = None
+        self._schema_changed()
+
         # print("Edited node {} successfully.".format(schema_object["rdfs:label"]))
 
         # update the JSON-LD schema after modifying the networkx graph
         # validate_class_schema(schema_object)
-        self.schema["@graph"].append(schema_object)
+        self._append_schema_record(schema_object)
         # validate_schema(self.schema)
@@ -2,11 +2,14 @@ import gc
 import os
 import json
 import logging
-from typing import Any, Dict, Optional, Text, List
+from collections import deque
+from itertools import chain
+from typing import Any, Dict, Optional, Text, List, Tuple
 
 import networkx as nx
 
 from schematic.schemas.explorer import SchemaExplorer
+from schematic.utils.cache_utils import PersistentLRUCache, get_schematic_version
 from schematic.utils.io_utils import load_json
 from schematic.utils.cli_utils import query_dict
 from schematic.utils.schema_utils import load_schema_into_networkx
@@ -17,6 +20,23 @@ from schematic import CONFIG
 logger = logging.getLogger(__name__)
 
 
+def _copy_json(obj: Any) -> Any:
+    """Copy a JSON document (nested dictionaries and lists)."""
+    if isinstance(obj, dict):
+        return {key: _copy_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_json(value) for value in obj]
+    return obj
+
+
+# version of the JSON schemas built by get_json_schema_requirements; bump it when they change to invalidate cached
+# schemas, whose keys otherwise only change with the schematic version
+JSON_SCHEMA_CACHE_VERSION = 1
+
+# JSON schemas of unchanged data models, shared by all SchemaGenerator objects (see get_cached_json_schema_requirements)
+json_schema_cache = PersistentLRUCache("json_schemas", maxsize=128)
+
+
 class SchemaGenerator(object):
     def __init__(
         self,
@@ -26,6 +46,7 @@ class SchemaGenerator(object):
         requires_range: str = "rangeIncludes",
         range_value_relationship: str = "rangeValue",
         requires_component_relationship: str = "requiresComponent",
+        compact_graph: Optional[bool] = None,
     ) -> None:
         """Create / Initialize object of type SchemaGenerator().
 
@@ -39,6 +60,7 @@ class SchemaGenerator(object):
             requires_range: A node propertly indicating that a term can assume a value equal to any of the terms that are in the current term's range.
             range_value_relationship: Edge relationship that indicates a term / node that another node depends on, is part of the other node's range.
             requires_component_relationship: A node property indicating that this node requires a component for its full characterization.
+            compact_graph: If True, the SchemaExplorer created from `path_to_json_ld` uses a compact, read-only schema graph (see SchemaExplorer).
 
         Returns:
             None
@@ -60,7 +82,7 @@ class SchemaGenerator(object):
             )
 
             # create an instance of SchemaExplorer
-            self.se = SchemaExplorer()
+            self.se = SchemaExplorer(compact_graph=compact_graph)
 
             # convert the JSON-LD data model to networkx object
             self.se.load_schema(self.jsonld_path)
@@ -85,6 +107,12 @@ class SchemaGenerator(object):
         self.range_value_relationship = range_value_relationship
         self.requires_component_relationship = requires_component_relationship
 
+        # (schema version, displayName -> label, label -> displayName) lookup tables, see get_label_lookup
+        self._label_lookup = None
+
+        # (schema version, node information, property schemas) memoized for JSON schema generation
+        self._json_schema_caches = None
+
     def get_edges_by_relationship(self, node: str, relationship: str) -> List[str]:
         """
         See class definition in SchemaExplorer
@@ -118,6 +146,10 @@ class SchemaGenerator(object):
             Directed graph on edges of a particular type (aka relationship)
         """
 
+        # the subgraph of the loaded schema graph is cached in the SchemaExplorer relationship index
+        if graph is self.se.get_nx_schema():
+            return self.se.get_digraph_by_edge_type(relationship)
+
         # prune the metadata model graph so as to include only those edges that match the relationship type
         rel_edges = []
         for (u, v, key, c) in graph.out_edges(data=True, keys=True):
@@ -204,8 +236,6 @@ class SchemaGenerator(object):
         Returns:
             List of nodes that are dependent on the source node.
         """
-        mm_graph = self.se.get_nx_schema()
-
         if schema_ordered:
             # get dependencies in the same order in which they are defined in the schema
             required_dependencies = self.se.explore_class(source_node)["dependencies"]
@@ -219,7 +249,7 @@ class SchemaGenerator(object):
             dependencies_display_names = []
 
             for req in required_dependencies:
-                dependencies_display_names.append(mm_graph.nodes[req]["displayName"])
+                dependencies_display_names.append(self.get_node_display_name(req))
 
             return dependencies_display_names
 
@@ -234,8 +264,6 @@ class SchemaGenerator(object):
         Returns:
             List of display names of nodes associateed with the given node.
         """
-        mm_graph = self.se.get_nx_schema()
-
         try:
             # get node range in the order defined in schema for given node
             required_range = self.se.explore_class(node_label)["range"]
@@ -250,12 +278,47 @@ class SchemaGenerator(object):
             dependencies_display_names = []
 
             for req in required_range:
-                dependencies_display_names.append(mm_graph.nodes[req]["displayName"])
+                dependencies_display_names.append(self.get_node_display_name(req))
 
             return dependencies_display_names
 
         return required_range
 
+    def get_label_lookup(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Get the lookup tables between display names and labels of the nodes in the data model.
+
+        The tables are built once per schema version (i.e. rebuilt after the schema is edited).
+
+        Returns:
+            Tuple of dictionaries: display name -> node label (as returned by get_node_label), and
+            node label -> display name.
+        """
+        schema_version = self.se.get_schema_version()
+
+        if self._label_lookup is None or self._label_lookup[0] != schema_version:
+            mm_graph = self.se.get_nx_schema()
+
+            display_name_to_label = {}
+            label_to_display_name = {}
+
+            for node, display_name in mm_graph.nodes(data="displayName"):
+                if display_name is None:
+                    continue
+
+                label_to_display_name[node] = display_name
+                if display_name not in display_name_to_label:
+                    display_name_to_label[display_name] = self._find_node_label(
+                        display_name
+                    )
+
+            self._label_lookup = (
+                schema_version,
+                display_name_to_label,
+                label_to_display_name,
+            )
+
+        return self._label_lookup[1], self._label_lookup[2]
+
     def get_node_label(self, node_display_name: str) -> str:
         """Get the node label for a given display name.
 
@@ -268,6 +331,25 @@ class SchemaGenerator(object):
         Raises:
             KeyError: If the node cannot be found in the graph.
         """
+        display_name_to_label, _ = self.get_label_lookup()
+
+        if node_display_name in display_name_to_label:
+            return display_name_to_label[node_display_name]
+
+        return self._find_node_label(node_display_name)
+
+    def get_node_display_name(self, node_label: str) -> str:
+        """Get the display name of a node, given its label.
+
+        Raises:
+            KeyError: If the node does not have a display name in the graph.
+        """
+        _, label_to_display_name = self.get_label_lookup()
+
+        return label_to_display_name[node_label]
+
+    def _find_node_label(self, node_display_name: str) -> str:
+        """Find the node label matching a display name, by converting the display name to a class or property label."""
         mm_graph = self.se.get_nx_schema()
 
         node_class_label = self.se.get_class_label_from_display_name(node_display_name)
@@ -434,20 +516,97 @@ class SchemaGenerator(object):
         """
         return mm_graph.nodes[node_name]["required"]
 
-    def get_json_schema_requirements(self, source_node: str, schema_name: str) -> Dict:
-        """Consolidated method that aims to gather dependencies and value constraints across terms / nodes in a schema.org schema and store them in a jsonschema /JSON Schema schema.
+    def _get_json_schema_caches(self) -> Tuple[Dict[str, Tuple], Dict[Tuple, Dict]]:
+        """Get the per-node information and property schemas memoized for JSON schema generation.
 
-        It does so for any given node in the schema.org schema (recursively) using the given node as starting point in the following manner:
-        1) Find all the nodes / terms this node depends on (which are required as "additional metadata" given this node is "required").
-        2) Find all the allowable metadata values / nodes that can be assigned to a particular node (if such a constraint is specified on the schema).
+        They are shared by all JSON schemas generated from the same schema version.
+        """
+        schema_version = self.se.get_schema_version()
+
+        if self._json_schema_caches is None or self._json_schema_caches[0] != schema_version:
+            self._json_schema_caches = (schema_version, {}, {})
+
+        return self._json_schema_caches[1], self._json_schema_caches[2]
+
+    def _get_json_schema_node_info(self, node: str, mm_graph: nx.MultiDiGraph) -> Tuple:
+        """Gather what get_json_schema_requirements needs to know about a node.
+
+        Returns:
+            Tuple of: the node display name, its range (labels and display names), its dependencies (labels and
+            display names), whether it is required and whether it can be mapped to a list of values.
+        """
+        nodes_info, _ = self._get_json_schema_caches()
+
+        if node not in nodes_info:
+            nodes_info[node] = self._find_json_schema_node_info(node, mm_graph)
+
+        return nodes_info[node]
+
+    def _find_json_schema_node_info(self, node: str, mm_graph: nx.MultiDiGraph) -> Tuple:
+        node_range = self.get_adjacent_nodes_by_relationship(
+            node, self.range_value_relationship
+        )
+        node_dependencies = self.get_adjacent_nodes_by_relationship(
+            node, self.requires_dependency_relationship
+        )
+        node_display_name = mm_graph.nodes[node]["displayName"]
+
+        # get any additional validation rules associated with this node (e.g. can this node be mapped to a list of other nodes)
+        node_validation_rules = self.get_node_validation_rules(node_display_name)
+
+        return (
+            node_display_name,
+            node_range,
+            self.get_nodes_display_names(node_range, mm_graph),
+            node_dependencies,
+            self.get_nodes_display_names(node_dependencies, mm_graph),
+            # can this node be map to the empty set (if required no; if not required yes)
+            self.is_required(node, mm_graph),
+            bool(node_validation_rules)
+            and bool(rule_in_rule_list("list", node_validation_rules)),
+        )
+
+    def _get_json_schema_property(
+        self, node_info: Tuple, kind: str, blank: bool = False
+    ) -> Dict:
+        """Get the JSON schema property of a node, memoized per node.
 
         Args:
-            source_node: Node from which we can start recursive dependancy traversal (as mentioned above).
-            schema_name: Name assigned to JSON-LD schema (to uniquely identify it via URI when it is hosted on the Internet).
+            node_info: node information, as returned by _get_json_schema_node_info.
+            kind: "valid_values" (values restricted to the node range, as a list if the node has a list rule),
+                "non_blank" (any non-empty value) or "any" (any value).
+            blank: if True, also allow an empty value for "valid_values".
 
         Returns:
-            JSON Schema as a dictionary.
+            JSON schema property as {node display name: schema}. A copy of the memoized property is returned,
+            so that the generated JSON schemas do not share any objects.
         """
+        node_display_name, _, node_range_d, _, _, _, node_is_list = node_info
+        _, properties = self._get_json_schema_caches()
+
+        key = (node_display_name, tuple(node_range_d), node_is_list, kind, blank)
+
+        if key not in properties:
+            if kind == "valid_values":
+                if node_is_list:
+                    schema_property = self.get_array_schema(
+                        node_range_d, node_display_name, blank=blank
+                    )
+                else:
+                    schema_property = self.get_range_schema(
+                        node_range_d, node_display_name, blank=blank
+                    )
+            elif kind == "non_blank":
+                schema_property = self.get_non_blank_schema(node_display_name)
+            else:
+                schema_property = {node_display_name: {}}
+
+            properties[key] = schema_property
+
+        return _copy_json(properties[key])
+
+    def _build_json_schema(self, source_node: str, schema_name: str) -> Dict:
+        """Build the JSON schema of a node, see get_json_schema_requirements."""
         json_schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
             "$id": "http://example.com/" + schema_name,
@@ -462,11 +621,17 @@ class SchemaGenerator(object):
         mm_graph = self.se.get_nx_schema()
 
         nodes_to_process = (
-            []
-        )  # list of nodes to be checked for dependencies, starting with the source node
+            deque()
+        )  # queue of nodes to be checked for dependencies, starting with the source node
         processed_nodes = (
-            []
+            set()
         )  # keep of track of nodes whose dependencies have been processed
+        queued_nodes = (
+            set()
+        )  # nodes currently in the queue, so that each node is queued at most once at a time
+        deferred_nodes = (
+            set()
+        )  # nodes checked but left out of the schema, until one of their conditionals is traversed
         reverse_dependencies = (
             {}
         )  # maintain a map between conditional nodes and their dependencies (reversed) -- {dependency : conditional_node}
@@ -484,211 +649,222 @@ class SchemaGenerator(object):
         if not root_dependencies:
             raise ValueError(f"'{source_node}' is not a valid component in the schema.")
 
-        nodes_to_process += root_dependencies
+        root_dependencies_set = set(root_dependencies)
+
+        queued_nodes.update(root_dependencies)
+        nodes_to_process.extend(dict.fromkeys(root_dependencies))
+
+        while nodes_to_process:
+            process_node = nodes_to_process.popleft()
+            queued_nodes.discard(process_node)
+
+            node_info = self._get_json_schema_node_info(process_node, mm_graph)
+            (
+                node_display_name,
+                node_range,
+                node_range_d,
+                node_dependencies,
+                node_dependencies_d,
+                node_required,
+                node_is_list,
+            ) = node_info
+
+            # node is being processed
+            node_is_processed = True
+
+            # updating map between node and node's valid values
+            for n in node_range_d:
+                if not n in range_domain_map:
+                    range_domain_map[n] = []
+                range_domain_map[n].append(node_display_name)
+
+            if node_display_name in reverse_dependencies:
+                # if node has conditionals set schema properties and conditional dependencies
+                # set schema properties
+                if node_range:
+                    # if process node has valid value range set it in schema properties
+                    # (as a list of values if this node can be mapped to a list of nodes)
+                    schema_valid_vals = self._get_json_schema_property(
+                        node_info, "valid_values", blank=True
+                    )
 
-        process_node = nodes_to_process.pop(0)
+                else:
+                    # otherwise, by default allow any values
+                    schema_valid_vals = self._get_json_schema_property(node_info, "any")
 
-        while process_node:
+                json_schema["properties"].update(schema_valid_vals)
 
-            if not process_node in processed_nodes:
-                # node is being processed
-                node_is_processed = True
+                # set schema conditional dependencies
+                for node in reverse_dependencies[node_display_name]:
+                    # set all of the conditional nodes that require this process node
 
-                node_range = self.get_adjacent_nodes_by_relationship(
-                    process_node, self.range_value_relationship
-                )
+                    # get node domain if any
+                    # ow this node is a conditional requirement
+                    if node in range_domain_map:
+                        domain_nodes = range_domain_map[node]
+                        conditional_properties = {}
 
-                # get node range display name
-                node_range_d = self.get_nodes_display_names(node_range, mm_graph)
+                        for domain_node in domain_nodes:
 
-                node_dependencies = self.get_adjacent_nodes_by_relationship(
-                    process_node, self.requires_dependency_relationship
-                )
+                            # set range of conditional node schema
+                            conditional_properties.update(
+                                {
+                                    "properties": {domain_node: {"enum": [node]}},
+                                    "required": [domain_node],
+                                }
+                            )
 
-                # get process node display name
-                node_display_name = mm_graph.nodes[process_node]["displayName"]
+                            # given node conditional are satisfied, this process node (which is dependent on these conditionals) has to be set or not depending on whether it is required
+                            if node_range:
+                                dependency_properties = self._get_json_schema_property(
+                                    node_info, "valid_values", blank=not node_required
+                                )
 
-                # updating map between node and node's valid values
-                for n in node_range_d:
-                    if not n in range_domain_map:
-                        range_domain_map[n] = []
-                    range_domain_map[n].append(node_display_name)
+                            else:
+                                if node_required:
+                                    dependency_properties = self._get_json_schema_property(
+                                        node_info, "non_blank"
+                                    )
+                                else:
+                                    dependency_properties = self._get_json_schema_property(
+                                        node_info, "any"
+                                    )
+                            schema_conditional_dependencies = {
+                                "if": conditional_properties,
+                                "then": {
+                                    "properties": dependency_properties,
+                                    "required": [node_display_name],
+                                },
+                            }
 
-                # can this node be map to the empty set (if required no; if not required yes)
-                # TODO: change "required" to different term, required may be a bit misleading (i.e. is the node required in the schema)
-                node_required = self.is_required(process_node, mm_graph)
+                            # update conditional-dependency rules in json schema
+                            json_schema["allOf"].append(schema_conditional_dependencies)
 
-                # get any additional validation rules associated with this node (e.g. can this node be mapped to a list of other nodes)
-                node_validation_rules = self.get_node_validation_rules(
-                    node_display_name
-                )
-
-                if node_display_name in reverse_dependencies:
-                    # if node has conditionals set schema properties and conditional dependencies
-                    # set schema properties
+            else:
+                # node doesn't have conditionals
+                if node_required:
                     if node_range:
-                        # if process node has valid value range set it in schema properties
-                        schema_valid_vals = self.get_range_schema(
-                            node_range_d, node_display_name, blank=True
+                        # If there are valid values AND they are expected to be a list,
+                        # the Valid Values are reformatted as a list.
+                        schema_valid_vals = self._get_json_schema_property(
+                            node_info, "valid_values", blank=False
                         )
-
-                        if node_validation_rules:
-                            # if this node has extra validation rules process them
-                            # TODO: abstract this into its own validation rule constructor/generator module/class
-                            if rule_in_rule_list("list", node_validation_rules):
-                                # if this node can be mapped to a list of nodes
-                                # set its schema accordingly
-                                schema_valid_vals = self.get_array_schema(
-                                    node_range_d, node_display_name, blank=True
-                                )
-
                     else:
-                        # otherwise, by default allow any values
-                        schema_valid_vals = {node_display_name: {}}
+                        schema_valid_vals = self._get_json_schema_property(
+                            node_info, "non_blank"
+                        )
 
                     json_schema["properties"].update(schema_valid_vals)
+                    # add node to required fields
+                    json_schema["required"] += [node_display_name]
 
-                    # set schema conditional dependencies
-                    for node in reverse_dependencies[node_display_name]:
-                        # set all of the conditional nodes that require this process node
+                elif process_node in root_dependencies_set:
+                    # node doesn't have conditionals and is not required; it belongs in the schema only if it is in root's dependencies
 
-                        # get node domain if any
-                        # ow this node is a conditional requirement
-                        if node in range_domain_map:
-                            domain_nodes = range_domain_map[node]
-                            conditional_properties = {}
+                    if node_range:
+                        schema_valid_vals = self._get_json_schema_property(
+                            node_info, "valid_values", blank=True
+                        )
 
-                            for domain_node in domain_nodes:
+                    else:
+                        schema_valid_vals = self._get_json_schema_property(node_info, "any")
 
-                                # set range of conditional node schema
-                                conditional_properties.update(
-                                    {
-                                        "properties": {domain_node: {"enum": [node]}},
-                                        "required": [domain_node],
-                                    }
-                                )
+                    json_schema["properties"].update(schema_valid_vals)
 
-                                # given node conditional are satisfied, this process node (which is dependent on these conditionals) has to be set or not depending on whether it is required
-                                if node_range:
-                                    dependency_properties = self.get_range_schema(
-                                        node_range_d,
-                                        node_display_name,
-                                        blank=not node_required,
-                                    )
+                else:
+                    # node doesn't have conditionals and it is not required and it is not a root dependency
+                    # the node doesn't belong in the schema
+                    # do not add to processed nodes since its conditional may be traversed at a later iteration (though unlikely for most schemas we consider)
+                    node_is_processed = False
+
+            # add process node as a conditional to its dependencies
+            for dep in node_dependencies_d:
+                if not dep in reverse_dependencies:
+                    reverse_dependencies[dep] = []
+
+                reverse_dependencies[dep].append(node_display_name)
+
+            # if the node is processed add it to the processed nodes set
+            if node_is_processed:
+                processed_nodes.add(process_node)
+                deferred_nodes.discard(process_node)
+            else:
+                deferred_nodes.add(process_node)
 
-                                    if node_validation_rules:
-                                        if rule_in_rule_list("list", node_validation_rules):
-                                            # TODO: get_range_schema and get_range_schema have similar behavior - combine in one module
-                                            dependency_properties = self.get_array_schema(
-                                                node_range_d,
-                                                node_display_name,
-                                                blank=not node_required,
-                                            )
+            # add nodes found as dependencies and range of this processed node
+            # to the queue of nodes to be processed; nodes are marked when they are queued, and a deferred
+            # node is only queued again once it has a conditional, so each node is checked at most twice
+            for node in chain(node_range, node_dependencies):
+                if node in queued_nodes or node in processed_nodes:
+                    continue
 
-                                else:
-                                    if node_required:
-                                        dependency_properties = self.get_non_blank_schema(
-                                            node_display_name
-                                        )
-                                    else:
-                                        dependency_properties = {node_display_name: {}}
-                                schema_conditional_dependencies = {
-                                    "if": conditional_properties,
-                                    "then": {
-                                        "properties": dependency_properties,
-                                        "required": [node_display_name],
-                                    },
-                                }
+                if (
+                    node in deferred_nodes
+                    and self._get_json_schema_node_info(node, mm_graph)[0]
+                    not in reverse_dependencies
+                ):
+                    continue
 
-                                # update conditional-dependency rules in json schema
-                                json_schema["allOf"].append(
-                                    schema_conditional_dependencies
-                                )
+                queued_nodes.add(node)
+                nodes_to_process.append(node)
 
-                else:
-                    # node doesn't have conditionals
-                    if node_required:
-                        if node_range:
-                            schema_valid_vals = self.get_range_schema(
-                                node_range_d, node_display_name, blank=False
-                            )
-
-                            if node_validation_rules:
-                                # If there are valid values AND they are expected to be a list,
-                                # reformat the Valid Values.
-                                if rule_in_rule_list("list", node_validation_rules):
-                                    schema_valid_vals = self.get_array_schema(
-                                        node_range_d, node_display_name, blank=False
-                                    )
-                        else:
-                            schema_valid_vals = self.get_non_blank_schema(
-                                node_display_name
-                            )
+        # if no conditional dependencies were added we can't have an empty 'AllOf' block in the schema, so remove it
+        if not json_schema["allOf"]:
+            del json_schema["allOf"]
 
-                        json_schema["properties"].update(schema_valid_vals)
-                        # add node to required fields
-                        json_schema["required"] += [node_display_name]
+        return json_schema
 
-                    elif process_node in root_dependencies:
-                        # node doesn't have conditionals and is not required; it belongs in the schema only if it is in root's dependencies
+    def get_all_json_schemas(self, schema_name: str) -> Dict[str, Dict]:
+        """Get the JSON schemas of all components in the data model.
 
-                        if node_range:
-                            schema_valid_vals = self.get_range_schema(
-                                node_range_d, node_display_name, blank=True
-                            )
+        Per-node information and property schemas are computed once and shared across components, which is
+        faster than calling get_json_schema_requirements for each component. Unlike get_json_schema_requirements,
+        the JSON schemas are not logged to files.
 
-                            if node_validation_rules:
-                                if rule_in_rule_list("list", node_validation_rules):
-                                    schema_valid_vals = self.get_array_schema(
-                                        node_range_d, node_display_name, blank=True
-                                    )
+        Args:
+            schema_name: Name assigned to JSON-LD schema (to uniquely identify it via URI when it is hosted on the Internet).
 
-                        else:
-                            schema_valid_vals = {node_display_name: {}}
+        Returns:
+            Dictionary of JSON schemas, keyed by component (i.e. nodes with a "requiresComponent" relationship).
+        """
+        component_digraph = self.se.get_digraph_by_edge_type(
+            self.requires_component_relationship
+        )
 
-                        json_schema["properties"].update(schema_valid_vals)
+        json_schemas = {
+            component: self._build_json_schema(component, schema_name)
+            for component in component_digraph.nodes()
+        }
 
-                    else:
-                        # node doesn't have conditionals and it is not required and it is not a root dependency
-                        # the node doesn't belong in the schema
-                        # do not add to processed nodes since its conditional may be traversed at a later iteration (though unlikely for most schemas we consider)
-                        node_is_processed = False
-
-                # add process node as a conditional to its dependencies
-                node_dependencies_d = self.get_nodes_display_names(
-                    node_dependencies, mm_graph
-                )
+        logger.info("JSON schemas successfully generated for all components!")
 
-                for dep in node_dependencies_d:
-                    if not dep in reverse_dependencies:
-                        reverse_dependencies[dep] = []
+        return json_schemas
 
-                    reverse_dependencies[dep].append(node_display_name)
+    def get_json_schema_requirements(self, source_node: str, schema_name: str) -> Dict:
+        """Consolidated method that aims to gather dependencies and value constraints across terms / nodes in a schema.org schema and store them in a jsonschema /JSON Schema schema.
 
-                # add nodes found as dependencies and range of this processed node
-                # to the list of nodes to be processed
-                nodes_to_process += node_range
-                nodes_to_process += node_dependencies
+        It does so for any given node in the schema.org schema (recursively) using the given node as starting point in the following manner:
+        1) Find all the nodes / terms this node depends on (which are required as "additional metadata" given this node is "required").
+        2) Find all the allowable metadata values / nodes that can be assigned to a particular node (if such a constraint is specified on the schema).
 
-                # if the node is processed add it to the processed nodes set
-                if node_is_processed:
-                    processed_nodes.append(process_node)
+        Args:
+            source_node: Node from which we can start recursive dependancy traversal (as mentioned above).
+            schema_name: Name assigned to JSON-LD schema (to uniquely identify it via URI when it is hosted on the Internet).
 
-            # if the list of nodes to process is not empty
-            # set the process node the next remaining node to process
-            if nodes_to_process:
-                process_node = nodes_to_process.pop(0)
-            else:
-                # no more nodes to process
-                # exit the loop
-                break
+        Returns:
+            JSON Schema as a dictionary.
+        """
+        json_schema = self._build_json_schema(source_node, schema_name)
 
         logger.info("JSON schema successfully generated from schema.org schema!")
 
-        # if no conditional dependencies were added we can't have an empty 'AllOf' block in the schema, so remove it
-        if not json_schema["allOf"]:
-            del json_schema["allOf"]
+        self._log_json_schema(source_node, json_schema)
+
+        return json_schema
 
+    def _log_json_schema(self, source_node: str, json_schema: Dict) -> None:
+        """Store the JSON schema of a node for inspection, at (model > input > log_location) in the configuration
+        or next to the JSON-LD data model."""
         # Check if config value is provided; otherwise, set to None
         json_schema_log_file = query_dict(
             CONFIG.DATA, ("model", "input", "log_location")
@@ -717,4 +893,39 @@ class SchemaGenerator(object):
 
         logger.info(f"JSON schema file log stored as {json_schema_log_file}")
 
-        return json_schema
+    def get_cached_json_schema_requirements(self, source_node: str, schema_name: str) -> Dict:
+        """Get the JSON schema of a node like get_json_schema_requirements, reusing previously generated schemas.
+
+        JSON schemas are cached in memory and on disk (see schematic.utils.cache_utils), keyed by the hash of the
+        JSON-LD data model, the node, the schema name, the schematic version and JSON_SCHEMA_CACHE_VERSION, so that
+        validating manifests against an unchanged data model does not regenerate the schema. Hit and miss counters
+        are available from json_schema_cache.cache_info(). Schemas of data models that were not loaded from a file,
+        or were edited since, are not cached. Cached schemas are stored for inspection like generated ones.
+
+        Args:
+            source_node: Node from which we can start recursive dependancy traversal.
+            schema_name: Name assigned to JSON-LD schema (to uniquely identify it via URI when it is hosted on the Internet).
+
+        Returns:
+            JSON Schema as a dictionary.
+        """
+        schema_hash = self.se.get_schema_hash()
+
+        if schema_hash is None:
+            return self.get_json_schema_requirements(source_node, schema_name)
+
+        key = json_schema_cache.make_key(
+            schema_hash, source_node, schema_name, get_schematic_version(), JSON_SCHEMA_CACHE_VERSION
+        )
+
+        json_schema = json_schema_cache.get(
+            key, lambda: self._build_json_schema(source_node, schema_name)
+        )
+
+        logger.debug(f"JSON schema cache: {json_schema_cache.cache_info()}")
+
+        # cached schemas are logged like generated ones
+        self._log_json_schema(source_node, json_schema)
+
+        # the cached schema is shared, callers get their own copy
+        return _copy_json(json_schema)
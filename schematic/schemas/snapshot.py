@@ -0,0 +1,139 @@
+import logging
+import threading
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.cache_utils import hash_bytes
+from schematic.utils.io_utils import load_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaSnapshot:
+    """Immutable snapshot of a loaded schema, which can be shared between threads.
+
+    A snapshot holds the compiled schema (JSON-LD, graph and indexes, see compile_schema) of a SchemaExplorer at
+    a point in time, and is never modified. Each thread explores a snapshot through its own SchemaExplorer
+    (see explorer), which shares the snapshot's data until it is edited (copy-on-write). The edit methods of a
+    snapshot return a new snapshot and leave the snapshot unchanged.
+
+    The schema graph of a snapshot is frozen; the JSON-LD schema and the record index are plain dictionaries,
+    which SchemaExplorer objects copy before editing them and which callers must not modify. Indexes built on
+    first use (closure indexes and compact graph arrays) are built under a lock.
+    """
+
+    def __init__(
+        self,
+        compiled: Dict[str, Any],
+        schema_hash: Optional[str] = None,
+        compact_graph: bool = False,
+    ) -> None:
+        """Use from_explorer or load_schema_snapshot to create a SchemaSnapshot.
+
+        Args:
+            compiled: compiled schema, see SchemaExplorer.share_compiled_schema.
+            schema_hash: SHA-256 of the JSON-LD document the schema was loaded from, if unedited.
+            compact_graph: whether the schema graph is compact (see SchemaExplorer).
+        """
+        self._compiled = compiled
+        self.schema_hash = schema_hash
+        self.compact_graph = compact_graph
+
+    @classmethod
+    def from_explorer(cls, schema_explorer: SchemaExplorer) -> "SchemaSnapshot":
+        """Snapshot of the schema currently loaded in a SchemaExplorer; later edits of the SchemaExplorer do not affect it."""
+        return cls(
+            schema_explorer.share_compiled_schema(),
+            schema_explorer.get_schema_hash(),
+            schema_explorer.compact_graph,
+        )
+
+    def explorer(self) -> SchemaExplorer:
+        """New SchemaExplorer on the snapshot; it copies the schema before it is edited, so the snapshot is unaffected."""
+        schema_explorer = SchemaExplorer(compact_graph=self.compact_graph)
+        schema_explorer.load_shared_schema(self._compiled, self.schema_hash)
+
+        return schema_explorer
+
+    def generator(self, **kwargs) -> SchemaGenerator:
+        """New SchemaGenerator on the snapshot, see explorer; keyword arguments are passed to SchemaGenerator."""
+        return SchemaGenerator(schema_explorer=self.explorer(), **kwargs)
+
+    def _edit(self, method: str, *args, **kwargs) -> "SchemaSnapshot":
+        schema_explorer = self.explorer()
+        getattr(schema_explorer, method)(*args, **kwargs)
+
+        return SchemaSnapshot.from_explorer(schema_explorer)
+
+    def edit_class(self, class_info: dict) -> "SchemaSnapshot":
+        """New snapshot with an existing class edited, see SchemaExplorer.edit_class."""
+        return self._edit("edit_class", class_info)
+
+    def update_class(self, class_info: dict) -> "SchemaSnapshot":
+        """New snapshot with a class added, see SchemaExplorer.update_class."""
+        return self._edit("update_class", class_info)
+
+    def edit_property(self, property_info: dict) -> "SchemaSnapshot":
+        """New snapshot with an existing property edited, see SchemaExplorer.edit_property."""
+        return self._edit("edit_property", property_info)
+
+    def update_property(self, property_info: dict) -> "SchemaSnapshot":
+        """New snapshot with a property added, see SchemaExplorer.update_property."""
+        return self._edit("update_property", property_info)
+
+    def edit_schema_object_nx(self, schema_object: dict) -> "SchemaSnapshot":
+        """New snapshot with an existing schema object edited, see SchemaExplorer.edit_schema_object_nx."""
+        return self._edit("edit_schema_object_nx", schema_object)
+
+    def add_schema_object_nx(self, schema_object: dict, **kwargs: dict) -> "SchemaSnapshot":
+        """New snapshot with a schema object added, see SchemaExplorer.add_schema_object_nx."""
+        return self._edit("add_schema_object_nx", schema_object, **kwargs)
+
+
+# maximum number of snapshots kept by load_schema_snapshot
+max_cached_snapshots = 8
+
+# snapshots loaded with load_schema_snapshot, by (content hash, compact graph)
+_snapshots = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def load_schema_snapshot(schema: str, compact_graph: Optional[bool] = None) -> SchemaSnapshot:
+    """Load a schema as a snapshot shared by the whole process.
+
+    Snapshots are cached by the content of the JSON-LD document (up to max_cached_snapshots), so that loading
+    an unchanged data model again, e.g. in another request, reuses the parsed schema.
+
+    Args:
+        schema: path or URL of a JSON-LD schema.
+        compact_graph: see SchemaExplorer.
+
+    Returns:
+        Snapshot of the schema.
+    """
+    schema_explorer = SchemaExplorer(compact_graph=compact_graph)
+    schema_bytes = load_bytes(schema)
+    schema_hash = hash_bytes(schema_bytes)
+    key = (schema_hash, schema_explorer.compact_graph)
+
+    with _snapshots_lock:
+        if key in _snapshots:
+            _snapshots.move_to_end(key)
+            return _snapshots[key]
+
+    # the schema is compiled outside of the lock; concurrent loads of the same schema give equivalent snapshots
+    schema_explorer.load_schema_bytes(schema_bytes, schema_hash)
+    snapshot = SchemaSnapshot.from_explorer(schema_explorer)
+
+    with _snapshots_lock:
+        snapshot = _snapshots.setdefault(key, snapshot)
+        _snapshots.move_to_end(key)
+        if len(_snapshots) > max_cached_snapshots:
+            _snapshots.popitem(last=False)
+
+    logger.debug(f"Loaded schema snapshot of {schema}.")
+
+    return snapshot
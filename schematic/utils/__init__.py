@@ -1,4 +1,5 @@
 from schematic.utils.curie_utils import (
+    build_uri_label_index,
     expand_curie_to_uri,
     expand_curies_in_schema,
     extract_name_from_uri_or_curie,
@@ -0,0 +1,439 @@
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from collections import OrderedDict
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+from schematic import CONFIG
+from schematic.utils.cli_utils import query_dict
+
+logger = logging.getLogger(__name__)
+
+
+# default location of the schematic cache, used unless configured otherwise
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "schematic")
+
+# maximum size (megabytes) of the cached objects of each cache subdirectory, unless set by
+# (model > cache > max_size) in the configuration; least recently used objects are removed beyond it
+DEFAULT_CACHE_MAX_SIZE = 256
+
+
+def _get_config_value(keys) -> Any:
+    """Get an optional value from the schematic configuration, if a configuration was loaded."""
+    try:
+        return query_dict(CONFIG.DATA, keys)
+    except AttributeError:
+        return None
+
+
+def get_cache_dir(subdir: Optional[str] = None) -> Optional[str]:
+    """Get the directory where schematic caches derived data (e.g. compiled data models).
+
+    The cache directory is, in order of precedence: the SCHEMATIC_CACHE_DIR environment variable,
+    the (model > cache > location) key of the configuration, or ~/.cache/schematic.
+    Caching can be disabled by setting (model > cache > enabled) to false in the configuration.
+
+    Args:
+        subdir: optional subdirectory of the cache directory.
+
+    Returns:
+        Absolute path to the cache directory, or None if caching is disabled.
+    """
+    if _get_config_value(("model", "cache", "enabled")) is False:
+        return None
+
+    cache_dir = os.environ.get("SCHEMATIC_CACHE_DIR") or _get_config_value(
+        ("model", "cache", "location")
+    )
+
+    if not cache_dir:
+        cache_dir = DEFAULT_CACHE_DIR
+
+    cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+
+    if subdir:
+        cache_dir = os.path.join(cache_dir, subdir)
+
+    return cache_dir
+
+
+def hash_bytes(data: bytes) -> str:
+    """SHA-256 hex digest of a document, used to address cached content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_cache_max_size() -> int:
+    """Maximum size (bytes) of the cached objects of each cache subdirectory, see DEFAULT_CACHE_MAX_SIZE."""
+    max_size = _get_config_value(("model", "cache", "max_size"))
+
+    return int(float(DEFAULT_CACHE_MAX_SIZE if max_size is None else max_size) * (1 << 20))
+
+
+def _is_owned(path: str) -> bool:
+    """Whether a file or directory is owned by the current user; cached objects are only unpickled from those."""
+    if not hasattr(os, "getuid"):
+        # no file ownership to check, e.g. on Windows
+        return True
+
+    return os.stat(path).st_uid == os.getuid()
+
+
+def load_cached_object(subdir: str, key: str) -> Any:
+    """Load an object stored with store_cached_object.
+
+    Objects are only loaded from a cache directory (and file) owned by the current user, since unpickling
+    runs code from the cache. Loaded objects are marked as recently used, see store_cached_object.
+
+    Args:
+        subdir: subdirectory of the cache directory the object was stored in.
+        key: key the object was stored under.
+
+    Returns:
+        The cached object, or None if caching is disabled, the object is not cached or cannot be read.
+    """
+    cache_dir = get_cache_dir(subdir)
+
+    if cache_dir is None:
+        return None
+
+    cache_path = os.path.join(cache_dir, f"{key}.pickle")
+
+    if not os.path.exists(cache_path):
+        return None
+
+    if not (_is_owned(cache_dir) and _is_owned(cache_path)):
+        logger.warning(f"Ignoring cache entry {cache_path}, which is not owned by the current user.")
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            obj = pickle.load(f)
+    except Exception as e:
+        # a corrupt or incompatible cache entry is rebuilt by the caller
+        logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
+
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+    return obj
+
+
+def _write_atomic(cache_path: str, write: Callable[[BinaryIO], Any]) -> None:
+    """Write a cache file with write(f), through a temporary file so concurrent readers never see a partial file."""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _evict_cached_objects(cache_dir: str, max_size: int) -> None:
+    """Remove the least recently used (i.e. modified or loaded) objects of a cache directory beyond max_size bytes.
+
+    The most recently used object is kept, even if it is larger than max_size.
+    """
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".pickle"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # removed concurrently
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    entries.sort(reverse=True)
+
+    total_size = 0
+    for i, (_, size, path) in enumerate(entries):
+        total_size += size
+        if i > 0 and total_size > max_size:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def store_cached_object(subdir: str, key: str, obj: Any) -> None:
+    """Store an object in the cache directory; failures to write the cache are logged and ignored.
+
+    The size of the cache subdirectory is bounded by get_cache_max_size; least recently used objects are
+    removed to make room.
+
+    Args:
+        subdir: subdirectory of the cache directory to store the object in.
+        key: key to store the object under (e.g. a hash_bytes digest).
+        obj: picklable object to store.
+    """
+    cache_dir = get_cache_dir(subdir)
+
+    if cache_dir is None:
+        return
+
+    cache_path = os.path.join(cache_dir, f"{key}.pickle")
+
+    try:
+        _write_atomic(
+            cache_path, lambda f: pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        _evict_cached_objects(cache_dir, get_cache_max_size())
+    except Exception as e:
+        logger.warning(f"Could not write cache entry {cache_path}: {e}")
+
+
+# timeout (seconds) of requests for remote documents, unless set by (model > http > timeout) in the configuration
+DEFAULT_HTTP_TIMEOUT = 30
+
+# one lock per cached URL, so that concurrent fetches of a URL in a process are done once
+_url_locks = {}
+_url_locks_lock = threading.Lock()
+
+
+def get_http_timeout() -> float:
+    """Timeout (seconds) of requests for remote documents, see DEFAULT_HTTP_TIMEOUT."""
+    timeout = _get_config_value(("model", "http", "timeout"))
+
+    return DEFAULT_HTTP_TIMEOUT if timeout is None else float(timeout)
+
+
+def _response_max_age(cache_control: Optional[str]) -> float:
+    """Freshness lifetime (seconds) given by the Cache-Control header of a response; 0 if not cacheable as is."""
+    if not cache_control or re.search(r"\b(no-cache|no-store)\b", cache_control):
+        return 0
+
+    match = re.search(r"\bmax-age=(\d+)", cache_control)
+
+    return int(match.group(1)) if match else 0
+
+
+def _write_cache_metadata(meta_path: str, meta: Dict[str, Any]) -> None:
+    try:
+        _write_atomic(meta_path, lambda f: f.write(json.dumps(meta).encode("utf8")))
+    except OSError as e:
+        logger.warning(f"Could not write cache entry {meta_path}: {e}")
+
+
+def fetch_url(
+    url: str, max_age: Optional[float] = None, timeout: Optional[float] = None
+) -> Optional[str]:
+    """Get a local copy of a remote document (e.g. a data model), from the HTTP cache if it is fresh.
+
+    Documents are cached in the "http" subdirectory of the cache directory (see get_cache_dir), with their ETag
+    and Last-Modified headers. A cached document is used without any request while it is fresh, i.e. for
+    max_age seconds after it was fetched or revalidated; after that it is revalidated with a conditional
+    request (If-None-Match / If-Modified-Since), so an unchanged document is not downloaded again. If the
+    server cannot be reached, a stale cached document is used.
+
+    Args:
+        url: URL of the document.
+        max_age: seconds a cached document is fresh; defaults to (model > http > max_age) in the configuration,
+            or else to the max-age of the Cache-Control header of the response.
+        timeout: timeout of the request in seconds, see get_http_timeout.
+
+    Returns:
+        Path to the cached document, or None if caching is disabled. If the cache cannot be written, the
+        document is downloaded to a temporary file instead.
+
+    Raises:
+        urllib.error.URLError: if the document cannot be fetched and is not cached.
+    """
+    cache_dir = get_cache_dir("http")
+
+    if cache_dir is None:
+        return None
+
+    if max_age is None:
+        max_age = _get_config_value(("model", "http", "max_age"))
+    if timeout is None:
+        timeout = get_http_timeout()
+
+    key = hash_bytes(url.encode("utf8"))
+    # keep the extension of the document, e.g. .jsonld
+    extension = os.path.splitext(urllib.parse.urlparse(url).path)[1]
+    body_path = os.path.join(cache_dir, f"{key}{extension}")
+    # the metadata suffix cannot be the extension of a document, e.g. of model.json
+    meta_path = os.path.join(cache_dir, f"{key}.meta.json")
+
+    with _url_locks_lock:
+        url_lock = _url_locks.setdefault(key, threading.Lock())
+
+    with url_lock:
+        meta = None
+        if os.path.exists(body_path) and os.path.exists(meta_path):
+            try:
+                with open(meta_path, "r", encoding="utf8") as f:
+                    meta = json.load(f)
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable cache entry {meta_path}: {e}")
+
+        if meta is not None:
+            fresh_for = meta["max_age"] if max_age is None else max_age
+            if time.time() - meta["fetched"] < fresh_for:
+                return body_path
+
+        headers = {}
+        if meta is not None and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta is not None and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            with urllib.request.urlopen(
+                urllib.request.Request(url, headers=headers), timeout=timeout
+            ) as response:
+                body = response.read()
+                response_headers = response.headers
+        except urllib.error.HTTPError as e:
+            if meta is not None and e.code == 304:
+                # not modified: the cached document is fresh again
+                logger.debug(f"Revalidated cached copy of {url}.")
+                meta["max_age"] = _response_max_age(e.headers.get("Cache-Control"))
+                meta["fetched"] = time.time()
+                _write_cache_metadata(meta_path, meta)
+                return body_path
+            if meta is not None and e.code >= 500:
+                logger.warning(f"Could not fetch {url}, using a cached copy: {e}")
+                return body_path
+            raise
+        except (urllib.error.URLError, OSError) as e:
+            # includes timeouts
+            if meta is None:
+                raise
+            logger.warning(f"Could not fetch {url}, using a cached copy: {e}")
+            return body_path
+
+        try:
+            _write_atomic(body_path, lambda f: f.write(body))
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {body_path}: {e}")
+            # hand the downloaded document over in a temporary file, rather than have callers download it again
+            with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp_file:
+                tmp_file.write(body)
+            return tmp_file.name
+
+        _write_cache_metadata(
+            meta_path,
+            {
+                "url": url,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "max_age": _response_max_age(response_headers.get("Cache-Control")),
+                "fetched": time.time(),
+            },
+        )
+
+    return body_path
+
+
+def get_schematic_version() -> str:
+    """Get the installed version of schematic, used to invalidate cached results across releases."""
+    # the distribution is published as schematicpy; development installs may be named schematic
+    for distribution in ("schematicpy", "schematic"):
+        try:
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+
+    return "unknown"
+
+
+class PersistentLRUCache:
+    """In-memory LRU cache of picklable objects, backed by the schematic cache directory.
+
+    Objects missing from memory are looked up on disk (see load_cached_object) before they are computed, and
+    computed objects are written to disk so that other processes (e.g. API workers) can reuse them.
+    Hits and misses are counted, see cache_info.
+    """
+
+    def __init__(self, subdir: str, maxsize: int = 128) -> None:
+        """
+        Args:
+            subdir: subdirectory of the cache directory the objects are stored in.
+            maxsize: maximum number of objects kept in memory.
+        """
+        self.subdir = subdir
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Digest of the JSON representation of the key parts, safe to use as a file name."""
+        return hash_bytes(json.dumps(parts).encode("utf8"))
+
+    def get(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Get the object stored under key, computing (and storing) it with compute() on a miss.
+
+        Args:
+            key: key of the object, see make_key.
+            compute: function called without arguments to compute the object on a miss.
+
+        Returns:
+            The cached or computed object; callers must not modify it.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        obj = load_cached_object(self.subdir, key)
+
+        if obj is not None:
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+        else:
+            obj = compute()
+            store_cached_object(self.subdir, key, obj)
+            with self._lock:
+                self.misses += 1
+
+        with self._lock:
+            self._entries[key] = obj
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return obj
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit (in memory or on disk) and miss counters, and the number of objects held in memory."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop the objects held in memory and reset the counters; the on-disk cache is kept."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
@@ -0,0 +1,508 @@
+import sys
+import threading
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterator, List, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+
+# attributes of the edges and of the nodes of relationship digraphs, which have none
+_NO_ATTRIBUTES = MappingProxyType({})
+
+
+def _csr_from_sources(
+    sources: np.ndarray, targets: np.ndarray, n_nodes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR (indptr, indices) arrays of edges given as (sources, targets) arrays sorted by source."""
+    indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+    np.cumsum(np.bincount(sources, minlength=n_nodes), out=indptr[1:])
+
+    return indptr, targets.astype(np.int32)
+
+
+class CompactSchemaGraph:
+    """Immutable, array-backed representation of a schema graph (see load_schema_into_networkx).
+
+    Nodes are numbered in graph order and their (interned) names are kept in a tuple. Node attributes are
+    stored column-wise, one object array per attribute name; the attribute names of each node are stored as
+    an index into a small table of attribute layouts, so that attribute dictionaries are rebuilt in their
+    original order. Edges are stored in CSR arrays, once for the whole multigraph (with a relationship code
+    per edge, in networkx adjacency order) and once per relationship (edge key).
+
+    Use to_networkx and relationship_digraph to get read-only networkx graphs backed by these arrays. Node
+    attributes are read-only views of the columns, and the read-only adjacency mappings networkx works with
+    are only built for the nodes that are accessed, once per node.
+    """
+
+    def __init__(
+        self,
+        node_names: Tuple[Hashable, ...],
+        layouts: List[Tuple[str, ...]],
+        node_layouts: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        relationships: Tuple[Hashable, ...],
+        out_edges: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        in_edges: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> None:
+        """Use from_networkx to create a CompactSchemaGraph.
+
+        Args:
+            node_names: node names, indexed by node id.
+            layouts: distinct tuples of attribute names of the nodes.
+            node_layouts: index in layouts of the attribute names of each node.
+            columns: attribute name to object array of the values of that attribute for each node.
+            relationships: edge keys, indexed by relationship code.
+            out_edges: (indptr, neighbor ids, relationship codes) CSR arrays of the successors of each node.
+            in_edges: (indptr, neighbor ids, relationship codes) CSR arrays of the predecessors of each node.
+        """
+        self.node_names = node_names
+        self.relationships = relationships
+        self._node_ids = {node: i for i, node in enumerate(node_names)}
+        self._layouts = layouts
+        self._node_layouts = node_layouts
+        self._columns = columns
+        self._edges = {"out": out_edges, "in": in_edges}
+        self._layout_names = [frozenset(layout) for layout in layouts]
+        # per relationship arrays, built on first use; the graph can be shared between threads
+        self._relationship_arrays = {}
+        self._lock = threading.Lock()
+        # {direction: {node: adjacency}}, see adjacency
+        self._adjacency = {"out": {}, "in": {}}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # derived lookups are rebuilt when the graph is unpickled
+        state = self.__dict__.copy()
+        for name in ("_node_ids", "_layout_names", "_lock", "_adjacency"):
+            del state[name]
+        state["_relationship_arrays"] = {}
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._node_ids = {node: i for i, node in enumerate(self.node_names)}
+        self._layout_names = [frozenset(layout) for layout in self._layouts]
+        self._lock = threading.Lock()
+        self._adjacency = {"out": {}, "in": {}}
+
+    @classmethod
+    def from_networkx(cls, graph: nx.MultiDiGraph) -> "CompactSchemaGraph":
+        """Build a CompactSchemaGraph from a networkx multigraph, keeping its node, neighbor and key order."""
+        node_names = tuple(
+            sys.intern(node) if isinstance(node, str) else node for node in graph.nodes
+        )
+        node_ids = {node: i for i, node in enumerate(node_names)}
+        n_nodes = len(node_names)
+
+        layout_ids = {}
+        node_layouts = np.empty(n_nodes, dtype=np.int32)
+        columns = {}
+
+        for i, (_, attrs) in enumerate(graph.nodes(data=True)):
+            node_layouts[i] = layout_ids.setdefault(tuple(attrs), len(layout_ids))
+
+            for name, value in attrs.items():
+                if name not in columns:
+                    columns[name] = np.empty(n_nodes, dtype=object)
+                columns[name][i] = value
+
+        relationship_codes = {}
+
+        def adjacency_arrays(adjacency) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+            neighbors = []
+            codes = []
+
+            for i, node in enumerate(node_names):
+                for neighbor, keys in adjacency[node].items():
+                    for key in keys:
+                        neighbors.append(node_ids[neighbor])
+                        codes.append(relationship_codes.setdefault(key, len(relationship_codes)))
+                indptr[i + 1] = len(neighbors)
+
+            return (
+                indptr,
+                np.array(neighbors, dtype=np.int32),
+                np.array(codes, dtype=np.int16),
+            )
+
+        out_edges = adjacency_arrays(graph.succ)
+        in_edges = adjacency_arrays(graph.pred)
+
+        return cls(
+            node_names,
+            list(layout_ids),
+            node_layouts,
+            columns,
+            tuple(relationship_codes),
+            out_edges,
+            in_edges,
+        )
+
+    def __len__(self) -> int:
+        return len(self.node_names)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._node_ids
+
+    def node_id(self, node: Hashable) -> int:
+        """Id of a node; raises KeyError if the node is not in the graph."""
+        return self._node_ids[node]
+
+    def node_attributes(self, node: Hashable) -> "_NodeAttributeView":
+        """Read-only mapping of the attributes of a node; raises KeyError if the node is not in the graph."""
+        return _NodeAttributeView(self, self._node_ids[node])
+
+    def adjacency(self, node: Hashable, direction: str = "out") -> Mapping:
+        """Read-only networkx-style {neighbor: {key: {}}} mapping of the successors ("out") or predecessors ("in") of a node.
+
+        The mapping is built on first access and kept for later accesses.
+        """
+        adjacency = self._adjacency[direction].get(node)
+        if adjacency is not None:
+            return adjacency
+
+        indptr, neighbors, codes = self._edges[direction]
+        i = self._node_ids[node]
+        keys = {}
+
+        for j in range(indptr[i], indptr[i + 1]):
+            keys.setdefault(self.node_names[neighbors[j]], {})[self.relationships[codes[j]]] = _NO_ATTRIBUTES
+
+        adjacency = MappingProxyType(
+            {neighbor: MappingProxyType(neighbor_keys) for neighbor, neighbor_keys in keys.items()}
+        )
+
+        # concurrent accesses of a node get the same mapping
+        return self._adjacency[direction].setdefault(node, adjacency)
+
+    def get_relationship_arrays(self, relationship: Hashable) -> Dict[str, np.ndarray]:
+        """Arrays of the edges of a relationship, in the order build_relationship_index indexes them.
+
+        Returns:
+            Dictionary with the "nodes" of the relationship digraph (ids, in order of first appearance in the
+            edges), the "in_digraph" mask of these nodes, "out" and "in" (indptr, indices) CSR arrays, and the
+            "out_nodes" and "in_nodes" that have successors / predecessors, in order of their first edge.
+        """
+        arrays = self._relationship_arrays.get(relationship)
+        if arrays is not None:
+            return arrays
+
+        with self._lock:
+            if relationship not in self._relationship_arrays:
+                self._relationship_arrays[relationship] = self._build_relationship_arrays(relationship)
+
+            return self._relationship_arrays[relationship]
+
+    def _build_relationship_arrays(self, relationship: Hashable) -> Dict[str, np.ndarray]:
+        indptr, neighbors, codes = self._edges["out"]
+        n_nodes = len(self.node_names)
+
+        if relationship in self.relationships:
+            selected = codes == self.relationships.index(relationship)
+        else:
+            selected = np.zeros(len(codes), dtype=bool)
+
+        sources = np.repeat(np.arange(n_nodes, dtype=np.int32), np.diff(indptr))[selected]
+        targets = neighbors[selected]
+
+        # digraph nodes, in the order the edges (sources[0], targets[0]), (sources[1], targets[1]), ... add them
+        endpoints = np.empty(2 * len(sources), dtype=np.int32)
+        endpoints[0::2] = sources
+        endpoints[1::2] = targets
+        _, first = np.unique(endpoints, return_index=True)
+        nodes = endpoints[np.sort(first)]
+
+        in_digraph = np.zeros(n_nodes, dtype=bool)
+        in_digraph[nodes] = True
+
+        # predecessors are listed in edge order, i.e. a stable sort of the edges by target
+        by_target = np.argsort(targets, kind="stable")
+        _, first_in = np.unique(targets, return_index=True)
+
+        return {
+            "nodes": nodes,
+            "in_digraph": in_digraph,
+            "out": _csr_from_sources(sources, targets, n_nodes),
+            "in": _csr_from_sources(targets[by_target], sources[by_target], n_nodes),
+            # nodes with successors / predecessors, in order of their first edge
+            "out_nodes": np.unique(sources),
+            "in_nodes": targets[np.sort(first_in)],
+        }
+
+    def neighbor_ids(self, node: Hashable, relationship: Hashable, direction: str = "out") -> np.ndarray:
+        """Ids of the successors ("out") or predecessors ("in") of a node through edges of a relationship."""
+        indptr, indices = self.get_relationship_arrays(relationship)[direction]
+        i = self._node_ids[node]
+
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def successors(self, node: Hashable, relationship: Hashable) -> List[Hashable]:
+        """Nodes connected to a node by an out-edge of a given relationship."""
+        return [self.node_names[j] for j in self.neighbor_ids(node, relationship, "out")]
+
+    def predecessors(self, node: Hashable, relationship: Hashable) -> List[Hashable]:
+        """Nodes connected to a node by an in-edge of a given relationship."""
+        return [self.node_names[j] for j in self.neighbor_ids(node, relationship, "in")]
+
+    def descendants(self, node: Hashable, relationship: Hashable) -> Set[Hashable]:
+        """Nodes reachable from a node through edges of a given relationship (like nx.descendants)."""
+        indptr, indices = self.get_relationship_arrays(relationship)["out"]
+        source = self._node_ids[node]
+        visited = np.zeros(len(self.node_names), dtype=bool)
+        frontier = [source]
+
+        while frontier:
+            neighbors = np.concatenate([indices[indptr[i]:indptr[i + 1]] for i in frontier])
+            neighbors = np.unique(neighbors[~visited[neighbors]])
+            visited[neighbors] = True
+            frontier = neighbors.tolist()
+
+        # like nx.descendants, the source is not its own descendant, even on a cycle
+        visited[source] = False
+
+        return {self.node_names[i] for i in np.flatnonzero(visited)}
+
+    def to_networkx(self) -> "CompactMultiDiGraph":
+        """Read-only networkx multigraph backed by this graph."""
+        return nx.freeze(CompactMultiDiGraph(self))
+
+    def relationship_digraph(self, relationship: Hashable) -> "CompactDiGraph":
+        """Read-only networkx digraph on the edges of a relationship, backed by this graph."""
+        return nx.freeze(CompactDiGraph(self, relationship))
+
+    def relationship_index(self, relationship_keys: List[Hashable]) -> Dict[Hashable, Dict[str, Any]]:
+        """Relationship index of the graph, see schematic.utils.schema_utils.build_relationship_index.
+
+        Args:
+            relationship_keys: relationships to index even if the graph has no edges of that type.
+        """
+        relationships = list(relationship_keys) + [
+            key for key in self.relationships if key not in relationship_keys
+        ]
+
+        return {
+            relationship: {
+                "digraph": self.relationship_digraph(relationship),
+                "successors": _RelationshipNeighbors(self, relationship, "out"),
+                "predecessors": _RelationshipNeighbors(self, relationship, "in"),
+            }
+            for relationship in relationships
+        }
+
+
+class _NodeAttributeView(Mapping):
+    """Read-only {attribute name: value} mapping of a node of a CompactSchemaGraph, backed by its columns."""
+
+    __slots__ = ("_compact", "_i")
+
+    def __init__(self, compact: CompactSchemaGraph, i: int) -> None:
+        self._compact = compact
+        self._i = i
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._compact._layout_names[self._compact._node_layouts[self._i]]:
+            raise KeyError(name)
+        return self._compact._columns[name][self._i]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._compact._layout_names[self._compact._node_layouts[self._i]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._compact._layouts[self._compact._node_layouts[self._i]])
+
+    def __len__(self) -> int:
+        return len(self._compact._layouts[self._compact._node_layouts[self._i]])
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def copy(self) -> Dict[str, Any]:
+        """New dictionary of the attributes, as MappingProxyType.copy."""
+        return dict(self.items())
+
+
+class _NodeAttributes(Mapping):
+    """{node: attributes} mapping of all nodes of a CompactSchemaGraph."""
+
+    def __init__(self, compact: CompactSchemaGraph) -> None:
+        self._compact = compact
+
+    def __getitem__(self, node: Hashable) -> _NodeAttributeView:
+        return self._compact.node_attributes(node)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._compact
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._compact.node_names)
+
+    def __len__(self) -> int:
+        return len(self._compact)
+
+
+class _MultiAdjacency(Mapping):
+    """{node: {neighbor: {key: {}}}} successor or predecessor mapping of all nodes of a CompactSchemaGraph."""
+
+    def __init__(self, compact: CompactSchemaGraph, direction: str) -> None:
+        self._compact = compact
+        self._direction = direction
+
+    def __getitem__(self, node: Hashable) -> Mapping:
+        return self._compact.adjacency(node, self._direction)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._compact
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._compact.node_names)
+
+    def __len__(self) -> int:
+        return len(self._compact)
+
+
+class _RelationshipMapping(Mapping):
+    """Base class of mappings over the nodes of the digraph of a relationship of a CompactSchemaGraph."""
+
+    def __init__(self, compact: CompactSchemaGraph, relationship: Hashable) -> None:
+        self._compact = compact
+        self._relationship = relationship
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return self._compact.get_relationship_arrays(self._relationship)
+
+    def _value(self, node: Hashable) -> Any:
+        raise NotImplementedError
+
+    def __getitem__(self, node: Hashable) -> Any:
+        if node not in self:
+            raise KeyError(node)
+        return self._value(node)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._compact and bool(
+            self._arrays()["in_digraph"][self._compact.node_id(node)]
+        )
+
+    def __iter__(self) -> Iterator[Hashable]:
+        names = self._compact.node_names
+        return (names[i] for i in self._arrays()["nodes"])
+
+    def __len__(self) -> int:
+        return len(self._arrays()["nodes"])
+
+
+class _RelationshipNodes(_RelationshipMapping):
+    """{node: {}} attribute mapping of the nodes of a relationship digraph (which have no attributes)."""
+
+    def _value(self, node: Hashable) -> Mapping:
+        return _NO_ATTRIBUTES
+
+
+class _RelationshipAdjacency(_RelationshipMapping):
+    """{node: {neighbor: {}}} successor or predecessor mapping of a relationship digraph.
+
+    The read-only mapping of the neighbors of a node is built on first access and kept for later accesses.
+    """
+
+    def __init__(self, compact: CompactSchemaGraph, relationship: Hashable, direction: str) -> None:
+        super().__init__(compact, relationship)
+        self._direction = direction
+        self._neighbors = {}
+
+    def _value(self, node: Hashable) -> Mapping:
+        neighbors = self._neighbors.get(node)
+        if neighbors is not None:
+            return neighbors
+
+        names = self._compact.node_names
+        neighbors = MappingProxyType({
+            names[j]: _NO_ATTRIBUTES
+            for j in self._compact.neighbor_ids(node, self._relationship, self._direction)
+        })
+
+        # concurrent accesses of a node get the same mapping
+        return self._neighbors.setdefault(node, neighbors)
+
+
+class _RelationshipNeighbors(_RelationshipMapping):
+    """{node: [neighbors]} mapping of the nodes that have successors ("out") or predecessors ("in") in a relationship digraph."""
+
+    def __init__(self, compact: CompactSchemaGraph, relationship: Hashable, direction: str) -> None:
+        super().__init__(compact, relationship)
+        self._direction = direction
+
+    def _value(self, node: Hashable) -> List[Hashable]:
+        names = self._compact.node_names
+        return [
+            names[j]
+            for j in self._compact.neighbor_ids(node, self._relationship, self._direction)
+        ]
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self._compact and len(
+            self._compact.neighbor_ids(node, self._relationship, self._direction)
+        ) > 0
+
+    def __iter__(self) -> Iterator[Hashable]:
+        names = self._compact.node_names
+        return (names[i] for i in self._arrays()[f"{self._direction}_nodes"])
+
+    def __len__(self) -> int:
+        return len(self._arrays()[f"{self._direction}_nodes"])
+
+
+def _restore_compact_multidigraph(compact: CompactSchemaGraph) -> "CompactMultiDiGraph":
+    return compact.to_networkx()
+
+
+def _restore_compact_digraph(compact: CompactSchemaGraph, relationship: Hashable) -> "CompactDiGraph":
+    return compact.relationship_digraph(relationship)
+
+
+class CompactMultiDiGraph(nx.MultiDiGraph):
+    """Read-only networkx multigraph backed by a CompactSchemaGraph, see CompactSchemaGraph.to_networkx.
+
+    Without a CompactSchemaGraph (e.g. when networkx creates a new graph of the same class), this is a regular
+    MultiDiGraph. Copy it (nx.MultiDiGraph(graph)) to get a graph that can be modified.
+    """
+
+    def __init__(self, compact: CompactSchemaGraph = None, **attr) -> None:
+        super().__init__(**attr)
+        self.compact = compact
+
+        if compact is not None:
+            self._node = _NodeAttributes(compact)
+            self._adj = _MultiAdjacency(compact, "out")
+            self._pred = _MultiAdjacency(compact, "in")
+
+    def __reduce_ex__(self, protocol):
+        if self.compact is None:
+            return super().__reduce_ex__(protocol)
+        # pickle (and copy) the arrays, not the node dictionaries built from them
+        return (_restore_compact_multidigraph, (self.compact,))
+
+
+class CompactDiGraph(nx.DiGraph):
+    """Read-only networkx digraph on the edges of a relationship of a CompactSchemaGraph, see CompactSchemaGraph.relationship_digraph.
+
+    Without a CompactSchemaGraph, this is a regular DiGraph.
+    """
+
+    def __init__(self, compact: CompactSchemaGraph = None, relationship: Hashable = None, **attr) -> None:
+        super().__init__(**attr)
+        self.compact = compact
+        self.relationship = relationship
+
+        if compact is not None:
+            self._node = _RelationshipNodes(compact, relationship)
+            self._adj = _RelationshipAdjacency(compact, relationship, "out")
+            self._pred = _RelationshipAdjacency(compact, relationship, "in")
+
+    def __reduce_ex__(self, protocol):
+        if self.compact is None:
+            return super().__reduce_ex__(protocol)
+        return (_restore_compact_digraph, (self.compact, self.relationship))
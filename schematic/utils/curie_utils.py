@@ -70,8 +70,28 @@ def expand_curies_in_schema(schema):
     return new_schema
 
 
-def uri2label(uri, schema):
-    """Given a URI, return the label"""
-    return [
-        record["rdfs:label"] for record in schema["@graph"] if record["@id"] == uri
-    ][0]
+def build_uri_label_index(schema):
+    """Map the @id (URI or curie) of each record in a SchemaOrg JSON-LD schema to its label.
+
+    If several records share an @id, the label of the first one is kept, as in uri2label.
+    """
+    uri_index = {}
+    for record in schema["@graph"]:
+        uri_index.setdefault(record["@id"], record["rdfs:label"])
+    return uri_index
+
+
+def uri2label(uri, schema, uri_index=None):
+    """Given a URI, return the label
+
+    uri_index: optional mapping built by build_uri_label_index(schema), to avoid scanning the schema
+    on repeated lookups
+    """
+    if uri_index is None:
+        for record in schema["@graph"]:
+            if record["@id"] == uri:
+                return record["rdfs:label"]
+    elif uri in uri_index:
+        return uri_index[uri]
+
+    raise IndexError(f"No record with @id {uri} in the schema.")
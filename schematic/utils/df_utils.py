@@ -6,8 +6,15 @@ from copy import deepcopy
 import dateparser as dp
 import datetime as dt
 
+from functools import lru_cache
+
+from typing import Any, Callable
+
 logger = logging.getLogger(__name__)
 
+# maximum number of distinct values whose parsed dates are kept while loading a CSV in chunks
+max_cached_dates = 65536
+
 
 def load_df(file_path, preserve_raw_input=True, data_model=False, **load_args):
     """
@@ -24,7 +31,32 @@ def load_df(file_path, preserve_raw_input=True, data_model=False, **load_args):
     """
     #Read CSV to df as type specified in kwargs
     org_df = pd.read_csv(file_path, keep_default_na = True, encoding='utf8', **load_args)
-    
+
+    return _process_df(org_df, preserve_raw_input, data_model)
+
+
+def iter_load_df(file_path, chunksize, preserve_raw_input=True, data_model=False, **load_args):
+    """
+    Load a CSV in chunks of rows, processing each chunk like load_df
+    Only one chunk is held in memory at a time, whatever the size of the CSV. Chunks keep the
+    index of their rows in the CSV, i.e. the index of the first row of a chunk is the number of
+    rows before it.
+    Args:
+        file_path: path of csv to open
+        chunksize: number of rows of each chunk
+        preserve_raw_input, data_model, load_args: see load_df
+
+    Returns: iterator of processed dataframes
+    """
+    #Chunks usually repeat the values of previous chunks, parse each distinct date once per CSV
+    parse_dates = lru_cache(maxsize=max_cached_dates)(_parse_dates)
+
+    with pd.read_csv(file_path, keep_default_na = True, encoding='utf8', chunksize=chunksize, **load_args) as reader:
+        for org_df in reader:
+            yield _process_df(org_df, preserve_raw_input, data_model, parse_dates)
+
+
+def _process_df(org_df, preserve_raw_input, data_model, parse_dates=None):
     if preserve_raw_input:
         #only trim if not data model csv
         if not data_model:
@@ -38,8 +70,9 @@ def load_df(file_path, preserve_raw_input=True, data_model=False, **load_args):
         #Cast the columns in dataframe to string while preserving NaN
         null_cells = org_df.isnull() 
         org_df = org_df.astype(str).mask(null_cells, '')
-        ints = org_df.applymap(lambda x: np.int64(x) if str.isdigit(x) else False, na_action='ignore').fillna(False)
-        dates = org_df.applymap(lambda x: _parse_dates(x), na_action='ignore').fillna(False)
+        #Parse each distinct value of a column once
+        ints = org_df.apply(lambda col: map_unique_values(col, _parse_ints)).fillna(False)
+        dates = org_df.apply(lambda col: map_unique_values(col, parse_dates or _parse_dates)).fillna(False)
 
         #convert strings to numerical dtype (float) if possible, preserve non-numerical strings
         for col in org_df.columns:
@@ -56,6 +89,10 @@ def load_df(file_path, preserve_raw_input=True, data_model=False, **load_args):
         return processed_df
 
 
+def _parse_ints(int_string):
+    return np.int64(int_string) if str.isdigit(int_string) else False
+
+
 def _parse_dates(date_string):
     try:
         date = dp.parse(date_string = date_string, settings = {'STRICT_PARSING': True})
@@ -64,6 +101,27 @@ def _parse_dates(date_string):
         return False
 
 
+def map_unique_values(values: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """
+    Apply a function to each distinct value of a series, and broadcast the results back to every row
+    Equivalent to values.map(func), for functions without side effects, but func is called once per
+    distinct value rather than once per row; manifest columns usually repeat a few values over many rows.
+    Only series of strings are mapped by distinct value, as distinct values of other types may compare
+    equal (e.g. 1, 1.0 and True); other series are mapped row by row.
+    Args:
+        values: series to map
+        func: function to apply to each value
+    Returns: series of the results of func, with the index and name of values
+    """
+    if pd.api.types.infer_dtype(values, skipna=False) != "string":
+        return values.map(func)
+
+    codes, uniques = pd.factorize(values)
+    # results are converted to a common dtype as in Series.map
+    results = pd.Series(uniques, dtype=object).map(func).to_numpy()
+
+    return pd.Series(results.take(codes), index=values.index, name=values.name)
+
 
 def normalize_table(df: pd.DataFrame, primary_key: str) -> pd.DataFrame:
 
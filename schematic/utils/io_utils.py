@@ -3,22 +3,34 @@ import json
 import urllib.request
 
 from schematic import CONFIG, LOADER
+from schematic.utils.cache_utils import fetch_url, get_http_timeout
 
 
-def load_json(file_path):
-    """Load json document from file path or url
+def load_bytes(file_path):
+    """Load the raw content of a document from file path or url
+
+    Remote documents go through the HTTP cache (see schematic.utils.cache_utils.fetch_url).
 
     :arg str file_path: The path of the url doc, could be url or file path
     """
     if file_path.startswith("http"):
-        with urllib.request.urlopen(file_path) as url:
-            data = json.loads(url.read().decode())
-            return data
+        cached_path = fetch_url(file_path)
+        if cached_path is None:
+            with urllib.request.urlopen(file_path, timeout=get_http_timeout()) as url:
+                return url.read()
+        file_path = cached_path
+
     # handle file path
-    else:
-        with open(file_path, encoding="utf8") as f:
-            data = json.load(f)
-            return data
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def load_json(file_path):
+    """Load json document from file path or url
+
+    :arg str file_path: The path of the url doc, could be url or file path
+    """
+    return json.loads(load_bytes(file_path).decode("utf8"))
 
 
 def export_json(json_doc, file_path):
@@ -27,12 +39,16 @@ def export_json(json_doc, file_path):
         json.dump(json_doc, f, sort_keys=True, indent=4, ensure_ascii=False)
 
 
-def load_default():
-    """Load biolink vocabulary"""
+def get_default_path():
+    """Path to the biolink vocabulary"""
     data_path = "data_models/biothings.model.jsonld"
-    biothings_path = LOADER.filename(data_path)
 
-    return load_json(biothings_path)
+    return LOADER.filename(data_path)
+
+
+def load_default():
+    """Load biolink vocabulary"""
+    return load_json(get_default_path())
 
 
 def load_schemaorg():
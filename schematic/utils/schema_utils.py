@@ -1,11 +1,27 @@
 import networkx as nx
 import json
+import threading
 
+from bisect import bisect_left, insort
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from schematic.utils.compact_graph import CompactMultiDiGraph, CompactSchemaGraph
 from schematic.utils.curie_utils import extract_name_from_uri_or_curie
+from schematic.utils.general import dict2list
 from schematic.utils.validate_utils import validate_class_schema
 from schematic.utils.validate_rules_utils import validate_schema_rules
 
 
+# edge keys (i.e. relationship types) used in the schema graph
+RELATIONSHIP_KEYS = [
+    "parentOf",
+    "requiresDependency",
+    "requiresComponent",
+    "rangeValue",
+    "domainValue",
+]
+
+
 def load_schema_into_networkx(schema):
     G = nx.MultiDiGraph()
     for record in schema["@graph"]:
@@ -136,6 +152,261 @@ def load_schema_into_networkx(schema):
     return G
 
 
+def build_schema_graph(schema: dict, compact: bool = False) -> nx.MultiDiGraph:
+    """Build the graph of a JSON-LD schema (see load_schema_into_networkx).
+
+    Args:
+        schema: JSON-LD schema.
+        compact: if True, return a read-only graph backed by a CompactSchemaGraph, which uses less memory
+            than a networkx graph for large data models.
+
+    Returns:
+        Schema graph.
+    """
+    schema_nx = load_schema_into_networkx(schema)
+
+    if compact:
+        schema_nx = CompactSchemaGraph.from_networkx(schema_nx).to_networkx()
+
+    return schema_nx
+
+
+def _new_relationship_index() -> Dict[str, Any]:
+    return {"digraph": nx.DiGraph(), "successors": {}, "predecessors": {}}
+
+
+def build_relationship_index(schema_graph_nx: nx.MultiDiGraph) -> Dict[str, Dict[str, Any]]:
+    """Index the edges of a schema graph by relationship type, in a single pass over the edges.
+
+    Args:
+        schema_graph_nx: schema graph, as returned by load_schema_into_networkx.
+
+    Returns:
+        Dictionary with one entry per relationship (edge key) found in the graph, plus entries
+        for all RELATIONSHIP_KEYS. Each entry holds:
+            "digraph": frozen DiGraph on the edges of that relationship,
+            "successors": {node: [nodes connected to it by an out-edge]},
+            "predecessors": {node: [nodes connected to it by an in-edge]}.
+        The index of a compact graph (see build_schema_graph) is backed by the CompactSchemaGraph arrays.
+    """
+    if isinstance(schema_graph_nx, CompactMultiDiGraph) and schema_graph_nx.compact is not None:
+        return schema_graph_nx.compact.relationship_index(RELATIONSHIP_KEYS)
+
+    index = {rel: _new_relationship_index() for rel in RELATIONSHIP_KEYS}
+
+    for (u, v, key) in schema_graph_nx.edges(keys=True):
+        if key not in index:
+            index[key] = _new_relationship_index()
+
+        rel_index = index[key]
+
+        # parallel edges with the same key are indexed once
+        if rel_index["digraph"].has_edge(u, v):
+            continue
+
+        rel_index["digraph"].add_edge(u, v)
+        rel_index["successors"].setdefault(u, []).append(v)
+        rel_index["predecessors"].setdefault(v, []).append(u)
+
+    # the cached digraphs are shared by all callers, so they must not be modified
+    for rel_index in index.values():
+        nx.freeze(rel_index["digraph"])
+
+    return index
+
+
+class ClosureIndex:
+    """Transitive closure of a directed acyclic graph, for reachability queries in time proportional to the answer.
+
+    Nodes are numbered in a topological order of the graph, and the descendants (or ancestors) of each node are
+    stored as a sorted tuple of such positions, computed by dynamic programming over that order. The closure
+    of each direction is built on its first query, so memory is proportional to the number of reachable pairs
+    of the directions that are used. Queries return nodes in topological order.
+    """
+
+    def __init__(self, digraph: nx.DiGraph) -> None:
+        """
+        Args:
+            digraph: directed acyclic graph, e.g. the digraph of a relationship (see build_relationship_index).
+
+        Raises:
+            NetworkXUnfeasible: the graph has a cycle.
+        """
+        self.order = list(nx.topological_sort(digraph))
+        self.positions = {node: i for i, node in enumerate(self.order)}
+
+        # neighbor positions of each node, by direction; the closures are built from them on first use
+        self._neighbors = {
+            "descendants": [
+                [self.positions[neighbor] for neighbor in digraph.succ[node]] for node in self.order
+            ],
+            "ancestors": [
+                [self.positions[neighbor] for neighbor in digraph.pred[node]] for node in self.order
+            ],
+        }
+        self._closures = {}
+        # closure indexes are shared between threads, see SchemaSnapshot
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.positions
+
+    def _closure(self, direction: str) -> List[Tuple[int, ...]]:
+        """Sorted positions of the nodes reachable from each node in a direction, visiting neighbors first."""
+        closure = self._closures.get(direction)
+        if closure is not None:
+            return closure
+
+        with self._lock:
+            if direction not in self._closures:
+                neighbors = self._neighbors[direction]
+                n_nodes = len(self.order)
+                closure = [()] * n_nodes
+                positions = reversed(range(n_nodes)) if direction == "descendants" else range(n_nodes)
+
+                for i in positions:
+                    reachable = set()
+                    for j in neighbors[i]:
+                        reachable.add(j)
+                        reachable.update(closure[j])
+                    closure[i] = tuple(sorted(reachable))
+
+                self._closures[direction] = closure
+
+            return self._closures[direction]
+
+    def descendants(self, node: Hashable) -> List[Hashable]:
+        """Nodes reachable from a node (excluding the node), in topological order; raises KeyError if the node is not in the graph."""
+        return [self.order[i] for i in self._closure("descendants")[self.positions[node]]]
+
+    def ancestors(self, node: Hashable) -> List[Hashable]:
+        """Nodes from which a node is reachable (excluding the node), in topological order; raises KeyError if the node is not in the graph."""
+        return [self.order[i] for i in self._closure("ancestors")[self.positions[node]]]
+
+    def is_reachable(self, source: Hashable, target: Hashable) -> bool:
+        """Whether target is a descendant of source, in time logarithmic in the number of descendants."""
+        descendants = self._closure("descendants")[self.positions[source]]
+        i = bisect_left(descendants, self.positions[target])
+
+        return i < len(descendants) and descendants[i] == self.positions[target]
+
+
+def build_closure_index(digraph: nx.DiGraph) -> Optional[ClosureIndex]:
+    """Closure index of a digraph, or None if the digraph has a cycle (reachability queries then fall back to networkx)."""
+    try:
+        return ClosureIndex(digraph)
+    except nx.NetworkXUnfeasible:
+        return None
+
+
+def empty_relationship_index() -> Dict[str, Any]:
+    """Index entry for a relationship that has no edges in the schema graph."""
+    rel_index = _new_relationship_index()
+    nx.freeze(rel_index["digraph"])
+
+    return rel_index
+
+
+def _record_uris(record: dict, key: str) -> List[str]:
+    """Unique URIs / curies referenced by a JSON-LD record under a given key, in record order."""
+    uris = []
+    if key in record:
+        for item in dict2list(record[key]) or []:
+            if item["@id"] not in uris:
+                uris.append(item["@id"])
+
+    return uris
+
+
+def index_schema_record(index: Dict[str, dict], position: int, record: dict) -> None:
+    """Add a JSON-LD record at a given position of the schema @graph to a schema record index."""
+    keys = [("ids", record["@id"]), ("labels", record["rdfs:label"])]
+
+    if record["@type"] == "rdf:Property":
+        keys.extend(("domain", uri) for uri in _record_uris(record, "schema:domainIncludes"))
+        keys.extend(("range", uri) for uri in _record_uris(record, "schema:rangeIncludes"))
+
+    for (name, key) in keys:
+        insort(index[name].setdefault(key, []), position)
+
+    # keep track of what the record was indexed under; records may be modified in place before they are replaced
+    index["positions"][position] = keys
+
+
+def unindex_schema_record(index: Dict[str, dict], position: int) -> None:
+    """Remove the JSON-LD record at a given position of the schema @graph from a schema record index."""
+    for (name, key) in index["positions"].pop(position, []):
+        positions = index[name][key]
+        positions.remove(position)
+        if not positions:
+            del index[name][key]
+
+
+def build_schema_record_index(schema: dict) -> Dict[str, Dict[str, list]]:
+    """Index the records of a JSON-LD schema @graph in a single pass.
+
+    Args:
+        schema: JSON-LD schema.
+
+    Returns:
+        Dictionary mapping to sorted lists of positions of records in schema["@graph"]:
+            "ids": record @id (URI or curie) to records with that @id;
+            "labels": record rdfs:label to records with that label;
+            "domain": class URI to rdf:Property records whose schema:domainIncludes has that class;
+            "range": class URI to rdf:Property records whose schema:rangeIncludes has that class.
+        Positions are kept in @graph order so lookups return records in the same order as a scan of the @graph.
+        The "positions" entry is internal bookkeeping used by unindex_schema_record.
+    """
+    index = {"ids": {}, "labels": {}, "domain": {}, "range": {}, "positions": {}}
+
+    for position, record in enumerate(schema["@graph"]):
+        index_schema_record(index, position, record)
+
+    return index
+
+
+# version of the layout of compile_schema output; bump it when the layout changes to invalidate cached models
+COMPILED_SCHEMA_VERSION = 3
+
+
+def compile_schema(schema: dict, compact: bool = False) -> Dict[str, Any]:
+    """Compile a JSON-LD schema into the structures used to explore it.
+
+    Args:
+        schema: JSON-LD schema.
+        compact: if True, the schema graph is backed by a CompactSchemaGraph (see build_schema_graph).
+
+    Returns:
+        Dictionary with the "schema" itself, its networkx graph ("schema_nx"), and the
+        "relationship_index" and "record_index" derived from them. Closure indexes of relationships are
+        not part of the compiled schema; they are built on first use (see SchemaExplorer.get_closure_index).
+    """
+    schema_nx = build_schema_graph(schema, compact)
+
+    return _compile_schema_graph(schema, schema_nx, build_schema_record_index(schema))
+
+
+def _compile_schema_graph(
+    schema: dict, schema_nx: nx.MultiDiGraph, record_index: Dict[str, dict]
+) -> Dict[str, Any]:
+    return {
+        "schema": schema,
+        "schema_nx": schema_nx,
+        "relationship_index": build_relationship_index(schema_nx),
+        "record_index": record_index,
+    }
+
+
 def node_attrs_cleanup(class_add_mod: dict) -> dict:
     # clean map that will be inputted into the node/graph
     node = {}
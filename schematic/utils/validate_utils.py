@@ -3,6 +3,7 @@ import pandas as pd
 from jsonschema import validate
 from re import compile, search, IGNORECASE
 from schematic.utils.io_utils import load_json
+from schematic.utils.df_utils import map_unique_values
 from schematic import CONFIG, LOADER
 from typing import List
 
@@ -61,8 +62,10 @@ def parse_str_series_to_list(col: pd.Series):
         Output: ['a','b','c']     
 
     """
-    col = col.apply(
-        lambda x: [s.strip() for s in str(x).split(",")]
+    # parse each distinct string once
+    col = map_unique_values(
+        col, lambda x: [s.strip() for s in str(x).split(",")]
     )
 
-    return col
\ No newline at end of file
+    # copy the lists so that rows do not share them
+    return col.map(list)
\ No newline at end of file
@@ -64,18 +64,14 @@ class AttributesExplorer():
                 If unable hits an error while attempting to get conditional requirements. 
                 This error is likely to be found if there is a mismatch in naming.
         '''
-        # get all components
-        component_dg = self.sg.se.get_digraph_by_edge_type('requiresComponent')
-        components = component_dg.nodes()
+        # get the json schemas of all components
+        json_schemas = self.sg.get_all_json_schemas(schema_name=self.path_to_jsonld)
         # For each data type to be loaded gather all attribtes the user would
         # have to provide.
 
         df_store = []
-        for component in components:
+        for component, json_schema in json_schemas.items():
             data_dict = {}
-            # get the json schema
-            json_schema = self.sg.get_json_schema_requirements(
-                source_node=component, schema_name=self.path_to_jsonld)
 
             # Gather all attribues, their valid values and requirements
             for key, value in json_schema['properties'].items():
@@ -30,6 +30,12 @@ DATA_DIR = os.path.join(TESTS_DIR, "data")
 CONFIG_PATH = os.path.join(DATA_DIR, "test_config.yml")
 CONFIG.load_config(CONFIG_PATH)
 
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    # keep the objects cached by tests (e.g. compiled data models) out of the user's cache directory
+    monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path / "schematic_cache"))
+
+
 @pytest.fixture(scope="session")
 def dataset_id():
     yield "syn25614635"
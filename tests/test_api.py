@@ -226,6 +226,19 @@ class TestSchemaGeneratorOperation:
         assert response.status_code == 200
 
 
+    def test_get_schema_diff(self, client, data_model_jsonld):
+        params = {
+            "old_schema_url": data_model_jsonld,
+            "new_schema_url": data_model_jsonld
+        }
+
+        response = client.get("http://localhost:3001/v1/schemas/diff", query_string=params)
+        response_dt = json.loads(response.data)
+        assert response.status_code == 200
+
+        assert response_dt["nodes"] == {"added": [], "removed": [], "changed": {}}
+        assert response_dt["components"]["affected"] == []
+
     @pytest.mark.parametrize("return_display_names", [True, False])
     @pytest.mark.parametrize("node_label", ["FamilyHistory", "TissueStatus"])
     def test_get_node_range(self, client, data_model_jsonld, return_display_names, node_label):
@@ -0,0 +1,651 @@
+"""Benchmarks on synthetic data models.
+
+Each benchmark checks its results on growing inputs and logs the time taken, so that scaling can be
+compared across sizes (run with ``pytest -m benchmark -o log_cli=true --log-cli-level=INFO``). Timings
+are not asserted on, since they depend on the machine running the tests.
+"""
+import json
+import logging
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.models.validate_attribute import ValidateAttribute
+from schematic.models.columnar_schema import ColumnarSchemaValidator, iter_row_errors
+from schematic.models.metadata import MetadataModel
+from schematic.configuration import CONFIG
+from schematic.models.validate_manifest import ValidateManifest, _UniqueState
+from schematic.models.validation_plan import RulePlan
+from schematic.schemas.diff import diff_schemas
+from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.df_utils import load_df
+
+logger = logging.getLogger(__name__)
+
+
+def _class_record(
+    label,
+    display_name,
+    required=False,
+    parents=None,
+    dependencies=None,
+    range_values=None,
+    validation_rules=None,
+    components=None,
+):
+    record = {
+        "@id": f"bts:{label}",
+        "@type": "rdfs:Class",
+        "rdfs:comment": "TBD",
+        "rdfs:label": label,
+        "rdfs:subClassOf": [{"@id": f"bts:{p}"} for p in (parents or ["Thing"])],
+        "schema:isPartOf": {"@id": "http://schema.biothings.io"},
+        "sms:displayName": display_name,
+        "sms:required": "sms:true" if required else "sms:false",
+        "sms:validationRules": validation_rules or [],
+    }
+    if dependencies:
+        record["sms:requiresDependency"] = [{"@id": f"bts:{d}"} for d in dependencies]
+    if range_values:
+        record["schema:rangeIncludes"] = [{"@id": f"bts:{v}"} for v in range_values]
+    if components:
+        record["sms:requiresComponent"] = [{"@id": f"bts:{c}"} for c in components]
+    return record
+
+
+def synthetic_model(n_attributes, n_values=3, n_components=1):
+    """JSON-LD data model with a component, "Component0", depending on n_attributes attributes.
+
+    Every other attribute has n_values valid values; the first valid value of each attribute makes a
+    conditional attribute required, the other attributes are a mix of required/optional and list/non-list.
+    Component i requires components 2i + 1 and 2i + 2, up to n_components components.
+    """
+    graph = [_class_record("Thing", "Thing")]
+    attributes = []
+
+    for i in range(n_attributes):
+        label = f"Attribute{i}"
+        values = (
+            [f"Attribute{i}Value{j}" for j in range(n_values)] if i % 2 == 0 else []
+        )
+        graph.append(
+            _class_record(
+                label,
+                f"Attribute {i}",
+                required=i % 3 != 0,
+                range_values=values,
+                validation_rules=["list"] if i % 4 == 0 else None,
+            )
+        )
+
+        for j, value in enumerate(values):
+            graph.append(
+                _class_record(
+                    value,
+                    f"Attribute {i} Value {j}",
+                    parents=[label],
+                    dependencies=[f"Conditional{i}"] if j == 0 else None,
+                )
+            )
+
+        if values:
+            graph.append(
+                _class_record(
+                    f"Conditional{i}",
+                    f"Conditional {i}",
+                    required=i % 5 != 0,
+                    range_values=[values[-1]] if i % 6 == 0 else None,
+                )
+            )
+
+        attributes.append(label)
+
+    for i in range(n_components):
+        graph.append(
+            _class_record(
+                f"Component{i}",
+                f"Component {i}",
+                dependencies=attributes if i == 0 else None,
+                components=[f"Component{j}" for j in (2 * i + 1, 2 * i + 2) if j < n_components],
+            )
+        )
+
+    return {"@context": {}, "@graph": graph, "@id": "http://schema.biothings.io/#0.1"}
+
+
+def synthetic_class_hierarchy(depth, width=2):
+    """JSON-LD data model with depth layers of width classes; each class inherits from all classes of the layer above.
+
+    The classes of the last layer have width ** (depth - 1) paths to the root class, "Thing".
+    """
+    graph = [_class_record("Thing", "Thing")]
+    parents = ["Thing"]
+
+    for i in range(depth):
+        layer = [f"Class{i}x{j}" for j in range(width)]
+        graph.extend(
+            _class_record(label, label, parents=parents) for label in layer
+        )
+        parents = layer
+
+    return {"@context": {}, "@graph": graph, "@id": "http://schema.biothings.io/#0.1"}
+
+
+@pytest.fixture
+def synthetic_model_path(tmp_path):
+    def _synthetic_model_path(n_attributes, **kwargs):
+        path = tmp_path / f"synthetic{n_attributes}.model.jsonld"
+        with open(path, "w") as f:
+            json.dump(synthetic_model(n_attributes, **kwargs), f)
+        return str(path)
+
+    return _synthetic_model_path
+
+
+@pytest.mark.benchmark
+class TestJsonSchemaBenchmark:
+    @pytest.mark.parametrize("n_attributes", [250, 500, 1000, 2000])
+    def test_get_json_schema_requirements(self, synthetic_model_path, n_attributes):
+
+        sg = SchemaGenerator(synthetic_model_path(n_attributes))
+
+        start = time.perf_counter()
+        json_schema = sg.get_json_schema_requirements("Component0", "Component0")
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"JSON schema for {n_attributes} attributes generated in {elapsed:.3f}s "
+            f"({1e6 * elapsed / sg.se.get_nx_schema().number_of_nodes():.1f}us per node)"
+        )
+
+        # all attributes and conditional attributes are in the schema
+        assert len(json_schema["properties"]) == n_attributes + (n_attributes + 1) // 2
+        # one conditional requirement per attribute with valid values
+        assert len(json_schema["allOf"]) == (n_attributes + 1) // 2
+
+    @pytest.mark.parametrize("n_attributes", [250, 1000, 4000])
+    def test_shared_valid_values(self, tmp_path, monkeypatch, n_attributes):
+        # every attribute has the same valid values, so each of them is in the range of n_attributes nodes
+        values = [f"SharedValue{j}" for j in range(3)]
+        attributes = [f"Attribute{i}" for i in range(n_attributes)]
+        graph = [_class_record("Thing", "Thing")]
+        graph.extend(_class_record(value, value) for value in values)
+        graph.extend(
+            _class_record(label, label, required=True, range_values=values)
+            for label in attributes
+        )
+        graph.append(_class_record("Component0", "Component0", dependencies=attributes))
+
+        path = tmp_path / "shared.model.jsonld"
+        with open(path, "w") as f:
+            json.dump({"@context": {}, "@graph": graph, "@id": "http://schema.biothings.io/#0.1"}, f)
+
+        sg = SchemaGenerator(str(path))
+
+        # count how many times nodes are taken off the queue and checked
+        checked_nodes = []
+        get_node_info = SchemaGenerator._get_json_schema_node_info
+
+        def _get_json_schema_node_info(self, node, mm_graph):
+            checked_nodes.append(node)
+            return get_node_info(self, node, mm_graph)
+
+        monkeypatch.setattr(
+            SchemaGenerator, "_get_json_schema_node_info", _get_json_schema_node_info
+        )
+
+        start = time.perf_counter()
+        json_schema = sg.get_json_schema_requirements("Component0", "Component0")
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"JSON schema for {n_attributes} attributes sharing valid values generated in {elapsed:.3f}s, "
+            f"{len(checked_nodes)} nodes checked"
+        )
+
+        assert len(json_schema["properties"]) == n_attributes
+        # the work is linear in the number of nodes, not in the number of range edges
+        assert len(checked_nodes) <= 2 * (n_attributes + len(values))
+
+
+@pytest.mark.benchmark
+class TestComponentRequirementsBenchmark:
+    @pytest.mark.parametrize("n_components", [100, 1000, 10000])
+    def test_get_component_requirements(self, synthetic_model_path, n_components):
+
+        sg = SchemaGenerator(synthetic_model_path(10, n_components=n_components))
+        # the closure index is built on the first query
+        sg.get_component_requirements("Component0")
+
+        start = time.perf_counter()
+        for i in range(100):
+            req_components = sg.get_component_requirements(f"Component{i}")
+        elapsed = (time.perf_counter() - start) / 100
+
+        logger.info(
+            f"Component requirements among {n_components} components in {1e3 * elapsed:.3f}ms per query"
+        )
+
+        # required components come before the components requiring them
+        req_components = sg.get_component_requirements("Component0")
+        assert len(req_components) == n_components
+        assert req_components[-1] == "Component0"
+        assert req_components.index("Component1") < req_components.index("Component0")
+        assert req_components.index("Component3") < req_components.index("Component1")
+
+
+@pytest.mark.benchmark
+class TestParentClassesBenchmark:
+    @pytest.mark.parametrize("depth", [10, 20, 40, 80])
+    def test_find_parent_classes(self, tmp_path, depth):
+
+        path = tmp_path / f"hierarchy{depth}.model.jsonld"
+        with open(path, "w") as f:
+            json.dump(synthetic_class_hierarchy(depth), f)
+
+        se = SchemaExplorer()
+        se.load_schema(str(path))
+
+        start = time.perf_counter()
+        paths = se.find_parent_classes(f"Class{depth - 1}x0")
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"Parent classes of a class with 2^{depth - 1} paths found in {1e3 * elapsed:.1f}ms"
+        )
+
+        assert len(paths) == min(2 ** (depth - 1), se.max_parent_paths)
+        assert all(len(_path) == depth and _path[0] == "Thing" for _path in paths)
+
+
+def _traced_peak(function):
+    """Result of function() and the peak memory (bytes) allocated while it ran, as traced by tracemalloc."""
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark
+class TestSchemaDiffBenchmark:
+    @pytest.mark.parametrize("n_attributes", [1000, 4000, 16000])
+    def test_diff_schemas(self, tmp_path, n_attributes):
+
+        schema = synthetic_model(n_attributes, n_components=10)
+        old_path = tmp_path / "old.model.jsonld"
+        with open(old_path, "w") as f:
+            json.dump(schema, f)
+
+        # change the validation rules of the last attribute
+        for record in schema["@graph"]:
+            if record["rdfs:label"] == f"Attribute{n_attributes - 1}":
+                record["sms:validationRules"] = ["int"]
+        new_path = tmp_path / "new.model.jsonld"
+        with open(new_path, "w") as f:
+            json.dump(schema, f)
+
+        old_se, new_se = SchemaExplorer(), SchemaExplorer()
+        old_se.load_schema(str(old_path))
+        new_se.load_schema(str(new_path))
+
+        start = time.perf_counter()
+        change_set = diff_schemas(old_se, new_se)
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"Data models with {n_attributes} attributes compared in {elapsed:.3f}s "
+            f"({1e6 * elapsed / new_se.get_nx_schema().number_of_nodes():.1f}us per node)"
+        )
+
+        assert list(change_set["validation_rules"]) == [f"Attribute{n_attributes - 1}"]
+        assert change_set["components"]["affected"] == ["Component0"]
+
+
+def synthetic_column(name, valid_value, invalid_value, n_rows, invalid_every=1000):
+    """Manifest column of n_rows valid values, with an invalid value every invalid_every rows."""
+    values = np.full(n_rows, valid_value, dtype=object)
+    values[::invalid_every] = invalid_value
+
+    return pd.Series(values, name=name)
+
+
+@pytest.mark.benchmark
+class TestValidateAttributeBenchmark:
+    @pytest.mark.parametrize(
+        "validation_method, rule, col",
+        [
+            ("type_validation", "int", synthetic_column("Check Int", 12, "12", 100000)),
+            ("type_validation", "num", pd.Series(np.arange(100000) / 3, name="Check Num")),
+            ("regex_validation", "regex search [a-f]", synthetic_column("Check Regex Single", "xbz", "xyz", 100000)),
+            ("regex_validation", "regex match [a-f]", synthetic_column("Check Regex List", "a,b,c", "a,x", 100000)),
+            ("list_validation", "list strict", synthetic_column("Check List", "a,b", "a", 100000)),
+        ],
+    )
+    def test_validation_method(self, helpers, validation_method, rule, col):
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        va = ValidateManifest(errors=[], manifest=None, manifestPath=None, sg=sg, jsonSchema=None)
+
+        start = time.perf_counter()
+        results = getattr(ValidateAttribute, validation_method)(va, rule, col, sg)
+        elapsed = time.perf_counter() - start
+
+        logger.info(f"{validation_method} ({rule}) of {len(col)} rows in {elapsed:.3f}s")
+
+        errors = results[0] + results[1]
+        expected_rows = [] if rule == "num" else [str(i + 2) for i in range(0, len(col), 1000)]
+        assert [error[0] for error in errors] == expected_rows
+
+
+@pytest.mark.benchmark
+class TestLoadDfBenchmark:
+    @pytest.mark.parametrize("n_rows", [1000, 10000, 100000])
+    def test_load_df(self, tmp_path, n_rows):
+
+        manifest_path = tmp_path / "manifest.csv"
+        pd.DataFrame(
+            {
+                "Component": ["Biospecimen"] * n_rows,
+                "Assay": ["RNAseq", "WGS", "ATAC", "SNP array"] * (n_rows // 4),
+                "Collection Date": ["2022-01-03", "03/04/2021"] * (n_rows // 2),
+                "Age": ["12", "7", "2.5", "unknown"] * (n_rows // 4),
+            }
+        ).to_csv(manifest_path, index=False)
+
+        start = time.perf_counter()
+        manifest = load_df(str(manifest_path), preserve_raw_input=False)
+        elapsed = time.perf_counter() - start
+
+        logger.info(f"Manifest of {n_rows} rows loaded in {elapsed:.3f}s")
+
+        assert len(manifest) == n_rows
+        assert manifest["Age"].tolist()[:4] == [12, 7, 2.5, "unknown"]
+        assert isinstance(manifest["Age"].iloc[0], np.int64)
+        assert manifest["Collection Date"].iloc[0].year == 2022
+
+
+@pytest.mark.benchmark
+class TestParallelValidationBenchmark:
+    @pytest.mark.parametrize("workers", [1, 2, 4])
+    def test_validate_manifest_rules(self, synthetic_model_path, workers):
+
+        n_attributes = 200
+        n_rows = 5000
+        sg = SchemaGenerator(synthetic_model_path(n_attributes))
+
+        # every fourth attribute is validated as a list
+        manifest = pd.DataFrame(
+            {
+                f"Attribute {i}": synthetic_column(f"Attribute {i}", "a,b", "a", n_rows)
+                for i in range(n_attributes)
+            }
+        )
+
+        vm = ValidateManifest(errors=[], manifest=manifest, manifestPath=None, sg=sg, jsonSchema=None)
+
+        start = time.perf_counter()
+        _, errors, warnings = vm.validate_manifest_rules(
+            manifest, sg, restrict_rules=True, project_scope=None, workers=workers
+        )
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"Rules of {n_attributes} columns of {n_rows} rows validated with {workers} workers in {elapsed:.3f}s"
+        )
+
+        # list attributes are required unless i % 3 == 0, in which case errors are warnings
+        list_attributes = range(0, n_attributes, 4)
+        assert len(errors) + len(warnings) == len(list_attributes) * len(range(0, n_rows, 1000))
+        assert [error[1] for error in errors] == [
+            f"Attribute {i}" for i in list_attributes if i % 3 != 0 for _ in range(0, n_rows, 1000)
+        ]
+
+
+@pytest.mark.benchmark
+class TestGreatExpectationsBenchmark:
+    def test_repeat_validation(self, helpers):
+
+        n_rows = 1000
+        n_runs = 5
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent"] * n_rows,
+                "Check Num": synthetic_column("Check Num", 7, "seven", n_rows),
+                "Check Range": synthetic_column("Check Range", 60, 120, n_rows),
+                "Check Unique": [f"value {i}" for i in range(n_rows)],
+            }
+        )
+        vm = ValidateManifest(errors=[], manifest=manifest, manifestPath=None, sg=sg, jsonSchema=None)
+
+        elapsed = []
+        for _ in range(n_runs):
+            start = time.perf_counter()
+            _, errors, warnings = vm.validate_manifest_rules(
+                manifest.copy(), sg, restrict_rules=False, project_scope=None
+            )
+            elapsed.append(time.perf_counter() - start)
+
+            # num and range errors every 1000 rows
+            assert sorted(error[1] for error in errors + warnings) == ["Check Num", "Check Range"]
+
+        logger.info(
+            f"Great Expectations validation of {n_rows} rows in {elapsed[0]:.3f}s, "
+            f"then {min(elapsed[1:]):.3f}s with the context and suite reused"
+        )
+
+
+@pytest.mark.benchmark
+class TestNativeExpectationsBenchmark:
+    @pytest.mark.parametrize("n_rows", [1000, 10000, 50000])
+    def test_validate_manifest_rules(self, helpers, monkeypatch, tmp_path, n_rows):
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent"] * n_rows,
+                "Check Num": synthetic_column("Check Num", 7, "seven", n_rows),
+                "Check Int": synthetic_column("Check Int", 12, 2.5, n_rows),
+                "Check String": synthetic_column("Check String", "a", 1, n_rows),
+                "Check Recommended": [""] * n_rows,
+                "Check Ages": synthetic_column("Check Ages", 7000, 100, n_rows),
+                "Check Range": synthetic_column("Check Range", 60, 120, n_rows),
+                "Check Unique": [f"value {i}" for i in range(n_rows)],
+            }
+        )
+        # ages are censored in a copy of the manifest, next to it
+        vm = ValidateManifest(
+            errors=[], manifest=manifest, manifestPath=str(tmp_path / "manifest.csv"), sg=sg, jsonSchema=None
+        )
+
+        elapsed = {}
+        results = {}
+        for engine in ["great_expectations", "native"]:
+            monkeypatch.setitem(CONFIG.DATA, "validation", {"engine": engine})
+
+            start = time.perf_counter()
+            results[engine] = vm.validate_manifest_rules(
+                manifest.copy(), sg, restrict_rules=False, project_scope=None
+            )
+            elapsed[engine] = time.perf_counter() - start
+
+        logger.info(
+            f"Expectations of {n_rows} rows validated in {elapsed['great_expectations']:.3f}s by Great Expectations, "
+            f"{elapsed['native']:.3f}s natively"
+        )
+
+        assert results["native"][1:] == results["great_expectations"][1:]
+        pd.testing.assert_frame_equal(results["native"][0], results["great_expectations"][0])
+
+
+@pytest.mark.benchmark
+class TestUniqueStateBenchmark:
+    def test_update(self):
+
+        chunksize = 10000
+        rule_plan = RulePlan("unique error", True)
+
+        def stream(n_rows):
+            # every value is repeated 1000 rows later, once in a while
+            values = np.array([f"value {i}" for i in range(n_rows)], dtype=object)
+            values[1000::5000] = values[:-1000:5000]
+            unique_state = _UniqueState(rule_plan, "Check Unique")
+
+            start = time.perf_counter()
+            for row_offset in range(0, n_rows, chunksize):
+                chunk = pd.Series(values[row_offset:row_offset + chunksize], index=range(chunksize))
+                unique_state.update(chunk, row_offset)
+            elapsed = time.perf_counter() - start
+
+            logger.info(f"Unique values of {n_rows} rows tracked in chunks in {elapsed:.3f}s")
+            assert sum(len(rows) for rows in unique_state.duplicate_rows) == 2 * len(range(1000, n_rows, 5000))
+
+            return elapsed
+
+        # warm up
+        stream(chunksize)
+
+        # four times the rows take about four times as long, not sixteen
+        elapsed = [stream(n_rows) for n_rows in [200000, 800000]]
+        assert elapsed[1] < 8 * elapsed[0]
+
+
+@pytest.mark.benchmark
+class TestStreamingValidationBenchmark:
+    def test_iter_validate_model_manifest(self, helpers, tmp_path):
+
+        metadata_model = MetadataModel(
+            inputMModelLocation=helpers.get_data_path("example.model.jsonld"),
+            inputMModelLocationType="local",
+        )
+
+        def write_manifest(n_rows):
+            manifest_path = tmp_path / f"manifest_{n_rows}.csv"
+            pd.DataFrame(
+                {
+                    "Component": ["MockComponent"] * n_rows,
+                    "Check List": synthetic_column("Check List", "a,b", "a", n_rows),
+                    "Check Regex Single": synthetic_column("Check Regex Single", "xbz", "xyz", n_rows),
+                    "Check Num": synthetic_column("Check Num", "7", "seven", n_rows),
+                }
+            ).to_csv(manifest_path, index=False)
+
+            return manifest_path
+
+        def validate(manifest_path):
+            n_errors = 0
+            for errors, warnings in metadata_model.iterValidateModelManifest(
+                str(manifest_path), "MockComponent", jsonSchema={"type": "object"}, chunksize=1000,
+            ):
+                n_errors += len(errors) + len(warnings)
+            return n_errors
+
+        # warm up the caches of dateparser, which would dominate the peak memory
+        validate(write_manifest(1000))
+
+        peaks = []
+        for n_rows in [5000, 20000]:
+            manifest_path = write_manifest(n_rows)
+
+            start = time.perf_counter()
+            n_errors, peak = _traced_peak(lambda: validate(manifest_path))
+            elapsed = time.perf_counter() - start
+            peaks.append(peak)
+
+            logger.info(
+                f"Manifest of {n_rows} rows validated in chunks in {elapsed:.3f}s with a peak of {peak / 2**20:.1f}MB"
+            )
+
+            # list, regex and num errors every 1000 rows
+            assert n_errors == 3 * len(range(0, n_rows, 1000))
+
+        # peak memory is bounded by the chunks, not the number of rows
+        assert peaks[1] < 2 * peaks[0]
+
+
+@pytest.mark.benchmark
+class TestColumnarSchemaBenchmark:
+    @pytest.mark.parametrize("n_rows", [1000, 20000])
+    def test_iter_errors(self, helpers, n_rows):
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        json_schema = sg._build_json_schema("Patient", "Patient_validation")
+
+        manifest = pd.DataFrame(
+            {
+                "Patient ID": [f"p{i}" for i in range(n_rows)],
+                "Sex": synthetic_column("Sex", "Female", "Unknown", n_rows),
+                "Diagnosis": ["Healthy", "Cancer"] * (n_rows // 2),
+                "Component": ["Patient"] * n_rows,
+                "Cancer Type": ["", "Lung"] * (n_rows // 2),
+                "Family History": [[""], ["Lung", "Skin"]] * (n_rows // 2),
+            }
+        )
+
+        start = time.perf_counter()
+        row_errors = list(iter_row_errors(manifest, json_schema))
+        row_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar_errors = list(ColumnarSchemaValidator(json_schema).iter_errors(manifest))
+        columnar_elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"JSON schema errors of {n_rows} rows found in {row_elapsed:.3f}s row by row, "
+            f"in {columnar_elapsed:.3f}s by column"
+        )
+
+        assert [(row, error.message) for row, error in columnar_errors] == [
+            (row, error.message) for row, error in row_errors
+        ]
+        assert [row for row, _ in columnar_errors] == list(range(0, n_rows, 1000))
+
+
+@pytest.mark.benchmark
+class TestConditionalsBenchmark:
+    @pytest.mark.parametrize("n_attributes", [100, 400])
+    def test_iter_errors(self, synthetic_model_path, n_attributes):
+
+        n_rows = 500
+        sg = SchemaGenerator(synthetic_model_path(n_attributes))
+        json_schema = sg._build_json_schema("Component0", "Component0_validation")
+
+        def valid_value(subschema):
+            if subschema.get("type") == "array":
+                return [subschema["items"]["enum"][0]]
+            return subschema.get("enum", ["a"])[0]
+
+        # attributes with valid values are set to their first value, which makes their conditional attribute
+        # required; all values are valid but the blank conditional attributes of every tenth attribute
+        manifest = pd.DataFrame(
+            {
+                prop: pd.Series([valid_value(subschema)] * n_rows, dtype=object)
+                for prop, subschema in json_schema["properties"].items()
+            }
+        )
+        blank_conditionals = [f"Conditional {i}" for i in range(2, n_attributes, 20)]
+        manifest[blank_conditionals] = ""
+
+        start = time.perf_counter()
+        row_errors = list(iter_row_errors(manifest, json_schema))
+        row_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar_errors = list(ColumnarSchemaValidator(json_schema).iter_errors(manifest))
+        columnar_elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"{len(json_schema['allOf'])} conditionals over {n_rows} rows evaluated in {row_elapsed:.3f}s "
+            f"row by row, in {columnar_elapsed:.3f}s by trigger"
+        )
+
+        assert columnar_errors
+        assert [(row, error.message) for row, error in columnar_errors] == [
+            (row, error.message) for row, error in row_errors
+        ]
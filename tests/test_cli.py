@@ -1,4 +1,5 @@
 import os
+import json
 
 import pytest
 
@@ -56,6 +57,22 @@ class TestSchemaCli:
 
         assert expected_substr in result.output
 
+    def test_schema_diff_cli(self, runner, data_model_jsonld, tmp_path):
+
+        output_path = str(tmp_path / "diff.json")
+
+        result = runner.invoke(
+            schema, ["diff", data_model_jsonld, data_model_jsonld, "--output_json", output_path]
+        )
+
+        assert result.exit_code == 0
+        assert f"The changes between the data models were saved to '{output_path}'." in result.output
+
+        with open(output_path) as f:
+            change_set = json.load(f)
+
+        assert change_set["components"] == {"added": [], "removed": [], "affected": []}
+
     # get manifest by default
     # by default this should download the manifest as a CSV file
     @pytest.mark.google_credentials_needed
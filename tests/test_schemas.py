@@ -1,10 +1,22 @@
 import os
+import copy
+import json
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+
+import networkx as nx
 import pandas as pd
 import pytest
 
-from schematic.schemas import df_parser
+from schematic.configuration import CONFIG
+from schematic.schemas import df_parser, generator
+from schematic.schemas.diff import diff_schemas, diff_schema_files
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator
+from schematic.schemas.snapshot import SchemaSnapshot, load_schema_snapshot
+from schematic.utils.cache_utils import PersistentLRUCache
+from schematic.utils.general import dict2list
 from schematic.utils.df_utils import load_df
 
 logging.basicConfig(level=logging.DEBUG)
@@ -268,4 +280,455 @@ class TestDfParser:
         assert(se_obj.get_class_label_from_display_name("model of manifestation") == "Modelofmanifestation")
         assert(se_obj.get_class_label_from_display_name("model of manifestation", strict_camel_case = True) == "ModelOfManifestation")
         assert(se_obj.get_class_label_from_display_name("model of manifestation") == "Modelofmanifestation")
-        assert(se_obj.get_class_label_from_display_name("model of manifestation", strict_camel_case = True) == "ModelOfManifestation")
\ No newline at end of file
+        assert(se_obj.get_class_label_from_display_name("model of manifestation", strict_camel_case = True) == "ModelOfManifestation")
+
+class TestSchemaExplorer:
+    def test_get_relationship_index(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        component_index = se_obj.get_relationship_index("requiresComponent")
+
+        assert component_index["successors"]["Biospecimen"] == ["Patient"]
+        assert "Biospecimen" in component_index["predecessors"]["Patient"]
+        assert component_index["digraph"].has_edge("Biospecimen", "Patient")
+
+        # unknown relationships resolve to an empty index
+        assert se_obj.get_relationship_index("notARelationship")["successors"] == {}
+
+    def test_get_adjacent_nodes_by_relationship(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        dependencies = se_obj.get_adjacent_nodes_by_relationship(
+            "Patient", "requiresDependency"
+        )
+
+        assert dependencies == ["PatientID", "Sex", "YearofBirth", "Diagnosis", "Component"]
+
+    def test_find_class_specific_properties(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        for schema_class in se_obj.get_nx_schema().nodes:
+            if "uri" not in se_obj.get_nx_schema().nodes[schema_class]:
+                continue
+            schema_uri = se_obj.get_nx_schema().nodes[schema_class]["uri"]
+
+            # properties found by scanning the JSON-LD @graph
+            expected = [
+                record["rdfs:label"]
+                for record in se_obj.schema["@graph"]
+                if record["@type"] == "rdf:Property"
+                and schema_uri
+                in [d["@id"] for d in dict2list(record["schema:domainIncludes"])]
+            ]
+
+            assert se_obj.find_class_specific_properties(schema_class) == expected
+
+    def test_record_index_kept_in_sync_on_edit(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        class_info = se_obj.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = {"@id": "bts:Thing"}
+        se_obj.update_class(class_info)
+
+        assert se_obj.get_schema_records("labels", "TestClass") == [class_info]
+        assert se_obj.get_schema_records("ids", "bts:TestClass") == [class_info]
+
+        class_info = dict(class_info, **{"rdfs:comment": "edited"})
+        se_obj.edit_class(class_info)
+
+        assert se_obj.get_schema_records("labels", "TestClass") == [class_info]
+
+    def test_explore_class_cache(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        class_info = se_obj.explore_class("Patient")
+        expected = copy.deepcopy(class_info)
+
+        # results are cached, and callers get their own copy
+        class_info["required"] = True
+        class_info["dependencies"].append("Sex")
+        assert se_obj.explore_class("Patient") == expected
+        assert se_obj.explore_class("Patient") is not se_obj.explore_class("Patient")
+
+        # editing the schema invalidates cached results
+        version = se_obj.get_schema_version()
+        class_template = se_obj.generate_class_template()
+        class_template["@id"] = "bts:TestClass"
+        class_template["rdfs:label"] = "TestClass"
+        class_template["rdfs:subClassOf"] = {"@id": "bts:Patient"}
+        se_obj.update_class(class_template)
+
+        assert se_obj.get_schema_version() > version
+        assert "TestClass" in se_obj.explore_class("Patient")["child_classes"]
+
+    def test_default_schema_is_lazy_and_shared(self):
+
+        se_obj = SchemaExplorer()
+        other_se_obj = SchemaExplorer()
+
+        # the default schema is only loaded on first access
+        assert "schema_nx" not in vars(se_obj)
+
+        assert se_obj.get_nx_schema() is other_se_obj.get_nx_schema()
+
+        # editing the schema does not affect other explorers sharing the default schema
+        class_info = se_obj.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = {"@id": "bts:Thing"}
+        se_obj.update_class(class_info)
+
+        assert "TestClass" in se_obj.get_nx_schema()
+        assert "TestClass" not in other_se_obj.get_nx_schema()
+        assert "TestClass" not in SchemaExplorer().get_nx_schema()
+
+    def test_compact_graph(self, helpers):
+
+        se = SchemaExplorer()
+        se.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        se_compact = SchemaExplorer(compact_graph=True)
+        se_compact.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        assert nx.is_frozen(se_compact.get_nx_schema())
+        assert se_compact.get_descendants_by_edge_type(
+            "Patient", "requiresDependency", ordered=True
+        ) == se.get_descendants_by_edge_type("Patient", "requiresDependency", ordered=True)
+        assert se_compact.find_parent_classes("Sex") == se.find_parent_classes("Sex")
+        assert se_compact.explore_class("Patient") == se.explore_class("Patient")
+
+        # editing the graph in place turns it into a regular networkx graph
+        class_info = se_compact.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = [{"@id": "bts:Patient"}]
+        se_compact.add_schema_object_nx(
+            class_info, **{"rdfs:subClassOf": {"parentOf": "in"}}
+        )
+
+        assert not nx.is_frozen(se_compact.get_nx_schema())
+        assert "TestClass" in se_compact.get_adjacent_nodes_by_relationship("Patient", "parentOf")
+
+    def test_closure_index(self, helpers):
+
+        se = SchemaExplorer()
+        se.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        for relationship in ["parentOf", "requiresDependency", "requiresComponent", "rangeValue"]:
+            digraph = se.get_digraph_by_edge_type(relationship)
+            closure = se.get_closure_index(relationship)
+
+            for node in digraph:
+                descendants = closure.descendants(node)
+                assert set(descendants) == nx.descendants(digraph, node)
+                assert set(closure.ancestors(node)) == nx.ancestors(digraph, node)
+                # descendants are topologically ordered
+                assert descendants == [n for n in closure.order if n in set(descendants)]
+
+                assert se.get_nodes_descendants(digraph, node) == descendants
+                assert all(closure.is_reachable(node, descendant) for descendant in descendants)
+                assert not closure.is_reachable(node, node)
+
+        ordered = se.get_descendants_by_edge_type("Patient", "requiresDependency", ordered=True)
+        assert ordered[0] == "Patient"
+        assert list(nx.topological_sort(
+            se.get_digraph_by_edge_type("requiresDependency").subgraph(ordered)
+        ))[0] == "Patient"
+
+    @pytest.mark.parametrize("closure", [True, False])
+    def test_get_descendants_of_sink(self, helpers, monkeypatch, closure):
+
+        se = SchemaExplorer()
+        se.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        if not closure:
+            # as for relationship digraphs with a cycle
+            monkeypatch.setattr(se, "get_closure_index", lambda relationship: None)
+
+        # Patient is only required by other components
+        assert "Patient" in se.get_digraph_by_edge_type("requiresComponent")
+        assert se.get_descendants_by_edge_type("Patient", "requiresComponent", ordered=True) == []
+        assert se.get_descendants_by_edge_type("Patient", "requiresComponent") == []
+        assert SchemaGenerator(
+            helpers.get_data_path("example.model.jsonld")
+        ).get_component_requirements("Patient") == []
+
+        assert se.get_descendants_by_edge_type("Biospecimen", "requiresComponent", ordered=True) == [
+            "Biospecimen", "Patient"
+        ]
+
+    def test_find_parent_classes(self, helpers):
+
+        se = SchemaExplorer()
+        se.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        digraph = se.get_digraph_by_edge_type("parentOf")
+        roots = [node for node in digraph if digraph.in_degree(node) == 0]
+
+        for node in ["Patient", "Sex", "Female"]:
+            expected = [
+                path[:-1]
+                for root in roots
+                for path in nx.all_simple_paths(digraph, root, node)
+            ]
+
+            assert sorted(se.find_parent_classes(node)) == sorted(expected)
+
+        assert se.find_parent_classes("Female") == [["DataProperty", "Sex"]]
+        # root classes have a single, empty path
+        assert se.find_parent_classes("Thing") == [[]]
+
+        # returned paths can be modified by the caller
+        se.find_parent_classes("Female")[0].append("Female")
+        assert se.find_parent_classes("Female") == [["DataProperty", "Sex"]]
+
+    def test_find_parent_classes_max_paths(self, helpers):
+
+        se = SchemaExplorer()
+        se.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        # a class with two parents has two paths to its root classes
+        class_info = se.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = [{"@id": "bts:Patient"}, {"@id": "bts:Biospecimen"}]
+        se.update_class(class_info)
+
+        assert len(se.find_parent_classes("TestClass")) == 2
+        assert len(se.find_parent_classes("TestClass", max_paths=1)) == 1
+
+
+class TestSchemaGenerator:
+    def test_get_node_label(self, helpers):
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+
+        assert sg.get_node_label("Patient ID") == "PatientID"
+        assert sg.get_node_label("Check Regex List") == "CheckRegexList"
+        assert sg.get_node_display_name("PatientID") == "Patient ID"
+
+        # names that are not in the model fall back to conversion and graph lookup
+        assert sg.get_node_label("Not In Model") == ""
+
+    def test_label_lookup_rebuilt_on_edit(self, helpers):
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+
+        assert "TestClass" not in sg.get_label_lookup()[1]
+
+        class_info = sg.se.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = {"@id": "bts:Thing"}
+        class_info["sms:displayName"] = "Test Class"
+        sg.se.update_class(class_info)
+
+        assert sg.get_node_display_name("TestClass") == "Test Class"
+        assert sg.get_label_lookup()[0]["Test Class"] == "TestClass"
+
+    def test_get_all_json_schemas(self, helpers):
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+
+        json_schemas = sg.get_all_json_schemas(schema_name="example")
+
+        assert set(json_schemas) == {"Patient", "Biospecimen", "BulkRNA-seqAssay"}
+
+        for component, json_schema in json_schemas.items():
+            assert json_schema == SchemaGenerator(
+                helpers.get_data_path("example.model.jsonld")
+            ).get_json_schema_requirements(component, "example")
+
+        # the JSON schemas do not share any objects
+        json_schemas["Patient"]["properties"]["Patient ID"]["minLength"] = 2
+        assert sg.get_all_json_schemas("example")["Patient"]["properties"]["Patient ID"]["minLength"] == 1
+
+    def test_get_cached_json_schema_requirements(self, helpers, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(generator, "json_schema_cache", PersistentLRUCache("json_schemas"))
+
+        sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        expected = sg.get_json_schema_requirements("Patient", "Patient_validation")
+
+        assert sg.get_cached_json_schema_requirements("Patient", "Patient_validation") == expected
+        assert generator.json_schema_cache.cache_info()["misses"] == 1
+
+        # a new generator for the same data model reuses the schema
+        sg_other = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        assert sg_other.get_cached_json_schema_requirements("Patient", "Patient_validation") == expected
+        assert generator.json_schema_cache.cache_info()["hits"] == 1
+
+        # reused schemas are stored for inspection too
+        log_file = tmp_path / "logs" / "Patient.schema.json"
+        monkeypatch.setitem(CONFIG.DATA["model"]["input"], "log_location", str(log_file))
+        sg_other.get_cached_json_schema_requirements("Patient", "Patient_validation")
+        assert generator.json_schema_cache.cache_info()["hits"] == 2
+        with open(log_file) as f:
+            assert json.load(f) == expected
+
+        # schemas are regenerated when the version of the cached schemas changes
+        monkeypatch.setattr(generator, "JSON_SCHEMA_CACHE_VERSION", generator.JSON_SCHEMA_CACHE_VERSION + 1)
+        assert sg_other.get_cached_json_schema_requirements("Patient", "Patient_validation") == expected
+        assert generator.json_schema_cache.cache_info()["misses"] == 2
+
+        # schemas of edited data models are not cached
+        class_info = sg_other.se.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = {"@id": "bts:Thing"}
+        sg_other.se.update_class(class_info)
+
+        assert sg_other.se.get_schema_hash() is None
+        sg_other.get_cached_json_schema_requirements("Patient", "Patient_validation")
+        assert generator.json_schema_cache.cache_info()["misses"] == 2
+
+
+class TestSchemaSnapshot:
+    def _test_class_info(self, se):
+        class_info = se.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = [{"@id": "bts:Patient"}]
+        return class_info
+
+    def test_snapshot_is_not_affected_by_edits(self, helpers):
+
+        se = SchemaExplorer()
+        se.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        snapshot = SchemaSnapshot.from_explorer(se)
+
+        # editing the explorer the snapshot was taken from
+        se.update_class(self._test_class_info(se))
+        se.add_schema_object_nx(
+            self._test_class_info(se), **{"rdfs:subClassOf": {"parentOf": "in"}}
+        )
+        assert "TestClass" in se.get_nx_schema()
+
+        # editing an explorer on the snapshot
+        se_snapshot = snapshot.explorer()
+        se_snapshot.edit_schema_object_nx(dict(se_snapshot.schema["@graph"][0]))
+        se_snapshot.update_class(self._test_class_info(se_snapshot))
+
+        assert "TestClass" not in snapshot.explorer().get_nx_schema()
+        assert not snapshot.explorer().get_schema_records("labels", "TestClass")
+
+    def test_snapshot_of_default_schema(self):
+
+        se = SchemaExplorer()
+        snapshot = SchemaSnapshot.from_explorer(se)
+
+        # the default schema graph, which all SchemaExplorer objects share, is not frozen by the snapshot
+        assert nx.is_frozen(snapshot.explorer().get_nx_schema())
+        assert not nx.is_frozen(se.get_nx_schema())
+        assert not nx.is_frozen(SchemaExplorer().get_nx_schema())
+
+    def test_concurrent_closure_index(self, helpers):
+
+        snapshot = load_schema_snapshot(helpers.get_data_path("example.model.jsonld"))
+        explorers = [snapshot.explorer() for _ in range(8)]
+
+        def get_closure_index(se):
+            return se.get_closure_index("rangeValue")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            closures = list(executor.map(get_closure_index, explorers))
+
+        # built once, in the relationship index of the snapshot
+        assert all(closure is closures[0] for closure in closures)
+
+    def test_snapshot_edits(self, helpers):
+
+        snapshot = load_schema_snapshot(helpers.get_data_path("example.model.jsonld"))
+        se = snapshot.explorer()
+
+        edited = snapshot.update_class(self._test_class_info(se))
+
+        assert edited is not snapshot
+        assert "TestClass" in edited.explorer().get_nx_schema()
+        assert "TestClass" not in snapshot.explorer().get_nx_schema()
+        assert edited.schema_hash is None and snapshot.schema_hash is not None
+
+        # snapshots are shared for unchanged data models
+        assert load_schema_snapshot(helpers.get_data_path("example.model.jsonld")) is snapshot
+
+    def test_concurrent_reads(self, helpers):
+
+        snapshot = load_schema_snapshot(helpers.get_data_path("example.model.jsonld"))
+        expected = snapshot.generator().get_all_json_schemas("example")
+
+        def get_json_schemas(_):
+            return snapshot.generator().get_all_json_schemas("example")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(get_json_schemas, range(16)))
+
+        assert all(result == expected for result in results)
+
+
+class TestSchemaDiff:
+    def test_diff_schema_files(self, helpers, tmp_path):
+
+        schema_path = helpers.get_data_path("example.model.jsonld")
+        with open(schema_path) as f:
+            schema = json.load(f)
+
+        for record in schema["@graph"]:
+            if record["rdfs:label"] == "YearofBirth":
+                record["sms:validationRules"] = ["int"]
+            elif record["rdfs:label"] == "Sex":
+                # remove the "Other" valid value
+                record["schema:rangeIncludes"] = record["schema:rangeIncludes"][:2]
+
+        new_schema_path = str(tmp_path / "example.model.jsonld")
+        with open(new_schema_path, "w") as f:
+            json.dump(schema, f)
+
+        change_set = diff_schema_files(schema_path, new_schema_path)
+
+        assert change_set["nodes"] == {
+            "added": [],
+            "removed": [],
+            "changed": {"Sex": ["rangeIncludes"], "YearofBirth": ["validationRules"]},
+        }
+        assert change_set["edges"] == {
+            "rangeValue": {"added": [], "removed": [["Sex", "Other"]]}
+        }
+        assert change_set["valid_values"] == {"Sex": {"added": [], "removed": ["Other"]}}
+        assert change_set["validation_rules"] == {"YearofBirth": {"old": [], "new": ["int"]}}
+        # only the Patient component depends on Sex and YearofBirth
+        assert change_set["components"] == {"added": [], "removed": [], "affected": ["Patient"]}
+
+        # the change set is JSON serializable
+        assert json.loads(json.dumps(change_set)) == change_set
+
+    def test_diff_schemas(self, helpers):
+
+        snapshot = load_schema_snapshot(helpers.get_data_path("example.model.jsonld"))
+        se = snapshot.explorer()
+
+        unchanged = diff_schemas(se, snapshot.explorer())
+        assert not any(unchanged["nodes"].values())
+        assert not unchanged["edges"] and not unchanged["components"]["affected"]
+
+        class_info = se.generate_class_template()
+        class_info["@id"] = "bts:TestClass"
+        class_info["rdfs:label"] = "TestClass"
+        class_info["rdfs:subClassOf"] = [{"@id": "bts:Patient"}]
+        class_info["sms:requiresComponent"] = [{"@id": "bts:Biospecimen"}]
+        edited = snapshot.update_class(class_info)
+
+        change_set = diff_schemas(se, edited.explorer())
+
+        assert change_set["nodes"]["added"] == ["TestClass"]
+        assert change_set["edges"]["parentOf"]["added"] == [["Patient", "TestClass"]]
+        assert change_set["components"]["added"] == ["TestClass"]
+        assert change_set["components"]["affected"] == ["TestClass"]
@@ -1,7 +1,12 @@
 import logging
 import json
 import os
+import threading
+import urllib.error
 
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import networkx as nx
 import pandas as pd
 import numpy as np
 import pytest
@@ -13,6 +18,9 @@ from schematic.schemas import df_parser
 from schematic.utils import general
 from schematic.utils import cli_utils
 from schematic.utils import io_utils
+from schematic.utils import cache_utils
+from schematic.utils import compact_graph
+from schematic.utils import schema_utils
 from schematic.utils import df_utils
 from schematic.utils import validate_utils
 from schematic.exceptions import (
@@ -20,6 +28,7 @@ from schematic.exceptions import (
     MissingConfigAndArgumentValueError,
 )
 from schematic import LOADER
+from schematic.configuration import CONFIG
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -106,6 +115,7 @@ class FakeResponse:
 
     def __init__(self, *, data: bytes):
         self.data = data
+        self.headers = {}
 
     def __enter__(self):
         return self
@@ -121,6 +131,41 @@ class FakeResponse:
         pass
 
 
+class ModelRequestHandler(BaseHTTPRequestHandler):
+    """Serve the server's document, with its ETag, and answer conditional requests."""
+
+    def do_GET(self):
+        server = self.server
+        server.request_headers.append(dict(self.headers))
+
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", server.etag)
+        self.send_header("Cache-Control", "max-age=0")
+        self.end_headers()
+        self.wfile.write(server.document)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def model_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ModelRequestHandler)
+    server.document, server.etag, server.request_headers = b'{"@graph": []}', '"v1"', []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
 class TestIOUtils:
     def test_json_load(self, tmpdir):
 
@@ -185,6 +230,212 @@ class TestIOUtils:
         assert expected_graph_keys == actual_graph_keys
 
 
+class TestCacheUtils:
+    def test_get_cache_dir(self, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+
+        assert cache_utils.get_cache_dir() == str(tmp_path)
+        assert cache_utils.get_cache_dir("models") == os.path.join(str(tmp_path), "models")
+
+    def test_cached_object_roundtrip(self, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+
+        key = cache_utils.hash_bytes(b"content")
+
+        assert cache_utils.load_cached_object("objects", key) is None
+
+        cache_utils.store_cached_object("objects", key, {"k1": ["v1"]})
+        assert cache_utils.load_cached_object("objects", key) == {"k1": ["v1"]}
+
+        # unreadable entries are treated as cache misses
+        with open(os.path.join(str(tmp_path), "objects", f"{key}.pickle"), "wb") as f:
+            f.write(b"not a pickle")
+        assert cache_utils.load_cached_object("objects", key) is None
+
+        # entries of other users are not unpickled
+        cache_utils.store_cached_object("objects", key, {"k1": ["v1"]})
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(tmp_path).st_uid + 1)
+        assert cache_utils.load_cached_object("objects", key) is None
+
+    def test_cached_object_eviction(self, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+
+        for i, key in enumerate(["a", "b", "c"]):
+            cache_utils.store_cached_object("objects", key, b"x" * 1000)
+            os.utime(tmp_path / "objects" / f"{key}.pickle", (i, i))
+
+        # loading an object marks it as recently used
+        assert cache_utils.load_cached_object("objects", "a") is not None
+
+        # room for two of the objects
+        monkeypatch.setitem(CONFIG.DATA["model"], "cache", {"max_size": 2500 / (1 << 20)})
+        cache_utils.store_cached_object("objects", "d", b"x" * 1000)
+
+        assert sorted(os.listdir(tmp_path / "objects")) == ["a.pickle", "d.pickle"]
+
+    def test_compiled_model_cache(self, helpers, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+
+        se_parsed = SchemaExplorer()
+        se_parsed.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        with open(helpers.get_data_path("example.model.jsonld"), "rb") as f:
+            model_hash = cache_utils.hash_bytes(f.read())
+
+        assert [
+            entry
+            for entry in os.listdir(tmp_path / "compiled_models")
+            if entry.startswith(model_hash)
+        ]
+
+        se_cached = SchemaExplorer()
+        se_cached.load_schema(helpers.get_data_path("example.model.jsonld"))
+
+        assert se_cached.schema == se_parsed.schema
+        assert list(se_cached.get_nx_schema().edges(keys=True)) == list(
+            se_parsed.get_nx_schema().edges(keys=True)
+        )
+        assert se_cached.explore_class("Patient") == se_parsed.explore_class("Patient")
+
+    def test_persistent_lru_cache(self, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+
+        cache = cache_utils.PersistentLRUCache("lru", maxsize=1)
+        key_a = cache.make_key("model", "A")
+        key_b = cache.make_key("model", "B")
+
+        assert cache.get(key_a, lambda: "a") == "a"
+        assert cache.get(key_a, lambda: "not computed") == "a"
+        assert cache.get(key_b, lambda: "b") == "b"
+        assert cache.cache_info() == {
+            "hits": 1, "disk_hits": 0, "misses": 2, "size": 1, "maxsize": 1,
+        }
+
+        # evicted from memory, but still on disk
+        assert cache.get(key_a, lambda: "not computed") == "a"
+        assert cache.cache_info()["disk_hits"] == 1
+
+
+    def test_fetch_url(self, model_server, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+        url = f"http://127.0.0.1:{model_server.server_port}/example.model.jsonld"
+
+        path = cache_utils.fetch_url(url)
+        assert path.endswith(".jsonld")
+        assert io_utils.load_json(url) == {"@graph": []}
+        # the document is revalidated, rather than downloaded again
+        assert model_server.request_headers[-1]["If-None-Match"] == '"v1"'
+
+        # fresh documents are not requested
+        assert cache_utils.fetch_url(url, max_age=3600) == path
+        assert len(model_server.request_headers) == 2
+
+        model_server.document, model_server.etag = b'{"@graph": [{}]}', '"v2"'
+        assert io_utils.load_json(url) == {"@graph": [{}]}
+
+        # stale documents are used if the server cannot be reached
+        model_server.shutdown()
+        model_server.server_close()
+        assert cache_utils.fetch_url(url, timeout=1) == path
+
+        with pytest.raises(urllib.error.URLError):
+            cache_utils.fetch_url(url + "?v=2", timeout=1)
+
+    def test_fetch_url_json(self, model_server, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+        url = f"http://127.0.0.1:{model_server.server_port}/model.json"
+
+        # the cached document is not overwritten by its metadata
+        assert cache_utils.fetch_url(url).endswith(".json")
+        assert io_utils.load_json(url) == {"@graph": []}
+        assert len(model_server.request_headers) == 2
+
+    def test_fetch_url_unwritable_cache(self, model_server, monkeypatch, tmp_path):
+
+        monkeypatch.setenv("SCHEMATIC_CACHE_DIR", str(tmp_path))
+        url = f"http://127.0.0.1:{model_server.server_port}/example.model.jsonld"
+
+        def write_atomic(cache_path, write):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(cache_utils, "_write_atomic", write_atomic)
+
+        # the downloaded document is used, rather than downloaded again
+        assert io_utils.load_json(url) == {"@graph": []}
+        assert len(model_server.request_headers) == 1
+
+
+class TestCompactGraph:
+    def test_networkx_adapter(self, helpers):
+
+        schema = io_utils.load_json(helpers.get_data_path("example.model.jsonld"))
+        graph = schema_utils.load_schema_into_networkx(schema)
+
+        compact = compact_graph.CompactSchemaGraph.from_networkx(graph)
+        adapter = compact.to_networkx()
+
+        assert list(adapter.nodes(data=True)) == list(graph.nodes(data=True))
+        assert list(adapter.edges(keys=True)) == list(graph.edges(keys=True))
+        assert list(adapter.predecessors("Patient")) == list(graph.predecessors("Patient"))
+        assert "NotANode" not in adapter
+
+        # the adapter is read-only
+        with pytest.raises(nx.NetworkXError):
+            adapter.add_edge("Patient", "Sex", key="parentOf")
+        with pytest.raises(TypeError):
+            adapter.nodes["Patient"]["required"] = True
+        with pytest.raises(TypeError):
+            adapter["Patient"]["Sex"]["requiresDependency"]["weight"] = 1
+
+        # adjacency mappings are built once per node
+        assert compact.adjacency("Patient") is compact.adjacency("Patient")
+        assert compact.adjacency("Patient", "in") is compact.adjacency("Patient", "in")
+        assert nx.descendants(adapter, "Patient") == nx.descendants(graph, "Patient")
+
+        # a modifiable copy
+        graph_copy = nx.MultiDiGraph(adapter)
+        graph_copy.nodes["Patient"]["required"] = True
+        assert adapter.nodes["Patient"]["required"] == graph.nodes["Patient"]["required"]
+
+        assert compact.successors("Patient", "requiresDependency") == [
+            v for (u, v, key) in graph.out_edges("Patient", keys=True)
+            if key == "requiresDependency"
+        ]
+
+    def test_relationship_index(self, helpers):
+
+        schema = io_utils.load_json(helpers.get_data_path("example.model.jsonld"))
+        graph = schema_utils.load_schema_into_networkx(schema)
+
+        index = schema_utils.build_relationship_index(graph)
+        compact_index = schema_utils.build_relationship_index(
+            schema_utils.build_schema_graph(schema, compact=True)
+        )
+
+        assert list(compact_index) == list(index)
+
+        for relationship, rel_index in index.items():
+            compact_rel_index = compact_index[relationship]
+
+            assert list(compact_rel_index["digraph"].edges) == list(rel_index["digraph"].edges)
+            assert dict(compact_rel_index["successors"]) == rel_index["successors"]
+            assert dict(compact_rel_index["predecessors"]) == rel_index["predecessors"]
+
+        digraph = compact_index["parentOf"]["digraph"]
+        assert digraph.compact.descendants("Thing", "parentOf") == nx.descendants(
+            index["parentOf"]["digraph"], "Thing"
+        )
+        with pytest.raises(TypeError):
+            digraph.nodes["Thing"]["weight"] = 1
+
+
 class TestDfUtils:
     def test_update_df_col_present(self, helpers):
 
@@ -253,6 +504,36 @@ class TestDfUtils:
         actual_df = df_utils.update_df(input_df, updates_df, "entityId")
         pd.testing.assert_frame_equal(expected_df, actual_df)
 
+    def test_map_unique_values(self):
+        calls = []
+
+        def parse(value):
+            calls.append(value)
+            return len(value)
+
+        values = pd.Series(["ab", "c", "ab", "ab", "c"], index=[5, 6, 7, 8, 9], name="col")
+        mapped = df_utils.map_unique_values(values, parse)
+
+        pd.testing.assert_series_equal(mapped, values.map(len))
+        # each distinct value is parsed once
+        assert calls == ["ab", "c"]
+
+        # values of other types are mapped row by row, as 1, 1.0 and True are equal
+        values = pd.Series([1, 1.0, True], dtype=object)
+        assert df_utils.map_unique_values(values, str).tolist() == ["1", "1.0", "True"]
+
+    def test_iter_load_df(self, helpers):
+        manifest_path = helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv")
+
+        manifest = df_utils.load_df(manifest_path, preserve_raw_input=False, dtype="string")
+        chunks = list(
+            df_utils.iter_load_df(manifest_path, 2, preserve_raw_input=False, dtype="string")
+        )
+
+        assert [len(chunk) for chunk in chunks[:-1]] == [2] * (len(chunks) - 1)
+        # chunks keep the index of their rows in the manifest
+        assert_frame_equal(pd.concat(chunks), manifest, check_dtype=False)
+
 
 class TestValidateUtils:
     def test_validate_schema(self, helpers):
@@ -5,12 +5,22 @@ import jsonschema
 import pytest
 from pathlib import Path
 import itertools
+from urllib.error import URLError
+
+import numpy as np
+import pandas as pd
 
 from schematic.models.validate_attribute import ValidateAttribute, GenerateError
 from schematic.models.validate_manifest import ValidateManifest
+from schematic.models.validation_plan import UNIMPLEMENTED_EXPECTATIONS, get_attribute_plan
+from schematic.models.GE_Helpers import GreatExpectationsHelpers
+from schematic.models.native_expectations import NativeExpectationsHelpers
+from schematic.models.columnar_schema import ColumnarSchemaValidator, is_columnar_schema, iter_row_errors
 from schematic.models.metadata import MetadataModel
+from schematic.configuration import CONFIG
 from schematic.store.synapse import SynapseStorage
 from schematic.schemas.generator import SchemaGenerator
+from schematic.schemas.snapshot import SchemaSnapshot
 from schematic.utils.validate_rules_utils import validation_rule_info
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -394,4 +404,546 @@ class TestManifestValidation:
 
 
         
-        
\ No newline at end of file
+        
+
+
+class TestValidateAttribute:
+    def _error_rows(self, errors, warnings):
+        return [(error[0], error[3]) for error in errors + warnings]
+
+    def test_type_validation(self, sg):
+
+        va = ValidateManifest(errors=[], manifest=None, manifestPath=None, sg=sg, jsonSchema=None)
+
+        col = pd.Series([1, "a", 2.5, "", np.nan, 0, True], name="Check Int")
+        errors, warnings = ValidateAttribute.type_validation(va, "int", col, sg)
+        # empty and falsy values are not checked, NaN is
+        assert self._error_rows(errors, warnings) == [("3", "a"), ("4", "2.5"), ("6", "nan")]
+
+        # columns with a numeric dtype are checked at once
+        col = pd.Series([1.5, 0.0, np.nan], name="Check Int")
+        errors, warnings = ValidateAttribute.type_validation(va, "int", col, sg)
+        assert self._error_rows(errors, warnings) == [("2", "1.5"), ("4", "nan")]
+
+        errors, warnings = ValidateAttribute.type_validation(va, "num", col.rename("Check Num"), sg)
+        assert errors == warnings == []
+
+    def test_regex_validation(self, sg):
+
+        va = ValidateManifest(errors=[], manifest=None, manifestPath=None, sg=sg, jsonSchema=None)
+
+        col = pd.Series(["abc", "xyz", "", "xa", 1], name="Check Regex Single")
+        errors, warnings = ValidateAttribute.regex_validation(va, "regex search [a-f]", col, sg)
+        assert self._error_rows(errors, warnings) == [("3", "xyz"), ("6", "1")]
+
+        errors, warnings = ValidateAttribute.regex_validation(va, "regex match [a-f]", col, sg)
+        assert self._error_rows(errors, warnings) == [("3", "xyz"), ("5", "xa"), ("6", "1")]
+
+        # each value of a list is validated
+        col = pd.Series(["a,b", "a,x,y", "c"], name="Check Regex List")
+        errors, warnings = ValidateAttribute.regex_validation(va, "regex match [a-f]", col, sg)
+        assert self._error_rows(errors, warnings) == [
+            ("3", ["a", "x", "y"]), ("3", ["a", "x", "y"])
+        ]
+
+    def test_list_validation(self, sg):
+
+        va = ValidateManifest(errors=[], manifest=None, manifestPath=None, sg=sg, jsonSchema=None)
+
+        col = pd.Series(["a,b", "a", "a, b,", np.nan], name="Check List")
+        errors, warnings, list_col = ValidateAttribute.list_validation(va, "list strict", col, sg)
+
+        assert self._error_rows(errors, warnings) == [("3", "a"), ("5", "nan")]
+        assert list_col.tolist() == [["a", "b"], ["a"], ["a", "b", ""], ["nan"]]
+
+        errors, warnings, _ = ValidateAttribute.list_validation(va, "list like", col, sg)
+        assert errors == warnings == []
+
+    def test_url_validation(self, sg, monkeypatch):
+
+        va = ValidateManifest(errors=[], manifest=None, manifestPath=None, sg=sg, jsonSchema=None)
+
+        requested = []
+
+        def urlopen(request):
+            requested.append(request.full_url)
+            if "broken" in request.full_url:
+                raise URLError("not found")
+
+        monkeypatch.setattr("schematic.models.validate_attribute.urlopen", urlopen)
+
+        col = pd.Series(
+            ["https://a.org", "https://broken.org", "https://a.org", "text", "https://broken.org"],
+            name="Check URL",
+        )
+        errors, warnings = ValidateAttribute.url_validation(va, "url", col, sg)
+
+        assert [error[0] for error in errors + warnings] == ["3", "5", "6"]
+        # each distinct URL is requested once
+        assert requested == ["https://a.org", "https://broken.org"]
+
+
+class TestValidationPlan:
+    def test_attribute_plan(self, sg):
+
+        plan = get_attribute_plan(sg, "Check Regex List")
+        assert plan.validation_rules == ["list strict", "regex match [a-f]"]
+        assert [rule_plan.kind for rule_plan in plan.rules] == ["list", "regex"]
+
+        regex_plan = plan.rules[1]
+        assert regex_plan.method == "regex_validation"
+        assert regex_plan.args == ["match", "[a-f]"]
+        assert regex_plan.pattern.pattern == "[a-f]"
+        assert regex_plan.engine(restrict_rules=False) == regex_plan.engine(restrict_rules=True) == "in_house"
+
+        range_plan = get_attribute_plan(sg, "Check Range").rules[0]
+        assert range_plan.args == ["50", "100", "error"]
+        assert range_plan.engine(restrict_rules=False) == "ge"
+        assert range_plan.engine(restrict_rules=True) is None
+
+        num_plan = get_attribute_plan(sg, "Check Num").rules[0]
+        assert num_plan.engine(restrict_rules=False) == "ge"
+        assert num_plan.engine(restrict_rules=True) == "in_house"
+
+        # columns that are not in the data model have no rules
+        assert get_attribute_plan(sg, "Not An Attribute").rules == []
+
+    @pytest.mark.parametrize(
+        "attribute, rule, level",
+        [
+            ("Check Num", "num", "error"),
+            ("Check Num", "num warning", "warning"),
+            ("Check Num", "schema", "error"),
+            ("Check Recommended", "recommended", "warning"),
+            ("Check Match at Least", "matchAtLeastOne Patient.PatientID set", "warning"),
+            ("Check Ages", "protectAges", "warning"),
+        ],
+    )
+    def test_message_level(self, sg, attribute, rule, level):
+
+        assert GenerateError.get_message_level(sg, attribute, rule) == level
+
+    def test_plan_cache(self, helpers, sg):
+
+        plan = get_attribute_plan(sg, "Check Num")
+
+        # plans are shared by generators of the same data model
+        other_sg = SchemaGenerator(helpers.get_data_path("example.model.jsonld"))
+        assert get_attribute_plan(other_sg, "Check Num") is plan
+
+        # and compiled again once the data model is edited
+        snapshot_sg = SchemaSnapshot.from_explorer(sg.se).generator()
+        assert get_attribute_plan(snapshot_sg, "Check Num") is plan
+
+        check_num = next(
+            record for record in snapshot_sg.se.schema["@graph"] if record["@id"] == "bts:CheckNum"
+        )
+        snapshot_sg.se.edit_schema_object_nx({**check_num, "sms:validationRules": ["int"]})
+        edited_plan = get_attribute_plan(snapshot_sg, "Check Num")
+        assert edited_plan is not plan
+        assert edited_plan.validation_rules == ["int"]
+
+
+class TestValidationContext:
+    def test_repeat_validation(self, helpers, sg):
+
+        def run_checkpoint(manifest):
+            ge_helpers = GreatExpectationsHelpers(
+                sg=sg,
+                unimplemented_expectations=UNIMPLEMENTED_EXPECTATIONS,
+                manifest=manifest,
+                manifestPath=None,
+            )
+            ge_helpers.build_context()
+            ge_helpers.build_expectation_suite()
+            results = ge_helpers.run_checkpoint().list_validation_results()
+            successes = [
+                (result.expectation_config.kwargs["column"], result.success)
+                for validation_result in results
+                for result in validation_result.results
+            ]
+            return ge_helpers, successes
+
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent"] * 2,
+                "Check Num": [1, "a"],
+                "Check Unique": ["a", "a"],
+                "Check Range": [60, 90],
+            }
+        )
+        first_helpers, first_successes = run_checkpoint(manifest)
+        assert sorted(first_successes) == [
+            ("Check Num", False), ("Check Range", True), ("Check Unique", False)
+        ]
+
+        # the context and suite are reused by the next validations of the same data model and columns
+        ge_helpers, successes = run_checkpoint(manifest.assign(**{"Check Unique": ["a", "b"]}))
+        assert ge_helpers.context is first_helpers.context
+        assert ge_helpers.suite is first_helpers.suite
+        assert sorted(successes) == [
+            ("Check Num", False), ("Check Range", True), ("Check Unique", True)
+        ]
+
+        # while other columns get a suite of their own
+        ge_helpers, successes = run_checkpoint(manifest[["Component", "Check Num"]])
+        assert ge_helpers.suite is not first_helpers.suite
+        assert successes == [("Check Num", False)]
+
+        # and neither suites nor validation results are stored to disk
+        assert not ge_helpers.data_docs
+        assert ge_helpers.context.validations_store.list_keys() == []
+
+    @staticmethod
+    def build_suite(sg, manifest):
+        ge_helpers = GreatExpectationsHelpers(
+            sg=sg,
+            unimplemented_expectations=UNIMPLEMENTED_EXPECTATIONS,
+            manifest=manifest,
+            manifestPath=None,
+        )
+        ge_helpers.build_context()
+        ge_helpers.build_expectation_suite()
+        return ge_helpers
+
+    @staticmethod
+    def successes(ge_helpers):
+        return [
+            (result.expectation_config.kwargs["column"], result.success)
+            for validation_result in ge_helpers.run_checkpoint().list_validation_results()
+            for result in validation_result.results
+        ]
+
+    def test_uncached_suites(self, sg):
+        # suites of edited data models, which have no content hash, are not cached
+        snapshot_sg = SchemaSnapshot.from_explorer(sg.se).generator()
+        check_num = next(
+            record for record in snapshot_sg.se.schema["@graph"] if record["@id"] == "bts:CheckNum"
+        )
+        snapshot_sg.se.edit_schema_object_nx({**check_num, "sms:validationRules": ["int"]})
+
+        num_helpers = self.build_suite(snapshot_sg, pd.DataFrame({"Check Num": [1, 2.5]}))
+        range_helpers = self.build_suite(snapshot_sg, pd.DataFrame({"Check Range": [60, 90]}))
+        assert num_helpers.suite_key is None
+        assert num_helpers.suite.expectation_suite_name != range_helpers.suite.expectation_suite_name
+
+        # each manifest is validated against its own suite, which is deleted after the run
+        assert self.successes(num_helpers) == [("Check Num", False)]
+        assert self.successes(range_helpers) == [("Check Range", True)]
+        suite_names = num_helpers.context.list_expectation_suite_names()
+        assert num_helpers.suite.expectation_suite_name not in suite_names
+        assert range_helpers.suite.expectation_suite_name not in suite_names
+
+    def test_dropped_suites(self, sg, monkeypatch):
+        monkeypatch.setattr("schematic.models.GE_Helpers.max_cached_suites", 1)
+
+        num_helpers = self.build_suite(sg, pd.DataFrame({"Check Num": [1, "a"]}))
+        # drops the suite of num_helpers from the cache before it is run
+        range_helpers = self.build_suite(sg, pd.DataFrame({"Check Range": [60, 90]}))
+        suite_names = num_helpers.context.list_expectation_suite_names()
+        assert num_helpers.suite.expectation_suite_name not in suite_names
+
+        assert self.successes(num_helpers) == [("Check Num", False)]
+        assert self.successes(range_helpers) == [("Check Range", True)]
+        suite_names = num_helpers.context.list_expectation_suite_names()
+        assert num_helpers.suite.expectation_suite_name not in suite_names
+        assert range_helpers.suite.expectation_suite_name in suite_names
+
+
+class TestNativeExpectations:
+    @staticmethod
+    def validate(helpers_class, sg, manifest, manifest_path):
+        ge_helpers = helpers_class(
+            sg=sg,
+            unimplemented_expectations=UNIMPLEMENTED_EXPECTATIONS,
+            manifest=manifest,
+            manifestPath=str(manifest_path),
+        )
+        if helpers_class is NativeExpectationsHelpers:
+            validation_results = ge_helpers.validate_expectations()
+        else:
+            ge_helpers.build_context()
+            ge_helpers.build_expectation_suite()
+            validation_results = ge_helpers.run_checkpoint().list_validation_results()
+
+        errors, warnings = ge_helpers.generate_errors(
+            errors=[],
+            warnings=[],
+            validation_results=validation_results,
+            validation_types=validation_rule_info(),
+            sg=sg,
+        )
+        return errors, warnings, ge_helpers.manifest
+
+    def assert_parity(self, sg, manifest, tmp_path):
+        ge_errors, ge_warnings, ge_manifest = self.validate(
+            GreatExpectationsHelpers, sg, manifest.copy(), tmp_path / "ge.csv"
+        )
+        errors, warnings, native_manifest = self.validate(
+            NativeExpectationsHelpers, sg, manifest.copy(), tmp_path / "native.csv"
+        )
+
+        assert errors == ge_errors
+        assert warnings == ge_warnings
+        # including censored ages
+        pd.testing.assert_frame_equal(native_manifest, ge_manifest)
+
+        return errors, warnings
+
+    @pytest.mark.parametrize(
+        "manifest_name", ["Valid_Test_Manifest.csv", "Invalid_Test_Manifest.csv", "Rule_Combo_Manifest.csv"]
+    )
+    def test_mock_manifests(self, helpers, sg, manifest_name, tmp_path):
+        manifest = helpers.get_data_frame(
+            "mock_manifests", manifest_name, preserve_raw_input=False, dtype="string"
+        )
+
+        errors, warnings = self.assert_parity(sg, manifest, tmp_path)
+
+        if manifest_name == "Invalid_Test_Manifest.csv":
+            assert errors and warnings
+
+    def test_mixed_values(self, sg, tmp_path):
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent"] * 4,
+                "Check Num": [1, 2.5, "a", ""],
+                "Check Float": [np.int64(1), 2.5, True, None],
+                "Check Int": pd.Series([1.5, 2.0, 3.0, 4.0]),
+                "Check String": pd.Series([1, 2, 3, 4]),
+                "Check Recommended": ["", "\n", np.nan, ""],
+                "Check Ages": [6549, 7000.0, np.nan, 40000],
+                "Check Unique": [1, 1.0, "a", "a"],
+                "Check Range": pd.Series([40.0, 60.0, np.nan, 101.0]),
+            }
+        )
+
+        errors, warnings = self.assert_parity(sg, manifest, tmp_path)
+
+        # columns that are not of object dtype are type checked by their dtype, all their rows being reported
+        assert [error[1] for error in errors] == (
+            ["Check Num"] * 2 + ["Check Float"] * 2 + ["Check Int"] * 4 + ["Check String"] * 4
+            + ["Check Unique", "Check Range"]
+        )
+        assert warnings[0][1] == "Column Check Recommended is recommended but empty."
+        assert warnings[1][:2] == [[2, 5], "Check Ages"]
+
+    def test_validation_engine(self, helpers, sg, monkeypatch):
+        manifest = helpers.get_data_frame(
+            "mock_manifests", "Rule_Combo_Manifest.csv", preserve_raw_input=False, dtype="string"
+        )
+        manifest = manifest[["Component", "Check Num", "Check Ages", "Check Unique", "Check Range"]]
+        vm = ValidateManifest(errors=[], manifest=manifest, manifestPath=None, sg=sg, jsonSchema=None)
+
+        ge_results = vm.validate_manifest_rules(manifest.copy(), sg, restrict_rules=False, project_scope=None)
+
+        monkeypatch.setitem(CONFIG.DATA, "validation", {"engine": "native"})
+        monkeypatch.setattr(GreatExpectationsHelpers, "build_context", None)
+        native_results = vm.validate_manifest_rules(manifest.copy(), sg, restrict_rules=False, project_scope=None)
+
+        assert native_results[1:] == ge_results[1:]
+
+        monkeypatch.setitem(CONFIG.DATA, "validation", {"engine": "pandas"})
+        with pytest.raises(ValueError, match="Unknown validation engine"):
+            vm.validate_manifest_rules(manifest.copy(), sg, restrict_rules=False, project_scope=None)
+
+
+class TestParallelValidation:
+    def test_validate_manifest_rules(self, sg, monkeypatch, caplog):
+
+        n_rows = 500
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent"] * n_rows,
+                "Check List": ["ab,cd", "ab"] * (n_rows // 2),
+                "Check Regex List": ["a,b", "a,x"] * (n_rows // 2),
+                "Check Regex Single": ["abc", "xyz"] * (n_rows // 2),
+                "Check Num": [1, "a"] * (n_rows // 2),
+                "Check Int": [1, 2.5] * (n_rows // 2),
+                "Check String": ["a", 1] * (n_rows // 2),
+            }
+        )
+
+        vm = ValidateManifest(errors=[], manifest=manifest, manifestPath=None, sg=sg, jsonSchema=None)
+        serial_manifest, serial_errors, serial_warnings = vm.validate_manifest_rules(
+            manifest.copy(), sg, restrict_rules=True, project_scope=None
+        )
+
+        # validate in worker processes whatever the size of the manifest
+        monkeypatch.setattr("schematic.models.validate_manifest.min_parallel_cells", 0)
+        with caplog.at_level(logging.INFO, logger="schematic.models.validate_manifest"):
+            parallel_manifest, parallel_errors, parallel_warnings = vm.validate_manifest_rules(
+                manifest.copy(), sg, restrict_rules=True, project_scope=None, workers=2
+            )
+        assert "with 2 worker processes" in caplog.text
+
+        assert serial_errors
+        assert parallel_errors == serial_errors
+        assert parallel_warnings == serial_warnings
+        pd.testing.assert_frame_equal(parallel_manifest, serial_manifest)
+
+
+class TestStreamingValidation:
+    def test_iter_validate_model_manifest(self, helpers, sg, metadataModel, tmp_path):
+        n_rows = 7
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent"] * n_rows,
+                "Check List": ["ab,cd", "ab", "ab", "ab", "ab", "ab", "ab"],
+                "Check Regex Single": ["abc", "xyz", "abc", "abc", "xyz", "abc", "abc"],
+                "Check Num": [1, "a", 2, 3, 4, "b", 5],
+                # duplicated values across chunks
+                "Check Unique": ["str1", "str2", "str3", "str1", "str4", "str2", "str1"],
+                "Check Recommended": [""] * n_rows,
+            }
+        )
+        manifest_path = tmp_path / "manifest.csv"
+        manifest.to_csv(manifest_path, index=False)
+
+        errors, warnings = metadataModel.validateModelManifest(
+            manifestPath=str(manifest_path), rootNode="MockComponent", restrict_rules=True,
+        )
+
+        streamed_errors = []
+        streamed_warnings = []
+        for chunk_errors, chunk_warnings in metadataModel.iterValidateModelManifest(
+            manifestPath=str(manifest_path), rootNode="MockComponent", chunksize=3,
+        ):
+            streamed_errors.extend(chunk_errors)
+            streamed_warnings.extend(chunk_warnings)
+
+        # rules validated over whole columns are validated by the stream, unlike with restrict_rules
+        unique_error = GenerateError.generate_content_error(
+            val_rule="unique error",
+            attribute_name="Check Unique",
+            sg=sg,
+            row_num=[2, 3, 5, 7, 8],
+            error_val=["str1", "str2", "str1", "str2", "str1"],
+        )[0]
+        recommended_warning = GenerateError.generate_content_error(
+            val_rule="recommended", attribute_name="Check Recommended", sg=sg,
+        )[1]
+
+        assert errors
+        assert sorted(map(str, streamed_errors)) == sorted(map(str, errors + [unique_error]))
+        assert sorted(map(str, streamed_warnings)) == sorted(map(str, warnings + [recommended_warning]))
+
+    def test_component_mismatch(self, metadataModel, tmp_path):
+        manifest = pd.DataFrame(
+            {
+                "Component": ["MockComponent", "MockComponent", "Patient", "MockComponent", "Patient"],
+                "Check Num": [1, 2, 3, 4, 5],
+            }
+        )
+        manifest_path = tmp_path / "manifest.csv"
+        manifest.to_csv(manifest_path, index=False)
+
+        errors, warnings = metadataModel.validateModelManifest(
+            manifestPath=str(manifest_path), rootNode="MockComponent",
+        )
+        streamed = list(
+            metadataModel.iterValidateModelManifest(
+                manifestPath=str(manifest_path), rootNode="MockComponent", chunksize=2,
+            )
+        )
+
+        # once a chunk has mismatched components, only component errors are reported
+        assert [row[0] for row in errors] == [4, 6]
+        assert streamed[0][0] == []
+        assert streamed[1:] == [(errors[:1], []), (errors[1:], [])]
+
+
+class TestColumnarSchema:
+    def test_iter_errors(self, sg):
+        json_schema = sg._build_json_schema("Patient", "Patient_validation")
+        assert is_columnar_schema(json_schema)
+
+        manifest = pd.DataFrame(
+            {
+                "Patient ID": ["p1", "", "p3", np.nan, "p5"],
+                "Sex": ["Female", "Male", "Unknown", "Other", np.nan],
+                "Diagnosis": ["Healthy", "Cancer", "Cancer", "Cancer", "Healthy"],
+                "Component": ["Patient"] * 5,
+                "Cancer Type": ["", "Lung", "", "Skin", "Breast"],
+                "Family History": [[""], ["Lung", "Skin"], ["Lung", "Liver"], "Skin", ["Breast"] * 6],
+                "Extra": [1, 2, 3, 4, pd.Timestamp("2022-01-03")],
+            }
+        )
+
+        def error_records(errors):
+            # the instance of errors for missing properties is not reported, see validate_manifest_values
+            return [
+                (row, list(error.path), error.message, error.instance if error.path else None)
+                for row, error in errors
+            ]
+
+        row_errors = error_records(iter_row_errors(manifest, json_schema))
+        assert len(row_errors) > 5
+        assert error_records(ColumnarSchemaValidator(json_schema).iter_errors(manifest)) == row_errors
+
+        # missing required properties
+        manifest = manifest.drop(columns=["Sex", "Family History"])
+        assert error_records(ColumnarSchemaValidator(json_schema).iter_errors(manifest)) == error_records(
+            iter_row_errors(manifest, json_schema)
+        )
+
+    @pytest.mark.parametrize("trigger_required", [True, False])
+    def test_conditionals(self, sg, trigger_required):
+        json_schema = sg._build_json_schema("Patient", "Patient_validation")
+        for conditional in json_schema["allOf"]:
+            if not trigger_required:
+                del conditional["if"]["required"]
+
+        validator = ColumnarSchemaValidator(json_schema)
+        # both conditionals are triggered by a cancer diagnosis
+        assert list(validator._conditionals) == [("Diagnosis", ("Cancer",), trigger_required)]
+
+        manifest = pd.DataFrame(
+            {
+                "Patient ID": ["p1", "p2", "p3"],
+                "Sex": ["Female", "Male", "Other"],
+                "Diagnosis": ["Cancer", "Healthy", "Cancer"],
+                "Cancer Type": ["", "", "Lung"],
+            }
+        )
+        for trigger_manifest in [manifest, manifest.drop(columns=["Diagnosis"])]:
+            row_errors = [
+                (row, list(error.path), error.message) for row, error in iter_row_errors(trigger_manifest, json_schema)
+            ]
+            assert [
+                (row, list(error.path), error.message) for row, error in validator.iter_errors(trigger_manifest)
+            ] == row_errors
+
+    @pytest.mark.parametrize(
+        "json_schema",
+        [
+            {"properties": {"Patient ID": {"pattern": "^p"}}},
+            {"properties": {"Sex": {"enum": [1, 2]}}},
+            {"allOf": [{"if": {"properties": {}}, "then": {"properties": {}}, "else": {"required": ["Sex"]}}]},
+            {"type": "array"},
+        ],
+    )
+    def test_unsupported_schema(self, json_schema):
+        assert not is_columnar_schema(json_schema)
+
+    def test_validate_manifest_values(self, sg):
+        manifest = pd.DataFrame(
+            {
+                "Patient ID": ["p1", "p2"],
+                "Sex": ["Female", "Unknown"],
+                "Diagnosis": ["Cancer", "Healthy"],
+                "Cancer Type": ["", ""],
+            }
+        )
+        vm = ValidateManifest(errors=[], manifest=manifest, manifestPath=None, sg=sg, jsonSchema=None)
+
+        json_schema = sg._build_json_schema("Patient", "Patient_validation")
+        errors, warnings = vm.validate_manifest_values(manifest.copy(), json_schema, sg)
+
+        # schemas with other constructs are validated row by row
+        json_schema["properties"]["Patient ID"]["pattern"] = "^p"
+        assert vm.validate_manifest_values(manifest.copy(), json_schema, sg) == (errors, warnings)
+
+        assert [error[:2] for error in errors] == [[2, "Cancer Type"], [3, "Sex"]]
+        # Family History is required for cancer patients
+        assert [warning[:2] for warning in warnings] == [[2, "Wrong schema"]]